@@ -0,0 +1,168 @@
+"""Benchmark data generation, aggregation, prompt building and page reruns.
+
+    python src/benchmarks.py --save .etsm_cache/benchmarks.json   # baseline
+    python src/benchmarks.py --compare .etsm_cache/benchmarks.json --threshold 20
+
+With ``--compare`` the exit status is 1 when any case is more than
+``--threshold`` percent slower than the baseline.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from etsm.benchmark import compare, load_results, run_cases, save_results
+from etsm.data import (
+    generate_api_usage_data,
+    generate_strategy_data,
+    generate_synthetic_strategies,
+    generate_synthetic_usage,
+)
+from etsm.forecast import UsageForecaster
+from etsm.health import account_health, usage_matrix
+from etsm.loadtest import isolated_environ
+from etsm.metrics import classify_health, compute_account_metrics
+from etsm.pages import PAGES
+from etsm.prompts import build_account_prompts, build_portfolio_context
+from etsm.rollups import RollupStore
+from etsm.strategies import StrategyStore
+
+SCALES = [100, 1_000, 10_000]
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.py")
+
+
+def usage(n_companies):
+    return lambda: (generate_synthetic_usage(n_companies, seed=0),)
+
+
+def metrics(n_companies):
+    return lambda: (compute_account_metrics(usage(n_companies)()[0]),)
+
+
+def forecast(usage_df):
+    forecaster = UsageForecaster()
+    forecaster.refresh(*usage_matrix(usage_df))
+    return forecaster.forecast()
+
+
+def strategy_store(n_strategies):
+    def setup():
+        store = StrategyStore(":memory:")
+        store.insert_frame(generate_synthetic_strategies(n_strategies, seed=0))
+        return (store,)
+
+    return setup
+
+
+def page_rerun(page):
+    """An AppTest already showing ``page``, so the case times one rerun"""
+
+    def setup():
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(DASHBOARD, default_timeout=120)
+        at.run()
+        at.sidebar.selectbox[0].select(page).run()
+        return (at,)
+
+    return setup
+
+
+def build_cases():
+    cases = {
+        "data.api_usage": (tuple, lambda: generate_api_usage_data(seed=0)),
+        "data.strategies": (tuple, generate_strategy_data),
+    }
+    for n in SCALES:
+        cases[f"data.synthetic_usage[{n}]"] = (
+            tuple,
+            lambda n=n: generate_synthetic_usage(n, seed=0),
+        )
+        cases[f"data.synthetic_strategies[{n * 5}]"] = (
+            tuple,
+            lambda n=n: generate_synthetic_strategies(n * 5, seed=0),
+        )
+    for n in SCALES:
+        cases[f"aggregate.account_metrics[{n}]"] = (usage(n), compute_account_metrics)
+        cases[f"aggregate.rollups[{n}]"] = (usage(n), RollupStore.from_frame)
+        cases[f"aggregate.health[{n}]"] = (metrics(n), classify_health)
+        cases[f"aggregate.account_health[{n}]"] = (usage(n), account_health)
+        cases[f"aggregate.forecast[{n}]"] = (usage(n), forecast)
+    for n in SCALES[:2]:
+        cases[f"prompt.portfolio_context[{n}]"] = (metrics(n), build_portfolio_context)
+        cases[f"prompt.account_prompts[{n}]"] = (usage(n), build_account_prompts)
+    for n in SCALES:
+        filters = {"Status": ["In Progress"], "Priority": ["High", "Critical"]}
+        cases[f"strategies.query[{n * 5}]"] = (
+            strategy_store(n * 5),
+            lambda store: store.query(filters, "company 1", page=3),
+        )
+        cases[f"strategies.totals[{n * 5}]"] = (
+            strategy_store(n * 5),
+            lambda store: store.totals(filters),
+        )
+    for page, module in PAGES.items():
+        cases[f"page.{module}"] = (page_rerun(page), lambda at: at.run())
+    return cases
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Percent slowdown that counts as a regression",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="selected", help="Only run cases containing this")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def report(name, stats):
+        print(f"{name:<40} {stats['median'] * 1000:>10.3f} ms")
+
+    # Page cases run against seeded mock data and throwaway stores, so local
+    # caches, insights and strategy edits never leak into the timings
+    saved = dict(os.environ)
+    with tempfile.TemporaryDirectory(prefix="etsm-bench-") as directory:
+        os.environ.update(isolated_environ(directory))
+        os.environ.setdefault("ETSM_MOCK_SEED", "0")
+        os.environ["ETSM_REFRESH_SECONDS"] = "0"
+        try:
+            results = run_cases(
+                build_cases(), repeat=args.repeat, selected=args.selected, report=report
+            )
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+    if args.save:
+        save_results(args.save, results)
+        print(f"Saved {len(results)} results to {args.save}")
+    if not args.compare:
+        return 0
+
+    rows = compare(load_results(args.compare), results, args.threshold)
+    print()
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['name']:<40} {row['baseline'] * 1000:>10.3f} -> "
+            f"{row['current'] * 1000:>10.3f} ms ({row['change']:+.1f}%){flag}"
+        )
+    regressions = [row for row in rows if row["regressed"]]
+    print(
+        f"{len(regressions)} of {len(rows)} cases more than "
+        f"{args.threshold:g}% slower than {args.compare}"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
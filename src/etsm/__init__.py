@@ -0,0 +1 @@
+"""Library code behind the ETSM dashboard."""
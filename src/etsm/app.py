@@ -0,0 +1,79 @@
+"""Streamlit app: page chrome, navigation and page dispatch."""
+
+import os
+
+import streamlit as st
+from dotenv import load_dotenv
+
+from etsm.pages import PAGES, render_page
+from etsm.telemetry import TELEMETRY
+from etsm.ui import (
+    get_dataset_cache,
+    get_refresher,
+    get_strategy_source,
+    render_footer,
+    render_data_status,
+    render_header,
+    render_performance_panel,
+    render_styles,
+)
+
+
+def main():
+    # Load environment variables
+    load_dotenv()
+
+    # Page configuration
+    st.set_page_config(
+        page_title="ETSM Dashboard",
+        page_icon="🤖",
+        layout="wide",
+        initial_sidebar_state="expanded",
+        menu_items={
+            "Get Help": None,
+            "Report a bug": None,
+            "About": "Enterprise Technical Success Manager Dashboard - Powered by Anthropic",
+        },
+    )
+
+    render_styles()
+    render_header()
+
+    # Check for API key (only show error if missing, not success message)
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        st.error(
+            "⚠️ **API Key Missing!** Please create a `.env` file in the project root with your Anthropic API key:"
+        )
+        st.code("ANTHROPIC_API_KEY=your_api_key_here")
+        st.info("Get your API key from: https://console.anthropic.com/")
+
+    # Sidebar navigation
+    st.sidebar.title("Menu")
+    page = st.sidebar.selectbox("Select Dashboard:", list(PAGES))
+
+    if st.sidebar.button("🔄 Reload data", help="Reload sources in the background"):
+        get_dataset_cache().invalidate()
+        get_strategy_source.clear()
+        get_refresher().reload()
+        st.rerun()
+
+    with TELEMETRY.timer("etsm_page_seconds", page=page):
+        render_page(page, api_key)
+
+    render_data_status(get_refresher())
+
+    data_cache_stats = get_dataset_cache().stats()
+    st.sidebar.caption(
+        f"Data cache: {data_cache_stats['entries']} entries, "
+        f"{data_cache_stats['size_bytes'] / 2**20:.1f} of "
+        f"{data_cache_stats['max_bytes'] / 2**20:.0f} MB"
+    )
+
+    render_footer()
+
+    if os.getenv("ETSM_ADMIN"):
+        render_performance_panel()
+    metrics_file = os.getenv("ETSM_METRICS_FILE")
+    if metrics_file:
+        TELEMETRY.write_prometheus(metrics_file)
@@ -0,0 +1,119 @@
+"""Concurrent, rate-limited fan-out of Claude requests."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from etsm.client import DEFAULT_MODEL
+from etsm.prompts import estimate_tokens
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``per_minute``/min"""
+
+    def __init__(self, per_minute, clock=time.monotonic, sleep=time.sleep):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, amount=1):
+        """Block until ``amount`` tokens are available, then take them"""
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            self._sleep(wait)
+
+    def refund(self, amount):
+        """Return tokens that were reserved but not used"""
+        if amount <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits applied together"""
+
+    def __init__(self, requests_per_minute=50, tokens_per_minute=40000):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def acquire(self, tokens):
+        self.requests.acquire(1)
+        self.tokens.acquire(tokens)
+
+
+def run_batch(
+    client,
+    prompts,
+    model=DEFAULT_MODEL,
+    max_tokens=400,
+    max_workers=8,
+    limiter=None,
+    use_cache=True,
+):
+    """Run ``{key: prompt}`` concurrently, yielding (key, result) as each finishes.
+
+    At most ``max_workers`` requests are in flight. Responses already in the
+    client's cache are returned without touching the limiter; every other
+    request reserves its estimated input tokens plus ``max_tokens`` and
+    refunds whatever the response did not use.
+    """
+    limiter = limiter or RateLimiter()
+    cached_result = getattr(client, "cached_result", None)
+
+    def task(prompt):
+        lookup = use_cache and cached_result is not None
+        if lookup:
+            result = cached_result(prompt, model=model, max_tokens=max_tokens)
+            if result is not None:
+                return result
+        reserved = estimate_tokens(prompt) + max_tokens
+        limiter.acquire(reserved)
+        if lookup:
+            # Cached by a concurrent caller while this one waited; the miss
+            # above is already counted
+            result = cached_result(
+                prompt, model=model, max_tokens=max_tokens, count=False
+            )
+        else:
+            result = None
+        if result is None:
+            result = client.create_message(
+                prompt,
+                model=model,
+                max_tokens=max_tokens,
+                use_cache=use_cache and not lookup,
+            )
+        if result.cached:
+            limiter.requests.refund(1)
+            limiter.tokens.refund(reserved)
+        elif result.usage:
+            limiter.tokens.refund(reserved - result.input_tokens - result.output_tokens)
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(task, prompt): key for key, prompt in prompts.items()}
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # A rerun that abandons the sweep must not leave queued calls behind
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,89 @@
+"""Minimal benchmark harness: timing, JSON baselines and regression checks."""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Time ``func`` and return per-call statistics in seconds.
+
+    Like ``timeit``, fast calls are looped until one round takes at least
+    ``min_time`` so timer resolution does not dominate; ``repeat`` rounds are
+    recorded.
+    """
+    func()  # warm-up: imports, caches, lazy initialisation
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+    rounds = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.fmean(rounds),
+        "rounds": len(rounds),
+        "number": number,
+    }
+
+
+def run_cases(cases, repeat=5, min_time=0.2, selected=None, report=None):
+    """Measure every ``{name: (setup, func)}`` case whose name contains
+    ``selected``; ``setup()`` returns the arguments passed to ``func``"""
+    results = {}
+    for name, (setup, func) in cases.items():
+        if selected and selected not in name:
+            continue
+        args = setup()
+        results[name] = measure(lambda: func(*args), repeat, min_time)
+        if report:
+            report(name, results[name])
+    return results
+
+
+def save_results(path, results):
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, current, threshold=20.0, stat="median"):
+    """Rows for cases present in both runs, flagged when slower than
+    ``threshold`` percent"""
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        before, after = baseline[name][stat], current[name][stat]
+        change = (after - before) / before * 100 if before else 0.0
+        rows.append(
+            {
+                "name": name,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regressed": change > threshold,
+            }
+        )
+    return rows
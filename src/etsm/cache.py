@@ -0,0 +1,144 @@
+"""Persistent, content-addressed cache for Claude responses."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from etsm.client import ClaudeResult
+
+DEFAULT_CACHE_PATH = os.path.join(".etsm_cache", "responses.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0), ('misses', 0);
+"""
+
+
+def cache_key(model, max_tokens, prompt):
+    """Stable hash of everything that determines a completion"""
+    material = json.dumps([model, max_tokens, prompt], sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite store of successful ClaudeResults with TTL and LRU eviction.
+
+    The database file is shared by every session and process pointing at the
+    same path, so a colleague's analysis is reused and entries survive
+    restarts. Only successful results are stored.
+    """
+
+    key = staticmethod(cache_key)
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=24 * 3600, max_entries=500):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls):
+        """Build a cache from the ETSM_RESPONSE_CACHE* settings"""
+        return cls(
+            path=os.getenv("ETSM_RESPONSE_CACHE", DEFAULT_CACHE_PATH),
+            ttl=float(os.getenv("ETSM_RESPONSE_CACHE_TTL", 24 * 3600)),
+            max_entries=int(os.getenv("ETSM_RESPONSE_CACHE_MAX_ENTRIES", 500)),
+        )
+
+    def _bump(self, name):
+        self._conn.execute("UPDATE stats SET value = value + 1 WHERE name = ?", (name,))
+
+    def get(self, key, count=True):
+        """Return the cached ClaudeResult for ``key`` or None on a miss.
+
+        With ``count=False`` the lookup leaves the hit/miss counters alone.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                if count:
+                    self._bump("misses")
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            if count:
+                self._bump("hits")
+
+        result = ClaudeResult(**json.loads(row[0]))
+        result.cached = True
+        return result
+
+    def put(self, key, result):
+        """Store a successful result and evict expired/least-recent entries"""
+        if not result.ok:
+            return
+        payload = json.dumps(dataclasses.asdict(result))
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, result.model, payload, len(payload), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM stats"))
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("UPDATE stats SET value = 0")
@@ -0,0 +1,145 @@
+"""Trend charts that send a bounded number of points to the browser."""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from etsm.data import DEFAULT_COMPANIES
+
+OTHER_LABEL = "Other"
+OTHER_COLOR = "#9e9e9e"
+DEFAULT_PALETTE = px.colors.qualitative.D3 + px.colors.qualitative.Alphabet
+# The demo accounts keep the D3 colors they have always had, whatever their rank
+SERIES_COLORS = dict(zip(DEFAULT_COMPANIES, px.colors.qualitative.D3))
+
+
+def lttb_indices(x, y, n_out):
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; every bucket in between
+    keeps the point forming the largest triangle with its neighbours, which
+    preserves peaks and troughs far better than striding.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end : edges[i + 2]].mean()
+            next_y = y[end : edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """Indices of the minimum and maximum of ``n_out // 2`` equal buckets"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    buckets = np.arange(n) * (n_out // 2) // n
+    order = np.lexsort((np.asarray(y), buckets))
+    bounds = np.flatnonzero(np.diff(buckets[order], prepend=-1, append=-1))
+    return np.unique(np.concatenate([order[bounds[:-1]], order[bounds[1:] - 1]]))
+
+
+def top_n_with_other(df, x, y, series, top_n):
+    """Sum ``y`` per series and x, folding all but the top ``top_n`` series
+    (by total ``y``) into a single "Other" series"""
+    totals = df.groupby(series, observed=True)[y].sum()
+    keep = totals.nlargest(top_n).index
+    labels = df[series].astype(str)
+    if len(totals) > top_n:
+        labels = labels.where(df[series].isin(keep), OTHER_LABEL)
+    frame = pd.DataFrame({series: labels, x: df[x], y: df[y]})
+    grouped = (
+        frame.groupby([series, x], sort=True, observed=True)[y].sum().reset_index()
+    )
+    order = [str(name) for name in keep]
+    if len(totals) > top_n:
+        order.append(OTHER_LABEL)
+    return grouped, order
+
+
+def series_colors(names, palette=DEFAULT_PALETTE, fixed=SERIES_COLORS):
+    """Color per series name: ``fixed`` colors where given, the remaining
+    series take the ``palette`` entries no fixed series owns, in order"""
+    reserved = set(fixed.values())
+    free = [color for color in palette if color not in reserved] or list(palette)
+    colors, position = {}, 0
+    for name in names:
+        if name == OTHER_LABEL:
+            colors[name] = OTHER_COLOR
+        elif name in fixed:
+            colors[name] = fixed[name]
+        else:
+            colors[name] = free[position % len(free)]
+            position += 1
+    return colors
+
+
+def _numeric(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy().astype("datetime64[ns]").astype(np.int64)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy()
+    return np.arange(len(values))
+
+
+def downsample(values_x, values_y, max_points, method="lttb"):
+    """Positions to keep for one series sorted by x"""
+    if method == "minmax":
+        return minmax_indices(values_y.to_numpy(), max_points)
+    return lttb_indices(_numeric(values_x), values_y.to_numpy(), max_points)
+
+
+def trend_figure(
+    df,
+    x,
+    y,
+    series,
+    title,
+    top_n=10,
+    max_points=800,
+    method="lttb",
+    webgl_threshold=2000,
+    palette=DEFAULT_PALETTE,
+    fixed_colors=SERIES_COLORS,
+):
+    """Line chart of ``y`` over ``x`` per ``series`` with bounded payload.
+
+    At most ``top_n`` series plus "Other" are drawn, each downsampled to
+    ``max_points`` (roughly the chart width in pixels). Above
+    ``webgl_threshold`` total points the traces switch to ``Scattergl``.
+    """
+    grouped, order = top_n_with_other(df, x, y, series, top_n)
+    traces = []
+    for name in order:
+        rows = grouped[grouped[series] == name]
+        keep = downsample(rows[x], rows[y], max_points, method)
+        traces.append((name, rows[x].to_numpy()[keep], rows[y].to_numpy()[keep]))
+
+    points = sum(len(values) for _, _, values in traces)
+    scatter = go.Scattergl if points > webgl_threshold else go.Scatter
+    colors = series_colors(order, palette, fixed_colors)
+    fig = go.Figure()
+    for name, xs, ys in traces:
+        fig.add_trace(
+            scatter(x=xs, y=ys, name=name, mode="lines", line=dict(color=colors[name]))
+        )
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, legend_title=series)
+    return fig
@@ -0,0 +1,426 @@
+"""Pooled, retrying client for the Anthropic Messages API."""
+
+import copy
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+DEFAULT_BASE_URL = "https://api.anthropic.com"
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Rate limits, overloads and transient server errors are worth another attempt
+RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+@dataclass
+class ClaudeResult:
+    """Structured outcome of a Messages API call"""
+
+    text: str = ""
+    status: Optional[int] = None
+    usage: dict = field(default_factory=dict)
+    latency: float = 0.0
+    time_to_first_token: Optional[float] = None
+    model: str = DEFAULT_MODEL
+    stop_reason: Optional[str] = None
+    attempts: int = 0
+    error: Optional[str] = None
+    raw: str = ""
+    cached: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None and self.status == 200
+
+    @property
+    def input_tokens(self):
+        return self.usage.get("input_tokens", 0)
+
+    @property
+    def output_tokens(self):
+        return self.usage.get("output_tokens", 0)
+
+    @property
+    def cache_read_tokens(self):
+        return self.usage.get("cache_read_input_tokens") or 0
+
+    @property
+    def cache_write_tokens(self):
+        return self.usage.get("cache_creation_input_tokens") or 0
+
+
+def _env_float(name, default):
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a retry-after header, or None if unusable"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def iter_sse_events(lines):
+    """Yield (event, data) pairs from server-sent event lines"""
+    event, data = None, []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = None, []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:") :].lstrip())
+    if data:
+        yield event, json.loads("\n".join(data))
+
+
+class MessageStream:
+    """Iterates text deltas of a streamed message.
+
+    ``result`` is filled in as events arrive and is complete, including the
+    stop reason and final usage, once iteration finishes.
+    """
+
+    def __init__(self, client, payload, cache_key=None, use_cache=True):
+        self.client = client
+        self.payload = payload
+        self.cache_key = cache_key
+        self.use_cache = use_cache
+        self.result = ClaudeResult(model=payload["model"])
+
+    def __iter__(self):
+        try:
+            yield from self._events()
+        finally:
+            self.client._completed(self.result)
+
+    def _events(self):
+        cache = self.client.cache
+        if cache is not None and self.use_cache:
+            cached = cache.get(self.cache_key)
+            if cached is not None:
+                self.result = cached
+                yield cached.text
+                return
+
+        result = self.result
+        if not self.client.api_key:
+            result.error = "API key not found. Please check your .env file."
+            return
+
+        start = time.perf_counter()
+        response = self.client._post(self.payload, result, stream=True)
+        if response is None:
+            result.latency = time.perf_counter() - start
+            return
+
+        result.status = response.status_code
+        if response.status_code != 200:
+            result.raw = response.text
+            result.error = f"API Error: {response.status_code} - {response.text}"
+            result.latency = time.perf_counter() - start
+            return
+
+        chunks, raw = [], []
+        try:
+            for event, data in iter_sse_events(response.iter_lines()):
+                raw.append(json.dumps(data))
+                if event == "message_start":
+                    message = data.get("message", {})
+                    result.model = message.get("model", result.model)
+                    result.usage.update(message.get("usage", {}))
+                elif event == "content_block_delta":
+                    text = data.get("delta", {}).get("text")
+                    if text:
+                        if result.time_to_first_token is None:
+                            result.time_to_first_token = time.perf_counter() - start
+                        chunks.append(text)
+                        yield text
+                elif event == "message_delta":
+                    result.stop_reason = data.get("delta", {}).get("stop_reason")
+                    result.usage.update(data.get("usage", {}))
+                elif event == "error":
+                    error = data.get("error", {})
+                    result.error = (
+                        f"Stream error: {error.get('type')} - {error.get('message')}"
+                    )
+        except (requests.RequestException, ValueError) as e:
+            result.error = f"Error reading stream: {e}"
+        finally:
+            response.close()
+            result.text = "".join(chunks)
+            result.raw = "\n".join(raw)
+            result.latency = time.perf_counter() - start
+        if cache is not None:
+            cache.put(self.cache_key, result)
+
+
+class AnthropicClient:
+    """Keep-alive Messages API client with timeouts and jittered backoff.
+
+    One instance is meant to be shared: the underlying ``requests.Session``
+    pools connections so repeated calls reuse the same TLS connection. An
+    optional ``cache`` (see ``etsm.cache.ResponseCache``) is consulted before
+    any request is sent. Each callable in ``hooks`` receives every finished
+    ClaudeResult, cached or not (see ``etsm.telemetry.record_result``).
+    """
+
+    def __init__(
+        self,
+        api_key=None,
+        base_url=None,
+        connect_timeout=5.0,
+        read_timeout=60.0,
+        max_retries=3,
+        backoff_base=0.5,
+        backoff_max=20.0,
+        pool_size=10,
+        session=None,
+        cache=None,
+        hooks=(),
+    ):
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        base_url = base_url or os.getenv("ANTHROPIC_BASE_URL") or DEFAULT_BASE_URL
+        self.url = base_url.rstrip("/") + "/v1/messages"
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.session = session or self._build_session(pool_size)
+        self.cache = cache
+        self.hooks = list(hooks)
+
+    @classmethod
+    def from_env(cls, api_key=None, cache=None, hooks=()):
+        """Build a client using the ANTHROPIC_* timeout/retry settings"""
+        return cls(
+            api_key=api_key,
+            cache=cache,
+            hooks=hooks,
+            connect_timeout=_env_float("ANTHROPIC_CONNECT_TIMEOUT", 5.0),
+            read_timeout=_env_float("ANTHROPIC_READ_TIMEOUT", 60.0),
+            max_retries=int(_env_float("ANTHROPIC_MAX_RETRIES", 3)),
+        )
+
+    @staticmethod
+    def _build_session(pool_size):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "content-type": "application/json",
+                "anthropic-version": ANTHROPIC_VERSION,
+            }
+        )
+        return session
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Full-jitter exponential delay, never shorter than retry-after"""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = retry_after + delay * 0.1
+        return delay
+
+    def with_hooks(self, *hooks):
+        """A client sharing this one's connection pool and cache that also
+        calls ``hooks`` with every finished result"""
+        client = copy.copy(self)
+        client.hooks = self.hooks + list(hooks)
+        return client
+
+    def close(self):
+        self.session.close()
+
+    def _completed(self, result):
+        for hook in self.hooks:
+            hook(result)
+
+    def _payload(self, prompt, model, max_tokens, stream=False, context=None):
+        content = prompt
+        if context:
+            # The shared prefix is marked for prompt caching; only the
+            # question after it varies between requests
+            content = [
+                {
+                    "type": "text",
+                    "text": context,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+        payload = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": content}],
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def _post(self, payload, result, **kwargs):
+        """POST with retries; returns the final response or None on failure"""
+        headers = {"x-api-key": self.api_key}
+        while True:
+            result.attempts += 1
+            retry_after = None
+            try:
+                response = self.session.post(
+                    self.url,
+                    headers=headers,
+                    json=payload,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if result.attempts > self.max_retries:
+                    result.error = f"Error calling API: {e}"
+                    return None
+            except requests.RequestException as e:
+                result.error = f"Error calling API: {e}"
+                return None
+            else:
+                if (
+                    response.status_code not in RETRYABLE_STATUSES
+                    or result.attempts > self.max_retries
+                ):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                response.close()
+            time.sleep(self.backoff_delay(result.attempts, retry_after))
+
+    def _cache_key(self, prompt, model, max_tokens, context):
+        if self.cache is None:
+            return None
+        return self.cache.key(
+            model, max_tokens, prompt if context is None else [context, prompt]
+        )
+
+    def cached_result(
+        self, prompt, model=DEFAULT_MODEL, max_tokens=1000, context=None, count=True
+    ):
+        """The locally cached result for this request, or None on a miss;
+        ``count=False`` skips the cache's hit/miss counters"""
+        key = self._cache_key(prompt, model, max_tokens, context)
+        cached = self.cache.get(key, count=count) if key is not None else None
+        if cached is not None:
+            self._completed(cached)
+        return cached
+
+    def create_message(
+        self,
+        prompt,
+        model=DEFAULT_MODEL,
+        max_tokens=1000,
+        use_cache=True,
+        context=None,
+    ):
+        """Send a single-turn prompt and return a ClaudeResult.
+
+        ``context`` is sent ahead of ``prompt`` with ``cache_control`` so
+        repeat requests over the same data read it from the API's prompt
+        cache. With ``use_cache=False`` the local response cache is not read,
+        but a successful result still replaces the stored entry.
+        """
+        if use_cache:
+            cached = self.cached_result(prompt, model, max_tokens, context)
+            if cached is not None:
+                return cached
+
+        key = self._cache_key(prompt, model, max_tokens, context)
+        result = self._send(self._payload(prompt, model, max_tokens, context=context))
+        if key is not None:
+            self.cache.put(key, result)
+        self._completed(result)
+        return result
+
+    def _send(self, payload):
+        model = payload["model"]
+        result = ClaudeResult(model=model)
+        if not self.api_key:
+            result.error = "API key not found. Please check your .env file."
+            return result
+
+        start = time.perf_counter()
+        response = self._post(payload, result)
+        result.latency = time.perf_counter() - start
+        if response is None:
+            return result
+
+        result.status = response.status_code
+        result.raw = response.text
+        if response.status_code != 200:
+            result.error = f"API Error: {response.status_code} - {response.text}"
+            return result
+
+        try:
+            body = response.json()
+            result.text = body["content"][0]["text"]
+        except (ValueError, KeyError, IndexError) as e:
+            result.error = f"Unexpected API response: {e}"
+            return result
+        result.usage = body.get("usage", {})
+        result.stop_reason = body.get("stop_reason")
+        result.model = body.get("model", model)
+        return result
+
+    def stream_message(
+        self,
+        prompt,
+        model=DEFAULT_MODEL,
+        max_tokens=1000,
+        use_cache=True,
+        context=None,
+    ):
+        """Stream a single-turn prompt; iterate the returned MessageStream"""
+        return MessageStream(
+            self,
+            self._payload(prompt, model, max_tokens, stream=True, context=context),
+            cache_key=self._cache_key(prompt, model, max_tokens, context),
+            use_cache=use_cache,
+        )
+
+
+class StubClient:
+    """Offline stand-in for AnthropicClient that returns canned analyses"""
+
+    def __init__(self, text="Stub analysis: no API call was made."):
+        self.text = text
+        self.cache = None
+
+    def create_message(
+        self,
+        prompt,
+        model=DEFAULT_MODEL,
+        max_tokens=1000,
+        use_cache=True,
+        context=None,
+    ):
+        full_prompt = (context or "") + prompt
+        return ClaudeResult(
+            text=self.text,
+            status=200,
+            usage={"input_tokens": len(full_prompt) // 4 + 1, "output_tokens": 0},
+            model=model,
+            stop_reason="end_turn",
+            attempts=1,
+        )
@@ -0,0 +1,217 @@
+"""Mock usage and strategy datasets."""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_COMPANIES = [
+    "Acme Corp",
+    "Zenith PLC",
+    "Global Dynamics",
+    "TechStart Inc",
+    "DataFlow Ltd",
+]
+
+# Monthly growth trend and per-period jitter applied as
+# usage = base * (1 + (trend + uniform(-jitter, jitter)) * months_elapsed)
+GROWTH_PROFILES = {
+    "growing": (0.15, 0.0),
+    "declining": (-0.05, 0.0),
+    "variable": (0.0, 0.1),
+}
+
+DEFAULT_PROFILE_WEIGHTS = {"growing": 0.2, "declining": 0.2, "variable": 0.6}
+
+STRATEGY_STATUSES = ["Planning", "In Progress", "Completed", "On Hold"]
+STRATEGY_PRIORITIES = ["Critical", "High", "Medium", "Low"]
+STRATEGY_THEMES = [
+    "Expand AI-Powered Analytics",
+    "Optimize Document Processing",
+    "Launch Customer Service Bot",
+    "Content Generation Platform",
+    "Data Analysis Automation",
+    "Code Review Assistant",
+    "Knowledge Base Search",
+]
+STRATEGY_STAKEHOLDERS = ["CTO", "CEO", "VP Engineering", "VP Product", "CIO"]
+
+
+def company_names(n_companies):
+    """The demo accounts first, then numbered synthetic accounts"""
+    names = DEFAULT_COMPANIES[:n_companies]
+    width = len(str(n_companies))
+    names += [f"Company {i:0{width}d}" for i in range(len(names) + 1, n_companies + 1)]
+    return names
+
+
+def _periods(granularity, start, end):
+    """Period labels, month labels and months elapsed (1-based) per period"""
+    if granularity == "monthly":
+        months = pd.period_range(start, end, freq="M")
+        return (
+            months.strftime("%Y-%m"),
+            months.strftime("%Y-%m"),
+            np.arange(1, len(months) + 1, dtype=np.float64),
+        )
+    if granularity == "daily":
+        days = pd.date_range(start, end, freq="D")
+        elapsed = (days - days[0]).days.to_numpy() / 30.4375 + 1
+        return days.strftime("%Y-%m-%d"), days.strftime("%Y-%m"), elapsed
+    raise ValueError(f"Unknown granularity: {granularity!r}")
+
+
+def generate_synthetic_usage(
+    n_companies=5,
+    granularity="monthly",
+    start="2024-01-01",
+    end="2024-12-31",
+    growth_profiles=None,
+    seed=None,
+):
+    """Vectorized synthetic usage data, deterministic for a given ``seed``.
+
+    ``growth_profiles`` is either a mapping of GROWTH_PROFILES names to
+    sampling weights, or a sequence of names assigned to companies in order
+    (cycled). Company and Month are categorical so frames with tens of
+    millions of rows stay compact; daily data also gets a ``Date`` column.
+    """
+    rng = np.random.default_rng(seed)
+    names = company_names(n_companies)
+    labels, month_labels, elapsed = _periods(granularity, start, end)
+    n_periods = len(labels)
+
+    growth_profiles = growth_profiles or DEFAULT_PROFILE_WEIGHTS
+    if isinstance(growth_profiles, dict):
+        profile_names = list(growth_profiles)
+        weights = np.array([growth_profiles[p] for p in profile_names], float)
+        chosen = rng.choice(
+            len(profile_names), size=n_companies, p=weights / weights.sum()
+        )
+    else:
+        profile_names = list(growth_profiles)
+        chosen = np.arange(n_companies) % len(profile_names)
+    trend = np.array([GROWTH_PROFILES[p][0] for p in profile_names])[chosen]
+    jitter = np.array([GROWTH_PROFILES[p][1] for p in profile_names])[chosen]
+
+    base = rng.integers(50000, 2000000, size=n_companies, endpoint=True)
+    noise = rng.uniform(-1.0, 1.0, size=(n_companies, n_periods))
+    slope = trend[:, None] + jitter[:, None] * noise
+    # Declining accounts can project below zero; clip once for every column
+    usage = np.maximum(0, (base[:, None] * (1 + slope * elapsed[None, :])).ravel())
+
+    company_codes = np.repeat(np.arange(n_companies, dtype=np.int32), n_periods)
+    period_codes = np.tile(np.arange(n_periods, dtype=np.int32), n_companies)
+    month_categories, month_codes = np.unique(
+        np.asarray(month_labels), return_inverse=True
+    )
+
+    columns = {
+        "Company": pd.Categorical.from_codes(company_codes, categories=names),
+        "Month": pd.Categorical.from_codes(
+            month_codes[period_codes], categories=month_categories
+        ),
+        "API_Calls": usage.astype(np.int64),
+        "Revenue": usage * 0.001,  # Mock revenue calculation
+        "Use_Cases": rng.integers(1, 5, size=usage.size, endpoint=True),
+    }
+    if granularity == "daily":
+        columns["Date"] = pd.to_datetime(np.asarray(labels))[period_codes]
+    return pd.DataFrame(columns)
+
+
+def generate_api_usage_data(seed=None):
+    """Generate realistic API usage data"""
+    usage_df = generate_synthetic_usage(
+        n_companies=len(DEFAULT_COMPANIES),
+        growth_profiles=["growing", "declining", "variable", "variable", "variable"],
+        seed=seed,
+    )
+    # The demo frame is tiny, so plain string columns keep it simple to use
+    return usage_df.astype({"Company": str, "Month": str})
+
+
+def generate_strategy_data():
+    """Generate strategy board data"""
+    strategies = [
+        {
+            "Account": "Acme Corp",
+            "Strategy": "Expand AI-Powered Analytics",
+            "Status": "In Progress",
+            "Priority": "High",
+            "Expected_Revenue": 150000,
+            "Timeline": "Q2 2024",
+            "Key_Stakeholder": "Sarah Chen (CTO)",
+            "Description": "Implement advanced analytics using Claude API for customer insights",
+        },
+        {
+            "Account": "Zenith PLC",
+            "Strategy": "Optimize Document Processing",
+            "Status": "Planning",
+            "Priority": "Critical",
+            "Expected_Revenue": 80000,
+            "Timeline": "Q1 2024",
+            "Key_Stakeholder": "Jennifer Kim (CEO)",
+            "Description": "Address declining usage with new document processing use case",
+        },
+        {
+            "Account": "Global Dynamics",
+            "Strategy": "Launch Customer Service Bot",
+            "Status": "Completed",
+            "Priority": "Medium",
+            "Expected_Revenue": 120000,
+            "Timeline": "Q1 2024",
+            "Key_Stakeholder": "David Thompson (CTO)",
+            "Description": "Successfully implemented AI-powered customer service solution",
+        },
+        {
+            "Account": "TechStart Inc",
+            "Strategy": "Content Generation Platform",
+            "Status": "In Progress",
+            "Priority": "High",
+            "Expected_Revenue": 200000,
+            "Timeline": "Q3 2024",
+            "Key_Stakeholder": "Alex Rodriguez (VP Product)",
+            "Description": "Building automated content generation for marketing materials",
+        },
+        {
+            "Account": "DataFlow Ltd",
+            "Strategy": "Data Analysis Automation",
+            "Status": "Planning",
+            "Priority": "Medium",
+            "Expected_Revenue": 95000,
+            "Timeline": "Q2 2024",
+            "Key_Stakeholder": "Lisa Wang (VP Engineering)",
+            "Description": "Automate data analysis workflows using Claude API",
+        },
+    ]
+    return pd.DataFrame(strategies)
+
+
+def generate_synthetic_strategies(n_strategies=1000, n_companies=None, seed=None):
+    """Vectorized synthetic strategy pipeline with the strategy board columns.
+
+    Account, Strategy, Status, Priority, Timeline and Key_Stakeholder are
+    categorical; accounts come from ``company_names`` so they line up with
+    the synthetic usage data.
+    """
+    rng = np.random.default_rng(seed)
+    n_companies = n_companies or max(1, n_strategies // 4)
+    accounts = company_names(n_companies)
+    timelines = [f"Q{q} {y}" for y in (2024, 2025) for q in range(1, 5)]
+
+    def pick(categories, p=None):
+        codes = rng.choice(len(categories), size=n_strategies, p=p)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    strategy = pick(STRATEGY_THEMES)
+    return pd.DataFrame(
+        {
+            "Account": pick(accounts),
+            "Strategy": strategy,
+            "Status": pick(STRATEGY_STATUSES, p=[0.3, 0.4, 0.2, 0.1]),
+            "Priority": pick(STRATEGY_PRIORITIES, p=[0.1, 0.3, 0.4, 0.2]),
+            "Expected_Revenue": rng.integers(10, 500, size=n_strategies) * 1000,
+            "Timeline": pick(timelines),
+            "Key_Stakeholder": pick(STRATEGY_STAKEHOLDERS),
+            "Description": strategy.astype(str),
+        }
+    )
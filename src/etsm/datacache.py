@@ -0,0 +1,110 @@
+"""Process-wide, memory-capped cache for datasets and derived aggregates."""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_size(value):
+    """Approximate in-memory size of a cached value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    # Containers of frames (e.g. etsm.rollups.RollupStore) report their own
+    if callable(getattr(value, "memory_usage", None)):
+        return int(value.memory_usage())
+    return sys.getsizeof(value)
+
+
+class DatasetCache:
+    """LRU of computed values keyed by (name, data version, params).
+
+    One instance is shared by every session (the dashboard holds it with
+    ``st.cache_resource``), so a dataset or aggregate is computed once per
+    data version. Cached values are shared and must be treated as read-only.
+    When the total estimated size exceeds ``max_bytes`` the least recently
+    used entries are dropped.
+    """
+
+    def __init__(self, max_bytes=1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(max_bytes=int(os.getenv("ETSM_DATA_CACHE_MB", 1024)) * 1024 * 1024)
+
+    @property
+    def size_bytes(self):
+        return sum(self._sizes.values())
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_or_compute(self, name, version, compute, params=()):
+        """Return the cached value, computing it at most once per key"""
+        key = (name, version, params)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        # Concurrent sessions asking for the same key wait for one computation
+        with self._key_lock(key):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+            value = compute()
+            size = estimate_size(value)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = value
+                self._sizes[key] = size
+                self._evict()
+                self._key_locks.pop(key, None)
+        return value
+
+    def _evict(self):
+        while len(self._entries) > 1 and self.size_bytes > self.max_bytes:
+            key, _ = self._entries.popitem(last=False)
+            del self._sizes[key]
+
+    def invalidate(self, name=None):
+        """Drop every entry, or only those for ``name``"""
+        with self._lock:
+            for key in list(self._entries):
+                if name is None or key[0] == name:
+                    del self._entries[key]
+                    del self._sizes[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": sum(self._sizes.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,114 @@
+"""Dashboard figure builders sharing one registered Plotly template.
+
+Builders are pure functions of their inputs, so the dashboard caches the
+figures they return by data version and chart parameters.
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from etsm.charts import trend_figure
+from etsm.forecast import INTERVAL_LEVEL
+
+TEMPLATE = "plotly+etsm"
+
+pio.templates["etsm"] = go.layout.Template(
+    layout=dict(
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        font=dict(color="black", size=12),
+        xaxis=dict(gridcolor="#e0e0e0", zerolinecolor="#000000"),
+        yaxis=dict(gridcolor="#e0e0e0", zerolinecolor="#000000"),
+    )
+)
+
+STATUS_COLORS = {
+    "In Progress": "#1f77b4",  # Blue
+    "Planning": "#ff7f0e",  # Orange
+    "Completed": "#2ca02c",  # Green
+    "On Hold": "#d62728",  # Red
+}
+PRIORITY_COLORS = {
+    "High": "#d62728",  # Red
+    "Medium": "#ff7f0e",  # Orange
+    "Low": "#2ca02c",  # Green
+    "Critical": "#9467bd",  # Purple
+}
+
+
+def usage_trend(usage_df, top_n=10):
+    """Monthly (or daily) API calls per company, bounded by ``top_n``"""
+    fig = trend_figure(
+        usage_df,
+        x="Date" if "Date" in usage_df else "Month",
+        y="API_Calls",
+        series="Company",
+        title="Monthly API Usage Trends",
+        top_n=top_n,
+    )
+    fig.update_layout(template=TEMPLATE, height=500)
+    return fig
+
+
+def ranked_bar(values, title, color_scale):
+    """Horizontal bar per index label, smallest value at the bottom"""
+    values = values.sort_values(ascending=True)
+    return px.bar(
+        x=values.values,
+        y=values.index,
+        orientation="h",
+        title=title,
+        color=values.values,
+        color_continuous_scale=color_scale,
+        template=TEMPLATE,
+    )
+
+
+def distribution_pie(counts, title, colors):
+    return px.pie(
+        values=counts.values,
+        names=counts.index,
+        title=title,
+        color=counts.index,
+        color_discrete_map=colors,
+        template=TEMPLATE,
+    )
+
+
+def distribution_bar(counts, title, colors):
+    fig = px.bar(
+        x=counts.index,
+        y=counts.values,
+        title=title,
+        color=counts.index,
+        color_discrete_map=colors,
+        template=TEMPLATE,
+    )
+    return fig.update_layout(showlegend=False)
+
+
+def forecast_band(history, future, forecast, title, level=INTERVAL_LEVEL):
+    """Actual monthly totals followed by the forecast and its interval"""
+    future = list(future)
+    fig = go.Figure()
+    fig.add_scatter(
+        x=future + future[::-1],
+        y=list(forecast["upper"]) + list(forecast["lower"][::-1]),
+        fill="toself",
+        fillcolor="rgba(31, 119, 180, 0.2)",
+        line=dict(width=0),
+        hoverinfo="skip",
+        name=f"{level:.0%} interval",
+    )
+    fig.add_scatter(
+        x=list(history.index), y=history.values, mode="lines+markers", name="Actual"
+    )
+    fig.add_scatter(
+        x=[history.index[-1]] + future,
+        y=[history.iloc[-1]] + list(forecast["point"]),
+        mode="lines+markers",
+        line=dict(dash="dash"),
+        name="Forecast",
+    )
+    return fig.update_layout(template=TEMPLATE, title=title, height=400)
@@ -0,0 +1,172 @@
+"""Batched per-account forecasts with prediction intervals.
+
+Every account is fitted at once: the model state is a handful of arrays with
+one entry per account, and a new month of data updates that state in a single
+vectorized step instead of refitting the whole history.
+"""
+
+import threading
+from statistics import NormalDist
+
+import numpy as np
+
+HORIZONS = (1, 3, 6)  # months ahead
+INTERVAL_LEVEL = 0.8
+METHODS = ("holt", "linear")
+
+
+def _z(level):
+    return NormalDist().inv_cdf(0.5 + level / 2)
+
+
+class UsageForecaster:
+    """Holt linear exponential smoothing or least-squares linear trend per
+    row of an accounts x months matrix.
+
+    ``refresh`` only processes months that were not seen before when the
+    accounts and earlier months are unchanged; any other change refits.
+    NaN months are skipped (Holt carries the trend forward through them) and
+    Holt starts each row from its first two observed months.
+    """
+
+    def __init__(self, method="holt", alpha=0.5, beta=0.2):
+        if method not in METHODS:
+            raise ValueError(f"Unknown forecast method: {method!r}")
+        self.method = method
+        self.alpha = alpha
+        self.beta = beta
+        self.accounts = None
+        self.months = []
+        self._matrix = None
+        self._state = None
+        self._lock = threading.Lock()
+
+    def refresh(self, accounts, months, matrix):
+        """Bring the fit up to date with ``matrix``; returns the number of
+        months processed (0 when nothing changed)"""
+        months = list(months)
+        with self._lock:
+            seen = len(self.months)
+            incremental = (
+                self._state is not None
+                and self.accounts.equals(accounts)
+                and months[:seen] == self.months
+                and len(months) >= seen
+                and np.array_equal(matrix[:, :seen], self._matrix, equal_nan=True)
+            )
+            if not incremental:
+                seen = 0
+                self._state = self._initial_state(len(matrix))
+            for column in range(seen, len(months)):
+                self._step(column, matrix[:, column].astype(float))
+            self.accounts = accounts
+            self.months = months
+            self._matrix = matrix.copy()
+            return len(months) - seen
+
+    def _initial_state(self, n_rows):
+        if self.method == "holt":
+            names = ["level", "trend", "sse", "errors", "observed"]
+            state = {name: np.zeros(n_rows) for name in names}
+            state["level"][:] = np.nan
+            return state
+        names = ["n", "sx", "sy", "sxx", "sxy", "syy"]
+        return {name: np.zeros(n_rows) for name in names}
+
+    def _step(self, x, values):
+        observed = np.isfinite(values)
+        y = np.where(observed, values, 0.0)
+        state = self._state
+        if self.method == "linear":
+            state["n"] += observed
+            state["sx"] += observed * x
+            state["sy"] += y
+            state["sxx"] += observed * x * x
+            state["sxy"] += y * x
+            state["syy"] += y * y
+            return
+
+        level, trend = state["level"], state["trend"]
+        # The first observation sets the level, the second the initial trend
+        first = observed & (state["observed"] == 0)
+        second = observed & (state["observed"] == 1)
+        update = observed & (state["observed"] >= 2)
+        predicted = level + trend
+        error = np.where(update, y - predicted, 0.0)
+        state["sse"] += error * error
+        state["errors"] += update
+        state["observed"] += observed
+        new_level = predicted + self.alpha * error
+        new_trend = trend + self.alpha * self.beta * error
+        # Gaps carry the level forward along the trend
+        state["level"] = np.select(
+            [first | second, update], [y, new_level], default=predicted
+        )
+        state["trend"] = np.select(
+            [second, update], [y - level, new_trend], default=trend
+        )
+
+    def forecast(self, horizons=HORIZONS, level=INTERVAL_LEVEL):
+        """``{"point", "lower", "upper", "std"}`` arrays of shape
+        (accounts, len(horizons)); values h months after the last month"""
+        with self._lock:
+            state = {name: values.copy() for name, values in self._state.items()}
+            last = len(self.months) - 1
+        h = np.asarray(horizons, dtype=float)[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.method == "holt":
+                point = state["level"][:, None] + h * state["trend"][:, None]
+                dof = np.maximum(state["errors"] - 2, 1)
+                sigma2 = (state["sse"] / dof)[:, None]
+                a, b = self.alpha, self.alpha * self.beta
+                # Additive Holt (ETS A,A,N) h-step variance
+                std = np.sqrt(
+                    sigma2
+                    * (1 + (h - 1) * (a * a + a * b * h + b * b * h * (2 * h - 1) / 6))
+                )
+            else:
+                n, sx, sy = state["n"], state["sx"], state["sy"]
+                sxx_c = state["sxx"] - sx * sx / n
+                slope = np.where(sxx_c > 0, (state["sxy"] - sx * sy / n) / sxx_c, 0.0)
+                intercept = (sy - slope * sx) / n
+                residual = state["syy"] - intercept * sy - slope * state["sxy"]
+                sigma2 = np.maximum(residual, 0) / np.maximum(n - 2, 1)
+                x = last + h
+                mean_x = (sx / n)[:, None]
+                point = intercept[:, None] + slope[:, None] * x
+                leverage = np.where(
+                    sxx_c[:, None] > 0, (x - mean_x) ** 2 / sxx_c[:, None], 0.0
+                )
+                std = np.sqrt(sigma2[:, None] * (1 + 1 / n[:, None] + leverage))
+        std = np.nan_to_num(std)
+        margin = _z(level) * std
+        # Usage and revenue cannot go negative
+        return {
+            "point": np.maximum(point, 0),
+            "lower": np.maximum(point - margin, 0),
+            "upper": np.maximum(point + margin, 0),
+            "std": std,
+        }
+
+
+def portfolio_forecast(forecast, level=INTERVAL_LEVEL):
+    """Summed per-account forecasts; errors are treated as independent"""
+    std = np.sqrt(np.nansum(forecast["std"] ** 2, axis=0))
+    point = np.nansum(forecast["point"], axis=0)
+    margin = _z(level) * std
+    return {
+        "point": point,
+        "lower": np.maximum(point - margin, 0),
+        "upper": point + margin,
+        "std": std,
+    }
+
+
+def future_months(last_month, horizons=HORIZONS):
+    """'YYYY-MM' labels ``horizons`` months after ``last_month``"""
+    year, month = map(int, str(last_month).split("-"))
+    labels = []
+    for h in horizons:
+        index = year * 12 + month - 1 + h
+        labels.append(f"{index // 12}-{index % 12 + 1:02d}")
+    return labels
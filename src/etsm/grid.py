@@ -0,0 +1,41 @@
+"""Server-side filtering, sorting and paging for large tables."""
+
+import math
+
+
+def query_frame(
+    df, filters=None, search=None, search_column=None, sort_by=None, ascending=True
+):
+    """Filter on ``{column: allowed values}``, substring-search and sort.
+
+    Everything happens on the server with vectorized masks, so the browser
+    only ever receives the page it displays.
+    """
+    mask = None
+    for column, values in (filters or {}).items():
+        if values:
+            condition = df[column].isin(list(values))
+            mask = condition if mask is None else mask & condition
+    if search and search_column:
+        condition = (
+            df[search_column].astype(str).str.contains(search, case=False, regex=False)
+        )
+        mask = condition if mask is None else mask & condition
+    if mask is not None:
+        df = df[mask]
+    if sort_by:
+        df = df.sort_values(sort_by, ascending=ascending, kind="stable")
+    return df
+
+
+def page_count(rows, page_size):
+    """Pages needed for ``rows`` rows (at least 1)"""
+    return max(1, math.ceil(rows / page_size))
+
+
+def paginate(df, page, page_size):
+    """Rows of 1-based ``page`` plus the page count (at least 1)"""
+    pages = page_count(len(df), page_size)
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return df.iloc[start : start + page_size], pages
@@ -0,0 +1,82 @@
+"""Versioned on-disk store of precomputed account insights."""
+
+import dataclasses
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+DEFAULT_INSIGHTS_DIR = os.path.join(".etsm_cache", "insights")
+
+
+def prompt_hash(prompt, context=""):
+    """Short fingerprint used to tell whether a stored insight is stale"""
+    material = (context or "") + prompt.strip()
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def insight_record(prompt, result, context=None):
+    """JSON-ready record of one prompt and its ClaudeResult"""
+    record = dataclasses.asdict(result)
+    record.pop("raw", None)
+    record["prompt"] = prompt
+    record["context"] = context
+    record["prompt_hash"] = prompt_hash(prompt, context)
+    return record
+
+
+class InsightStore:
+    """Directory of immutable ``<version>.json`` insight snapshots.
+
+    Each precompute run writes a new version; readers always pick the newest
+    complete file, so a run in progress never exposes a partial snapshot.
+    """
+
+    def __init__(self, directory=DEFAULT_INSIGHTS_DIR):
+        self.directory = directory
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.getenv("ETSM_INSIGHTS_DIR", DEFAULT_INSIGHTS_DIR))
+
+    def versions(self):
+        """Stored versions, oldest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        )
+
+    def save(self, portfolio=None, accounts=None, now=None):
+        """Write a new snapshot and return its version"""
+        now = now or datetime.now(timezone.utc)
+        version = now.strftime("%Y%m%dT%H%M%S%fZ")
+        snapshot = {
+            "version": version,
+            "created_at": now.isoformat(),
+            "portfolio": portfolio,
+            "accounts": accounts or {},
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{version}.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_path, path)
+        return version
+
+    def load(self, version):
+        with open(os.path.join(self.directory, f"{version}.json")) as f:
+            return json.load(f)
+
+    def latest(self):
+        """Newest snapshot, or None if nothing has been precomputed"""
+        versions = self.versions()
+        return self.load(versions[-1]) if versions else None
+
+    def prune(self, keep):
+        """Delete all but the newest ``keep`` versions"""
+        for version in self.versions()[:-keep] if keep > 0 else []:
+            os.remove(os.path.join(self.directory, f"{version}.json"))
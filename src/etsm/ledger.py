@@ -0,0 +1,224 @@
+"""Token and cost ledger for Anthropic calls, plus a token budget."""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+DEFAULT_LEDGER_PATH = os.path.join(".etsm_cache", "ledger.sqlite")
+
+# USD per million tokens: (input, output). Prompt-cache writes are billed at
+# 1.25x and reads at 0.1x the input price.
+MODEL_PRICES = {
+    "claude-opus-4-20250514": (15.0, 75.0),
+    "claude-sonnet-4-20250514": (3.0, 15.0),
+    "claude-3-7-sonnet-20250219": (3.0, 15.0),
+    "claude-3-5-haiku-20241022": (0.8, 4.0),
+}
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    session TEXT NOT NULL,
+    model TEXT NOT NULL,
+    status INTEGER,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    cache_write_tokens INTEGER NOT NULL,
+    latency REAL NOT NULL,
+    cost REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calls_day ON calls (day);
+CREATE INDEX IF NOT EXISTS calls_session ON calls (session, day);
+"""
+
+TOTALS = """
+COUNT(*) AS calls,
+COALESCE(SUM(input_tokens), 0) AS input_tokens,
+COALESCE(SUM(output_tokens), 0) AS output_tokens,
+COALESCE(SUM(cache_read_tokens), 0) AS cache_read_tokens,
+COALESCE(SUM(cache_write_tokens), 0) AS cache_write_tokens,
+COALESCE(SUM(cost), 0) AS cost,
+COALESCE(AVG(latency), 0) AS avg_latency,
+COALESCE(SUM(output_tokens) / NULLIF(SUM(latency), 0), 0) AS output_tokens_per_s
+"""
+
+
+def cost_usd(
+    model, input_tokens, output_tokens, cache_read_tokens=0, cache_write_tokens=0
+):
+    """Cost of one call in USD; 0 for models without a known price"""
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (
+        input_tokens * input_price
+        + cache_write_tokens * input_price * CACHE_WRITE_MULTIPLIER
+        + cache_read_tokens * input_price * CACHE_READ_MULTIPLIER
+        + output_tokens * output_price
+    ) / 1_000_000
+
+
+def result_cost(result):
+    """Cost of a ClaudeResult; 0 for cached results and calls never sent"""
+    if result.cached or not result.attempts:
+        return 0.0
+    return cost_usd(
+        result.model,
+        result.input_tokens,
+        result.output_tokens,
+        result.cache_read_tokens,
+        result.cache_write_tokens,
+    )
+
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+
+class UsageLedger:
+    """SQLite ledger with one row per API call (response-cache hits are free
+    and not recorded). Shared by every session and process using the path."""
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls):
+        return cls(path=os.getenv("ETSM_LEDGER", DEFAULT_LEDGER_PATH))
+
+    def record(self, result, session="default", now=None):
+        """Append a ClaudeResult; returns its cost (0 for cached results)"""
+        if result.cached or not result.attempts:
+            return 0.0
+        now = time.time() if now is None else now
+        cost = result_cost(result)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO calls (created_at, day, session, model, status, "
+                "input_tokens, output_tokens, cache_read_tokens, "
+                "cache_write_tokens, latency, cost) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    now,
+                    _day(now),
+                    session,
+                    result.model,
+                    result.status,
+                    result.input_tokens,
+                    result.output_tokens,
+                    result.cache_read_tokens,
+                    result.cache_write_tokens,
+                    result.latency,
+                    cost,
+                ),
+            )
+        return cost
+
+    def _rows(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def totals(self, day=None, session=None, now=None):
+        """Totals for one day (default today), optionally for one session"""
+        day = day or _day(time.time() if now is None else now)
+        sql = f"SELECT {TOTALS} FROM calls WHERE day = ?"
+        params = [day]
+        if session is not None:
+            sql += " AND session = ?"
+            params.append(session)
+        return self._rows(sql, params)[0]
+
+    def daily(self, days=30):
+        """Per-day totals, newest first"""
+        return self._rows(
+            f"SELECT day, {TOTALS} FROM calls GROUP BY day ORDER BY day DESC LIMIT ?",
+            (days,),
+        )
+
+    def by_session(self, day=None, now=None):
+        """Per-session totals for one day (default today), costliest first"""
+        day = day or _day(time.time() if now is None else now)
+        return self._rows(
+            f"SELECT session, {TOTALS} FROM calls WHERE day = ? "
+            "GROUP BY session ORDER BY cost DESC",
+            (day,),
+        )
+
+    def tokens_used(self, session=None, now=None):
+        totals = self.totals(session=session, now=now)
+        return (
+            totals["input_tokens"]
+            + totals["output_tokens"]
+            + totals["cache_read_tokens"]
+            + totals["cache_write_tokens"]
+        )
+
+
+class TokenBudget:
+    """Daily and per-session token limits.
+
+    Once a limit is reached requests are either blocked or, with
+    ``action="downgrade"``, sent to the cheaper ``fallback_model``.
+    """
+
+    def __init__(
+        self,
+        daily_tokens=None,
+        session_tokens=None,
+        action="block",
+        fallback_model="claude-3-5-haiku-20241022",
+    ):
+        if action not in ("block", "downgrade"):
+            raise ValueError(f"Unknown budget action: {action!r}")
+        self.daily_tokens = daily_tokens
+        self.session_tokens = session_tokens
+        self.action = action
+        self.fallback_model = fallback_model
+
+    @classmethod
+    def from_env(cls):
+        """Budget from the ETSM_*_TOKEN_BUDGET and ETSM_BUDGET_* settings"""
+        daily = os.getenv("ETSM_DAILY_TOKEN_BUDGET")
+        session = os.getenv("ETSM_SESSION_TOKEN_BUDGET")
+        return cls(
+            daily_tokens=int(daily) if daily else None,
+            session_tokens=int(session) if session else None,
+            action=os.getenv("ETSM_BUDGET_ACTION", "block"),
+            fallback_model=os.getenv(
+                "ETSM_BUDGET_FALLBACK_MODEL", "claude-3-5-haiku-20241022"
+            ),
+        )
+
+    def check(self, ledger, session, model, now=None):
+        """``(model to use or None if blocked, reason or None)``"""
+        exceeded = None
+        if self.daily_tokens is not None:
+            used = ledger.tokens_used(now=now)
+            if used >= self.daily_tokens:
+                exceeded = f"daily token budget ({used:,} of {self.daily_tokens:,})"
+        if exceeded is None and self.session_tokens is not None:
+            used = ledger.tokens_used(session=session, now=now)
+            if used >= self.session_tokens:
+                exceeded = f"session token budget ({used:,} of {self.session_tokens:,})"
+        if exceeded is None:
+            return model, None
+        if self.action == "downgrade":
+            return (
+                self.fallback_model,
+                f"Over the {exceeded}; using {self.fallback_model}",
+            )
+        return None, f"Over the {exceeded}; request blocked"
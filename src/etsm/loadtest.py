@@ -0,0 +1,393 @@
+"""Multi-session load testing against a local mock Anthropic endpoint.
+
+Simulated sessions are Streamlit ``AppTest`` instances run on threads in
+this process, which is how a single ``streamlit run`` worker serves its
+users: every session shares the process, its caches and the GIL. Each
+session walks the sidebar pages and submits Account Analysis against
+``MockAnthropicServer``.
+"""
+
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+ANALYSIS_PAGE = "Account Analysis"
+ANALYZE_BUTTONS = ("🚀 Analyze Accounts", "🔄 Refresh Live")
+
+
+class MockAnthropicServer:
+    """Messages API stand-in with configurable latency and error rate.
+
+    Each request waits ``latency`` seconds (+/- ``jitter`` fraction); a
+    fraction ``error_rate`` of requests fail with a retryable 529. Streaming
+    requests get a short SSE event stream.
+    """
+
+    def __init__(self, latency=0.5, error_rate=0.0, jitter=0.2, port=0, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.jitter = jitter
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _draw(self):
+        with self._lock:
+            self.requests += 1
+            failed = self._rng.random() < self.error_rate
+            self.errors += failed
+            spread = self._rng.uniform(-self.jitter, self.jitter)
+        return failed, max(0.0, self.latency * (1 + spread))
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                request = json.loads(
+                    self.rfile.read(int(self.headers["content-length"]))
+                )
+                failed, delay = server._draw()
+                if failed:
+                    time.sleep(delay / 4)
+                    self.send_json(
+                        529,
+                        {
+                            "type": "error",
+                            "error": {
+                                "type": "overloaded_error",
+                                "message": "Overloaded",
+                            },
+                        },
+                    )
+                    return
+                usage = {
+                    "input_tokens": len(json.dumps(request["messages"])) // 4,
+                    "output_tokens": 40,
+                    "cache_read_input_tokens": 0,
+                    "cache_creation_input_tokens": 0,
+                }
+                text = ["Mock ", "strategic ", "analysis ", "for ", "load testing."]
+                if not request.get("stream"):
+                    time.sleep(delay)
+                    self.send_json(
+                        200,
+                        {
+                            "content": [{"type": "text", "text": "".join(text)}],
+                            "usage": usage,
+                            "stop_reason": "end_turn",
+                            "model": request["model"],
+                        },
+                    )
+                    return
+
+                self.send_response(200)
+                self.send_header("content-type", "text/event-stream")
+                self.end_headers()
+
+                def event(name, data):
+                    self.wfile.write(
+                        f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+                    )
+                    self.wfile.flush()
+
+                time.sleep(delay / 2)  # time to first token
+                message = {"model": request["model"], "usage": usage}
+                event("message_start", {"type": "message_start", "message": message})
+                for chunk in text:
+                    time.sleep(delay / 2 / len(text))
+                    delta = {"type": "text_delta", "text": chunk}
+                    event(
+                        "content_block_delta",
+                        {"type": "content_block_delta", "delta": delta},
+                    )
+                event(
+                    "message_delta",
+                    {
+                        "type": "message_delta",
+                        "delta": {"stop_reason": "end_turn"},
+                        "usage": {"output_tokens": usage["output_tokens"]},
+                    },
+                )
+                event("message_stop", {"type": "message_stop"})
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-anthropic", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def rss_bytes():
+    """Resident set size of this process (peak RSS where /proc is missing)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def latency_summary(seconds):
+    """Count, mean and p50/p95/p99/max in milliseconds"""
+    if not len(seconds):
+        return {"count": 0}
+    values = np.asarray(seconds) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": len(values),
+        "mean_ms": float(values.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(values.max()),
+    }
+
+
+@contextlib.contextmanager
+def shared_runtime():
+    """Keep AppTest's process-wide state valid for every concurrent session.
+
+    Each ``AppTest.run`` installs a mock ``Runtime`` singleton and turns on
+    the ``global.appTest`` option, and undoes both when it finishes, which
+    breaks reruns still in progress on other threads. While this is active
+    the option stays on and the most recently installed runtime stays
+    visible until another one replaces it.
+
+    This relies on Streamlit internals (checked against 1.65) and
+    raises RuntimeError naming what is missing when they change.
+    """
+    import streamlit
+
+    try:
+        from streamlit.runtime import Runtime
+        from streamlit.testing.v1.util import patch_config_options
+
+        original = Runtime.__dict__["instance"], Runtime.__dict__["exists"]
+        Runtime._instance
+    except (ImportError, KeyError, AttributeError) as e:
+        raise RuntimeError(
+            f"Load testing is not supported with Streamlit {streamlit.__version__}: "
+            f"the AppTest runtime internals it patches have changed ({e!r})"
+        ) from e
+    last = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            last[:] = [cls._instance]
+            return cls._instance
+        if last:
+            return last[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(last))
+    try:
+        with patch_config_options({"global.appTest": True}):
+            yield
+    finally:
+        Runtime.instance, Runtime.exists = original
+
+
+def simulate_session(
+    app_path, pages, rounds=3, think_time=0.0, analyze=True, seed=None
+):
+    """Drive one session; returns ``(app, samples)`` where each sample is
+    ``{"action", "seconds", "error"}``"""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    samples = []
+
+    def timed(action, run):
+        start = time.perf_counter()
+        error = None
+        try:
+            app = run()
+            if app.exception:
+                error = app.exception[0].message
+        except Exception as e:
+            error = repr(e)
+        samples.append(
+            {"action": action, "seconds": time.perf_counter() - start, "error": error}
+        )
+
+    at = AppTest.from_file(app_path, default_timeout=300)
+    timed("start", at.run)
+    for _ in range(rounds):
+        for page in rng.sample(pages, len(pages)):
+            if think_time:
+                time.sleep(rng.uniform(0, 2 * think_time))
+            timed(f"page:{page}", lambda: at.sidebar.selectbox[0].select(page).run())
+            if page == ANALYSIS_PAGE and analyze and not at.exception:
+                bypass = [box for box in at.checkbox if box.label == "Bypass cache"]
+                if bypass:
+                    bypass[0].check()
+                buttons = [b for b in at.button if b.label in ANALYZE_BUTTONS]
+                if buttons:
+                    timed("analyze", buttons[0].click().run)
+    return at, samples
+
+
+def isolated_environ(directory, base_url=None):
+    """Environment that keeps the app's ledger, caches and stores under
+    ``directory`` and, given ``base_url``, points it at that API endpoint"""
+    environ = {
+        "ETSM_LEDGER": os.path.join(directory, "ledger.sqlite"),
+        "ETSM_RESPONSE_CACHE": os.path.join(directory, "responses.sqlite"),
+        "ETSM_INSIGHTS_DIR": os.path.join(directory, "insights"),
+        "ETSM_STRATEGY_DB": os.path.join(directory, "strategies.sqlite"),
+    }
+    if base_url is not None:
+        environ["ANTHROPIC_BASE_URL"] = base_url
+        environ["ANTHROPIC_API_KEY"] = os.getenv(
+            "ETSM_LOADTEST_API_KEY", "loadtest-key"
+        )
+    return environ
+
+
+def run_load_test(
+    app_path,
+    pages,
+    sessions=10,
+    rounds=3,
+    latency=0.5,
+    error_rate=0.0,
+    think_time=0.0,
+    ramp_up=0.0,
+    analyze=True,
+    seed=0,
+):
+    """Run ``sessions`` concurrent sessions against a mock endpoint and
+    summarize rerun latency, throughput, errors and memory per session"""
+    apps = []
+    results = []
+
+    def worker(index):
+        time.sleep(ramp_up * index / max(sessions, 1))
+        app, samples = simulate_session(
+            app_path, pages, rounds, think_time, analyze, seed=seed + index
+        )
+        apps.append(app)  # keep sessions alive for the memory reading
+        return samples
+
+    saved = dict(os.environ)
+    with tempfile.TemporaryDirectory(prefix="etsm-loadtest-") as directory:
+        with MockAnthropicServer(latency, error_rate, seed=seed) as server:
+            os.environ.update(isolated_environ(directory, server.url))
+            try:
+                # A warm-up session loads modules and shared caches, so the
+                # baseline excludes what every session shares
+                simulate_session(app_path, pages[:1], rounds=0, analyze=False)
+                baseline = rss_bytes()
+                started = time.perf_counter()
+                with shared_runtime(), ThreadPoolExecutor(sessions) as pool:
+                    for samples in pool.map(worker, range(sessions)):
+                        results.extend(samples)
+                elapsed = time.perf_counter() - started
+                peak = rss_bytes()
+            finally:
+                os.environ.clear()
+                os.environ.update(saved)
+
+    by_action = {}
+    for sample in results:
+        name = "page" if sample["action"].startswith("page:") else sample["action"]
+        by_action.setdefault(name, []).append(sample["seconds"])
+        if name == "page":
+            by_action.setdefault(sample["action"], []).append(sample["seconds"])
+    errors = [s for s in results if s["error"]]
+    return {
+        "sessions": sessions,
+        "rounds": rounds,
+        "reruns": len(results),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(results) / elapsed if elapsed else 0.0,
+        "errors": len(errors),
+        "error_samples": sorted({s["error"] for s in errors})[:5],
+        "api_requests": server.requests,
+        "api_errors": server.errors,
+        "rss_baseline_mb": baseline / 2**20,
+        "rss_mb": peak / 2**20,
+        "memory_per_session_mb": (peak - baseline) / 2**20 / max(sessions, 1),
+        "latency": {
+            "all": latency_summary([s["seconds"] for s in results]),
+            **{
+                name: latency_summary(values)
+                for name, values in sorted(by_action.items())
+            },
+        },
+    }
+
+
+def format_report(report):
+    """Plain-text summary table of a ``run_load_test`` report"""
+    lines = [
+        f"{report['sessions']} sessions x {report['rounds']} rounds: "
+        f"{report['reruns']} reruns in {report['elapsed_s']:.1f}s "
+        f"({report['throughput_rps']:.2f} reruns/s), {report['errors']} errors",
+        f"Mock API: {report['api_requests']} requests, "
+        f"{report['api_errors']} injected errors",
+        f"RSS {report['rss_baseline_mb']:.0f} -> {report['rss_mb']:.0f} MB "
+        f"(~{report['memory_per_session_mb']:.1f} MB per session)",
+        "",
+        f"{'rerun':<32} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for name, stats in report["latency"].items():
+        if not stats["count"]:
+            continue
+        lines.append(
+            f"{name:<32} {stats['count']:>6} {stats['p50_ms']:>9.1f} "
+            f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}"
+        )
+    for error in report["error_samples"]:
+        lines.append(f"error: {error}")
+    return "\n".join(lines)
@@ -0,0 +1,91 @@
+"""Per-account usage metrics shared by every dashboard page."""
+
+import numpy as np
+
+# Growth thresholds behind the Account Overview health labels
+HEALTHY_GROWTH = 0.1
+DECLINING_GROWTH = -0.05
+HEALTH_LABELS = ["✅ Healthy Growth", "⚠️ Declining Usage", "🔄 Stable Usage"]
+
+# Aggregations computed per company, skipped when their column was not loaded
+METRIC_AGGREGATIONS = {
+    "first_calls": ("API_Calls", "first"),
+    "last_calls": ("API_Calls", "last"),
+    "total_calls": ("API_Calls", "sum"),
+    "mean_calls": ("API_Calls", "mean"),
+    "total_revenue": ("Revenue", "sum"),
+    "use_cases": ("Use_Cases", "max"),
+}
+
+
+def compute_account_metrics(usage_df):
+    """One row per company from a single grouped pass over ``usage_df``.
+
+    Rows are expected in month order within each company (see
+    ``etsm.sources.sort_usage``; snapshots are always sorted). ``growth`` is
+    the first-to-last-month change in API calls.
+    """
+    aggregations = {
+        name: spec
+        for name, spec in METRIC_AGGREGATIONS.items()
+        if spec[0] in usage_df.columns
+    }
+    metrics = usage_df.groupby("Company", observed=True).agg(**aggregations)
+    metrics["growth"] = (metrics["last_calls"] - metrics["first_calls"]) / metrics[
+        "first_calls"
+    ]
+    return metrics
+
+
+def classify_health(metrics):
+    """Health label for every account in one vectorized pass"""
+    growth = metrics["growth"].to_numpy()
+    health = metrics[["last_calls", "growth"]].copy()
+    health["health"] = np.select(
+        [growth > HEALTHY_GROWTH, growth < DECLINING_GROWTH],
+        HEALTH_LABELS[:2],
+        default=HEALTH_LABELS[2],
+    )
+    return health
+
+
+def _mean_growth(calls):
+    """Mean first-to-last-month growth of a company x month calls matrix"""
+    first = calls.bfill(axis=1).iloc[:, 0]
+    last = calls.ffill(axis=1).iloc[:, -1]
+    return ((last - first) / first).mean()
+
+
+def kpi_deltas(monthly):
+    """Recent changes behind the KPI tiles from company x month buckets.
+
+    Calls and revenue compare the latest three months with the three before;
+    active accounts compare the latest month with the previous, and
+    ``growth_1m`` is the change in mean account growth (as a fraction, so
+    0.02 is two percentage points) that the latest month brought.
+    """
+    totals = monthly.groupby(level="Month", sort=True)[["API_Calls", "Revenue"]].sum()
+    active = (monthly["API_Calls"] > 0).groupby(level="Month", sort=True).sum()
+
+    def change(values, window):
+        if len(values) < 2 * window:
+            return None
+        recent, previous = values[-window:].sum(), values[-2 * window : -window].sum()
+        return recent / previous - 1 if previous else None
+
+    calls = totals["API_Calls"].to_numpy(float)
+    by_month = monthly["API_Calls"].unstack("Month").sort_index(axis=1)
+    growth_1m = None
+    if by_month.shape[1] > 2:
+        now, previous = _mean_growth(by_month), _mean_growth(by_month.iloc[:, :-1])
+        if np.isfinite(now) and np.isfinite(previous):
+            growth_1m = float(now - previous)
+    return {
+        "calls_3m": change(calls, 3),
+        "revenue_3m": change(totals["Revenue"].to_numpy(float), 3),
+        "calls_1m": change(calls, 1),
+        "growth_1m": growth_1m,
+        "active_1m": (
+            int(active.iloc[-1] - active.iloc[-2]) if len(active) > 1 else None
+        ),
+    }
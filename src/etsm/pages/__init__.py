@@ -0,0 +1,18 @@
+"""Dashboard pages, imported only when selected.
+
+Each page module exposes ``render(api_key)``.
+"""
+
+import importlib
+
+PAGES = {
+    "Account Analysis": "account_analysis",
+    "API Usage Dashboard": "api_usage",
+    "Strategy Boards": "strategy_boards",
+    "Account Overview": "account_overview",
+}
+
+
+def render_page(name, api_key):
+    """Import the selected page's module on first use and render it"""
+    importlib.import_module(f"etsm.pages.{PAGES[name]}").render(api_key)
@@ -0,0 +1,289 @@
+"""Account Analysis: portfolio and per-account insights from the API."""
+
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+from etsm.batch import RateLimiter, run_batch
+from etsm.client import DEFAULT_MODEL
+from etsm.insights import InsightStore, prompt_hash
+from etsm.ledger import TokenBudget, result_cost
+from etsm.prompts import (
+    PORTFOLIO_QUESTION,
+    build_account_prompts,
+    build_portfolio_context,
+    estimate_tokens,
+)
+from etsm.sources import USAGE_COLUMNS
+from etsm.ui import (
+    cached_aggregate,
+    current_snapshot,
+    get_anthropic_client,
+    get_ledger,
+    load_usage_data,
+    render_response_card,
+)
+
+
+def budget_notice(model, note):
+    """Warn about a downgrade, or explain why a request was blocked"""
+    if note:
+        (st.warning if model else st.error)(f"💰 {note}")
+
+
+def render_usage_and_cost(ledger, session):
+    """Today's spend for this session and everyone, plus the daily history"""
+    with st.expander("💰 Usage & cost"):
+        mine, everyone = ledger.totals(session=session), ledger.totals()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("This session today", f"${mine['cost']:,.4f}")
+        col2.metric(
+            "Session tokens", f"{mine['input_tokens'] + mine['output_tokens']:,}"
+        )
+        col3.metric("All sessions today", f"${everyone['cost']:,.4f}")
+        col4.metric("Output tokens / s", f"{everyone['output_tokens_per_s']:,.1f}")
+        daily = ledger.daily(days=30)
+        if daily:
+            st.markdown("**Per day**")
+            st.dataframe(pd.DataFrame(daily).round(4), hide_index=True)
+            st.markdown("**Per session today**")
+            st.dataframe(pd.DataFrame(ledger.by_session()).round(4), hide_index=True)
+
+
+def render(api_key):
+    snapshot = current_snapshot()
+    usage_df, account_metrics, _ = load_usage_data(snapshot, USAGE_COLUMNS)
+
+    st.subheader("📊 Account Analysis")
+
+    if not api_key:
+        st.warning(
+            "⚠️ API key required for account analysis. Please set up your API key first."
+        )
+    else:
+        st.markdown("""
+        ### AI-Powered Strategic Insights
+        
+        Analyze account data and generate strategic recommendations for account management and growth opportunities.
+        """)
+
+        # Shared account context, sent as a cached prompt prefix
+        health = snapshot.health
+        context = cached_aggregate(
+            "portfolio_context",
+            snapshot.version,
+            account_metrics,
+            lambda metrics: build_portfolio_context(metrics.join(health)),
+        )
+        with st.expander(
+            f"Account context sent with every analysis "
+            f"(~{estimate_tokens(context):,} tokens)"
+        ):
+            st.code(context, language="text")
+
+        # Prompt input
+        prompt = st.text_area(
+            "Account Analysis Prompt:",
+            value=PORTFOLIO_QUESTION,
+            height=200,
+            help="Customize the prompt for different account analysis scenarios",
+        )
+
+        # Use Claude Sonnet 4 model
+        model = DEFAULT_MODEL
+
+        # Every live call is recorded; the budget may block or downgrade it
+        ledger = get_ledger()
+        session = st.session_state.setdefault("ledger_session", uuid.uuid4().hex[:8])
+        # The ledger hook also charges calls that finish after a rerun or an
+        # early stop has abandoned the page
+        client = get_anthropic_client(api_key).with_hooks(
+            lambda result: ledger.record(result, session)
+        )
+        budget = TokenBudget.from_env()
+
+        stream_response = st.toggle(
+            "Stream response",
+            value=True,
+            help="Render tokens as they arrive instead of waiting for the full analysis",
+        )
+        bypass_cache = st.checkbox(
+            "Bypass cache",
+            value=False,
+            help="Always call the API; the fresh analysis replaces any cached copy",
+        )
+
+        # Latest precomputed insight (see src/precompute.py), shown without a live call
+        insights = InsightStore.from_env().latest()
+        precomputed = insights["portfolio"] if insights else None
+
+        # Generate button
+        analyze = st.button(
+            "🔄 Refresh Live" if precomputed else "🚀 Analyze Accounts",
+            type="primary",
+        )
+        if precomputed and not analyze:
+            st.markdown("### 📊 Latest Precomputed Analysis")
+            render_response_card(st.empty(), precomputed["text"])
+            stale = (
+                " • the prompt has changed since; refresh live for a current analysis"
+                if precomputed["prompt_hash"] != prompt_hash(prompt, context)
+                else ""
+            )
+            st.caption(
+                f"Precomputed {insights['created_at']} with "
+                f"{precomputed['model']}{stale}"
+            )
+
+        if analyze:
+            model, budget_note = budget.check(ledger, session, model)
+            budget_notice(model, budget_note)
+            if model and prompt.strip():
+                # Display results
+                col1, col2 = st.columns([1, 1])
+                with col1:
+                    st.markdown("### 📝 Prompt")
+                    st.markdown(
+                        f"""
+                    <div class="prompt-card">
+                        <strong>Model:</strong> {model}<br>
+                        <strong>Context:</strong> shared account data (cached prefix)<br>
+                        <strong>Prompt:</strong><br>
+                        {prompt}
+                    </div>
+                    """,
+                        unsafe_allow_html=True,
+                    )
+                with col2:
+                    st.markdown("### 📊 Strategic Analysis")
+                    response_slot = st.empty()
+
+                if stream_response:
+                    stream = client.stream_message(
+                        prompt,
+                        model=model,
+                        use_cache=not bypass_cache,
+                        context=context,
+                    )
+                    streamed = ""
+                    for chunk in stream:
+                        streamed += chunk
+                        render_response_card(response_slot, streamed)
+                    result = stream.result
+                else:
+                    with st.spinner("Calling Anthropic API..."):
+                        result = client.create_message(
+                            prompt,
+                            model=model,
+                            use_cache=not bypass_cache,
+                            context=context,
+                        )
+
+                if result.ok:
+                    response = result.text
+                else:
+                    response = "\n\n".join(filter(None, [result.text, result.error]))
+                render_response_card(response_slot, response)
+                raw_response = result.raw or result.error
+                cost = result_cost(result)
+
+                first_token = (
+                    f"{result.time_to_first_token:.2f}s to first token • "
+                    if result.time_to_first_token is not None
+                    else ""
+                )
+                source = "Served from cache • " if result.cached else ""
+                st.caption(
+                    f"{source}Status {result.status} • {first_token}"
+                    f"{result.latency:.2f}s total • "
+                    f"{result.attempts} attempt(s) • "
+                    f"stop reason: {result.stop_reason} • "
+                    f"{result.input_tokens:,} input / "
+                    f"{result.output_tokens:,} output tokens • "
+                    f"prompt cache: {result.cache_read_tokens:,} read / "
+                    f"{result.cache_write_tokens:,} written • ${cost:.4f}"
+                )
+
+                # Debug info (collapsed by default)
+                with st.expander("Show raw API response (debug)"):
+                    st.code(raw_response, language="json")
+            elif model:
+                st.error("Please enter a prompt before generating.")
+
+        cache_stats = client.cache.stats()
+        st.caption(
+            f"Response cache: {cache_stats['hits']:,} hits / "
+            f"{cache_stats['misses']:,} misses "
+            f"({cache_stats['hit_rate']:.0%} hit rate) • "
+            f"{cache_stats['entries']:,} cached analyses"
+        )
+
+        # Per-account batch analysis
+        st.markdown("### 🔁 Per-Account Analysis")
+        st.markdown(
+            "Analyze every account separately, several at a time, within the "
+            "API rate limits. Results appear as each account completes."
+        )
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            max_workers = st.slider("Concurrent requests", 1, 32, 8)
+        with col2:
+            requests_per_minute = st.number_input(
+                "Requests / minute", min_value=1, value=50, step=10
+            )
+        with col3:
+            tokens_per_minute = st.number_input(
+                "Tokens / minute", min_value=1000, value=40000, step=5000
+            )
+
+        analyze_each = st.button("🚀 Analyze Each Account")
+        if analyze_each:
+            batch_model, budget_note = budget.check(ledger, session, model)
+            budget_notice(batch_model, budget_note)
+        if not analyze_each:
+            if insights and insights["accounts"]:
+                st.dataframe(
+                    pd.DataFrame(
+                        [
+                            {"Account": company, "Analysis": record["text"]}
+                            for company, record in insights["accounts"].items()
+                        ]
+                    ),
+                    use_container_width=True,
+                )
+                st.caption(f"Precomputed {insights['created_at']}")
+        elif batch_model:
+            account_prompts = cached_aggregate(
+                "account_prompts", snapshot.version, usage_df, build_account_prompts
+            )
+            progress = st.progress(0.0, text="Starting per-account analysis...")
+            table_slot = st.empty()
+            rows = []
+            for company, result in run_batch(
+                client,
+                account_prompts,
+                model=batch_model,
+                max_workers=max_workers,
+                limiter=RateLimiter(requests_per_minute, tokens_per_minute),
+                use_cache=not bypass_cache,
+            ):
+                rows.append(
+                    {
+                        "Account": company,
+                        "Status": "Cached" if result.cached else result.status,
+                        "Latency (s)": round(result.latency, 2),
+                        "Tokens": result.input_tokens + result.output_tokens,
+                        "Analysis": result.text if result.ok else result.error,
+                    }
+                )
+                progress.progress(
+                    len(rows) / len(account_prompts),
+                    text=f"{len(rows)} of {len(account_prompts)} accounts analyzed",
+                )
+                table_slot.dataframe(pd.DataFrame(rows), use_container_width=True)
+                if budget.check(ledger, session, batch_model)[0] is None:
+                    st.error("💰 Token budget reached; remaining accounts skipped")
+                    break
+
+        render_usage_and_cost(ledger, session)
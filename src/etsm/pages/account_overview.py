@@ -0,0 +1,122 @@
+"""Account Overview: per-account totals and paginated health indicators."""
+
+import pandas as pd
+import streamlit as st
+
+from etsm.grid import page_count, paginate, query_frame
+from etsm.health import HEALTH_STATES
+from etsm.sources import USAGE_COLUMNS
+from etsm.ui import current_snapshot, load_usage_data, render_grid
+
+
+def render(api_key):
+    snapshot = current_snapshot()
+    _, _, rollups = load_usage_data(snapshot, USAGE_COLUMNS)
+
+    st.subheader("👥 Account Overview")
+
+    # Account summary table
+    company_rollup = rollups.by_company()
+    account_summary = (
+        pd.DataFrame(
+            {
+                "Total API Calls": company_rollup["API_Calls"],
+                "Avg Monthly Calls": company_rollup["API_Calls"]
+                / company_rollup["Months"],
+                "Total Revenue": company_rollup["Revenue"],
+                "Use Cases": company_rollup["Use_Cases"],
+            }
+        )
+        .round(2)
+        .reset_index()
+    )
+
+    st.dataframe(account_summary, use_container_width=True)
+
+    # Account health indicators
+    st.subheader("🏥 Account Health Indicators")
+
+    health = snapshot.health
+    counts = health["health"].value_counts()
+    for col, label in zip(st.columns(len(HEALTH_STATES)), HEALTH_STATES):
+        col.metric(label, f"{counts.get(label, 0):,}")
+
+    # Filtering, sorting and paging run here so only one page reaches the browser
+    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
+    with col1:
+        statuses = st.multiselect("Health", HEALTH_STATES, default=[])
+    with col2:
+        search = st.text_input("Search accounts", "")
+    with col3:
+        sort_by = st.selectbox(
+            "Sort by",
+            [
+                "Health Score",
+                "Rolling Growth",
+                "Volatility",
+                "Current Usage",
+                "Account",
+            ],
+            index=0,
+        )
+    with col4:
+        ascending = st.toggle("Ascending", value=True)
+
+    health_table = (
+        health.drop(columns="latest_z")
+        .reset_index()
+        .rename(
+            columns={
+                "Company": "Account",
+                "current_usage": "Current Usage",
+                "rolling_growth": "Rolling Growth",
+                "volatility": "Volatility",
+                "anomalies": "Anomalies",
+                "score": "Health Score",
+                "health": "Health",
+            }
+        )
+    )
+    view = query_frame(
+        health_table,
+        filters={"Health": statuses},
+        search=search,
+        search_column="Account",
+        sort_by=sort_by,
+        ascending=ascending,
+    )
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+    with col2:
+        page_number = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count(len(view), page_size),
+            value=1,
+            step=1,
+        )
+    page_rows, pages = paginate(view, int(page_number), page_size)
+    page_rows = page_rows.assign(
+        **{
+            "Rolling Growth": (page_rows["Rolling Growth"] * 100).round(1),
+            "Volatility": (page_rows["Volatility"] * 100).round(1),
+            "Health Score": page_rows["Health Score"].round(1),
+        }
+    ).rename(
+        columns={"Rolling Growth": "Rolling Growth (%)", "Volatility": "Volatility (%)"}
+    )
+
+    render_grid(page_rows)
+    st.caption(
+        "Rolling growth compares the last three months with the three before; "
+        "volatility is the spread of month-over-month changes; anomalies are "
+        "months whose (seasonally adjusted) change is a robust-z outlier. The "
+        "health score (0–100) weighs growth, stability and recent anomalies."
+    )
+    first_row = (int(page_number) - 1) * page_size
+    st.caption(
+        f"Showing {first_row + 1 if len(view) else 0:,}–{first_row + len(page_rows):,} "
+        f"of {len(view):,} accounts (page {int(page_number)} of {pages})"
+    )
@@ -0,0 +1,171 @@
+"""API Usage Dashboard: KPIs, usage trends and per-company comparisons."""
+
+import pandas as pd
+import streamlit as st
+
+from etsm.figures import forecast_band, ranked_bar, usage_trend
+from etsm.forecast import HORIZONS, INTERVAL_LEVEL, future_months, portfolio_forecast
+from etsm.ui import cached_figure, current_snapshot, load_usage_data
+
+COLUMNS = ["Company", "Month", "API_Calls", "Revenue"]
+
+
+def delta_text(change, period):
+    return None if change is None else f"{change:+.1%} {period}"
+
+
+def render_forecast(snapshot):
+    st.subheader("🔮 Usage Forecast")
+
+    forecast = snapshot.forecast
+    monthly = (
+        snapshot.rollups.monthly()
+        .groupby(level="Month", sort=True)[["API_Calls", "Revenue"]]
+        .sum()
+    )
+    future = future_months(monthly.index[-1], range(1, max(HORIZONS) + 1))
+    portfolio = {
+        measure: portfolio_forecast(forecast[measure])
+        for measure in ("API_Calls", "Revenue")
+    }
+
+    for col, h in zip(st.columns(len(HORIZONS)), HORIZONS):
+        calls = portfolio["API_Calls"]
+        revenue = portfolio["Revenue"]
+        last_calls = monthly["API_Calls"].iloc[-1]
+        col.metric(
+            f"API Calls in {future[h - 1]} (+{h}m)",
+            f"{calls['point'][h - 1]:,.0f}",
+            delta=delta_text(
+                calls["point"][h - 1] / last_calls - 1 if last_calls else None,
+                "vs last month",
+            ),
+        )
+        col.caption(
+            f"{INTERVAL_LEVEL:.0%} interval {calls['lower'][h - 1]:,.0f}–"
+            f"{calls['upper'][h - 1]:,.0f} calls; revenue "
+            f"${revenue['point'][h - 1]:,.0f} "
+            f"(${revenue['lower'][h - 1]:,.0f}–${revenue['upper'][h - 1]:,.0f})"
+        )
+
+    fig = cached_figure(
+        "usage_forecast",
+        snapshot.version,
+        lambda: forecast_band(
+            monthly["API_Calls"],
+            future,
+            portfolio["API_Calls"],
+            "Total API Calls: Actual and Forecast",
+        ),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander("Per-account projections"):
+        calls = forecast["API_Calls"]
+        columns = {"Account": forecast["accounts"]}
+        for h in HORIZONS:
+            columns[f"+{h}m Calls"] = calls["point"][:, h - 1].round()
+        columns[f"+{max(HORIZONS)}m Low"] = calls["lower"][:, -1].round()
+        columns[f"+{max(HORIZONS)}m High"] = calls["upper"][:, -1].round()
+        columns[f"+{max(HORIZONS)}m Revenue"] = forecast["Revenue"]["point"][
+            :, -1
+        ].round()
+        projections = pd.DataFrame(columns)
+        # Largest projected movers first; very large portfolios are truncated
+        change = (
+            projections[f"+{max(HORIZONS)}m Calls"] - projections["+1m Calls"]
+        ).abs()
+        shown = projections.loc[change.sort_values(ascending=False).index[:500]]
+        st.dataframe(shown, hide_index=True, use_container_width=True)
+        if len(shown) < len(projections):
+            st.caption(
+                f"Showing the 500 largest projected changes of {len(projections):,}"
+            )
+
+
+def render(api_key):
+    snapshot = current_snapshot()
+    usage_df, account_metrics, rollups = load_usage_data(snapshot, COLUMNS)
+
+    st.subheader("📈 API Usage Analytics")
+
+    # Key metrics, with deltas computed from the latest months
+    deltas = snapshot.kpi_deltas
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        total_usage = rollups.totals["api_calls"]
+        st.metric(
+            "Total API Calls",
+            f"{total_usage:,}",
+            delta=delta_text(deltas["calls_3m"], "last 3 months"),
+        )
+
+    with col2:
+        avg_growth = account_metrics["growth"].mean()
+        growth_change = deltas["growth_1m"]
+        st.metric(
+            "Average Growth",
+            f"{avg_growth:.1%}",
+            delta=(
+                None
+                if growth_change is None
+                else f"{growth_change * 100:+.1f} pp last month"
+            ),
+        )
+
+    with col3:
+        active_accounts = rollups.totals["companies"]
+        active_change = deltas["active_1m"]
+        st.metric(
+            "Active Accounts",
+            active_accounts,
+            delta=None if active_change is None else f"{active_change:+,} last month",
+        )
+
+    with col4:
+        total_revenue = rollups.totals["revenue"]
+        st.metric(
+            "Total Revenue",
+            f"${total_revenue:,.0f}",
+            delta=delta_text(deltas["revenue_3m"], "last 3 months"),
+        )
+
+    # Usage trends
+    st.subheader("📊 Usage Trends by Company")
+
+    top_n = st.slider("Companies shown", 1, 25, 10, help="The rest are summed")
+    usage_version = snapshot.version
+    fig = cached_figure(
+        "usage_trend",
+        usage_version,
+        lambda: usage_trend(usage_df, top_n),
+        top_n,
+        tuple(usage_df.columns),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Usage comparison
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = cached_figure(
+            "current_usage",
+            usage_version,
+            lambda: ranked_bar(
+                account_metrics["last_calls"], "Current API Usage by Company", "Blues"
+            ),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = cached_figure(
+            "growth_rates",
+            usage_version,
+            lambda: ranked_bar(
+                account_metrics["growth"], "Growth Rates by Company", "RdYlGn"
+            ),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    render_forecast(snapshot)
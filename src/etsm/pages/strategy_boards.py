@@ -0,0 +1,236 @@
+"""Strategy Boards: filterable strategy pipeline with status overview."""
+
+import pandas as pd
+import streamlit as st
+
+from etsm.data import STRATEGY_PRIORITIES, STRATEGY_STATUSES
+from etsm.figures import (
+    PRIORITY_COLORS,
+    STATUS_COLORS,
+    distribution_bar,
+    distribution_pie,
+)
+from etsm.grid import page_count
+from etsm.ui import cached_figure, get_strategy_store, render_grid
+
+
+def share(count, total):
+    return f"{count / total:.0%} of strategies" if total else None
+
+
+def strategy_fields(prefix, record=None):
+    """Form inputs for one strategy, prefilled from ``record``"""
+    record = record or {}
+
+    def choice(label, options, column):
+        value = record.get(column)
+        options = options if value in options or value is None else options + [value]
+        index = options.index(value) if value in options else 0
+        return st.selectbox(label, options, index=index, key=f"{prefix}_{column}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        account = st.text_input(
+            "Account", record.get("Account", ""), key=f"{prefix}_Account"
+        )
+        strategy = st.text_input(
+            "Strategy", record.get("Strategy", ""), key=f"{prefix}_Strategy"
+        )
+        status = choice("Status", STRATEGY_STATUSES, "Status")
+        priority = choice("Priority", STRATEGY_PRIORITIES, "Priority")
+    with col2:
+        revenue = st.number_input(
+            "Expected Revenue ($)",
+            min_value=0,
+            value=int(record.get("Expected_Revenue", 0)),
+            step=5000,
+            key=f"{prefix}_Expected_Revenue",
+        )
+        timeline = st.text_input(
+            "Timeline", record.get("Timeline", ""), key=f"{prefix}_Timeline"
+        )
+        stakeholder = st.text_input(
+            "Key Stakeholder",
+            record.get("Key_Stakeholder", ""),
+            key=f"{prefix}_Key_Stakeholder",
+        )
+    description = st.text_area(
+        "Description", record.get("Description", ""), key=f"{prefix}_Description"
+    )
+    return {
+        "Account": account.strip(),
+        "Strategy": strategy.strip(),
+        "Status": status,
+        "Priority": priority,
+        "Expected_Revenue": revenue,
+        "Timeline": timeline.strip(),
+        "Key_Stakeholder": stakeholder.strip(),
+        "Description": description.strip(),
+    }
+
+
+def render_editors(store):
+    """Create and update forms; edits are written straight to the store"""
+    with st.expander("➕ New strategy"):
+        with st.form("create_strategy", clear_on_submit=True):
+            values = strategy_fields("create")
+            if st.form_submit_button("Create strategy"):
+                if values["Account"] and values["Strategy"]:
+                    strategy_id = store.create(**values)
+                    st.success(f"Created strategy #{strategy_id}")
+                else:
+                    st.error("Account and Strategy are required")
+
+    with st.expander("✏️ Update strategy"):
+        strategy_id = st.number_input("Strategy ID", min_value=1, step=1, value=1)
+        record = store.get(int(strategy_id))
+        if record is None:
+            st.info(f"No strategy #{int(strategy_id)}")
+            return
+        with st.form(f"update_strategy_{record['id']}"):
+            values = strategy_fields(f"update_{record['id']}", record)
+            if st.form_submit_button("Save changes"):
+                changes = {
+                    column: value
+                    for column, value in values.items()
+                    if value != record[column]
+                }
+                if not values["Account"] or not values["Strategy"]:
+                    st.error("Account and Strategy are required")
+                elif changes:
+                    store.update(record["id"], **changes)
+                    st.success(f"Updated strategy #{record['id']}")
+
+
+def render(api_key):
+    store = get_strategy_store()
+
+    st.subheader("🎯 Strategy Boards")
+
+    # Filters, sorting, paging and totals run as indexed SQL queries
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        account_search = st.text_input("Account", "", placeholder="Search accounts")
+    with col2:
+        statuses = st.multiselect("Status", store.distinct("Status"))
+    with col3:
+        priorities = st.multiselect("Priority", store.distinct("Priority"))
+    with col4:
+        timelines = st.multiselect("Timeline", store.distinct("Timeline"))
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        sort_by = st.selectbox(
+            "Sort by",
+            ["Expected_Revenue", "Account", "Status", "Priority", "Timeline"],
+        )
+    with col2:
+        ascending = st.toggle("Ascending", value=False)
+
+    # Edits land before the totals and the board are queried below
+    render_editors(store)
+
+    filters = {"Status": statuses, "Priority": priorities, "Timeline": timelines}
+    totals = store.totals(filters, account_search)
+
+    # Strategy overview; deltas describe the filtered view (no history is kept)
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        urgent = sum(
+            totals["Priority"].get(p, {}).get("revenue", 0)
+            for p in ("Critical", "High")
+        )
+        st.metric(
+            "Total Pipeline",
+            f"${totals['revenue']:,}",
+            delta=f"${urgent:,} Critical/High",
+            delta_color="off",
+        )
+
+    with col2:
+        in_progress = totals["Status"].get("In Progress", {}).get("count", 0)
+        st.metric(
+            "In Progress",
+            in_progress,
+            delta=share(in_progress, totals["count"]),
+            delta_color="off",
+        )
+
+    with col3:
+        completed = totals["Status"].get("Completed", {}).get("count", 0)
+        st.metric(
+            "Completed",
+            completed,
+            delta=share(completed, totals["count"]),
+            delta_color="off",
+        )
+
+    # Strategy board
+    st.subheader("📋 Active Strategies")
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+    with col2:
+        page_number = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count(totals["count"], page_size),
+            value=1,
+            step=1,
+        )
+    page_rows = store.query(
+        filters,
+        account_search,
+        sort_by=sort_by,
+        ascending=ascending,
+        page=int(page_number),
+        page_size=page_size,
+    )
+    render_grid(page_rows, height=500)
+    first_row = (int(page_number) - 1) * page_size
+    st.caption(
+        f"Showing {first_row + 1 if len(page_rows) else 0:,}–"
+        f"{first_row + len(page_rows):,} of {totals['count']:,} matching strategies "
+        f"({store.count():,} in total)"
+    )
+
+    # Strategy status visualization
+    st.subheader("📊 Strategy Status Overview")
+
+    col1, col2 = st.columns(2)
+
+    def value_counts(column):
+        return pd.Series(
+            {value: group["count"] for value, group in totals[column].items()}
+        ).sort_values(ascending=False)
+
+    # The charts depend only on the counts, so searches and filters that
+    # match the same totals share one cached figure
+    status_counts = value_counts("Status")
+    priority_counts = value_counts("Priority")
+
+    with col1:
+        fig = cached_figure(
+            "strategy_status",
+            None,
+            lambda: distribution_pie(
+                status_counts, "Strategy Status Distribution", STATUS_COLORS
+            ),
+            *status_counts.items(),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = cached_figure(
+            "strategy_priority",
+            None,
+            lambda: distribution_bar(
+                priority_counts,
+                "Strategy Priority Distribution",
+                PRIORITY_COLORS,
+            ),
+            *priority_counts.items(),
+        )
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,170 @@
+"""Prompt builders for Claude account analyses."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from etsm.metrics import DECLINING_GROWTH, HEALTHY_GROWTH
+
+# Token budget for the shared portfolio context
+DEFAULT_CONTEXT_TOKENS = int(os.getenv("ETSM_CONTEXT_TOKENS", 2000))
+
+ACCOUNT_PROMPT_TEMPLATE = """
+As an ETSM, analyze this account and provide a short strategic assessment:
+
+Account: {company}
+Monthly API Calls: {monthly_calls}
+Growth (first to last month): {growth:.1%}
+Current Usage: {current_usage:,}
+Total Revenue: ${revenue:,.0f}
+Active Use Cases: {use_cases}
+
+Respond in at most five bullet points covering health, risk, the biggest
+growth opportunity, the single next action and when to take it.
+"""
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) for budgeting"""
+    return len(text) // 4 + 1
+
+
+def build_account_prompt(company, rows):
+    """Prompt for a single company from its rows of usage data"""
+    calls = rows["API_Calls"]
+    first, last = calls.iloc[0], calls.iloc[-1]
+    return ACCOUNT_PROMPT_TEMPLATE.format(
+        company=company,
+        monthly_calls=", ".join(
+            f"{month}: {value:,}" for month, value in zip(rows["Month"], calls)
+        ),
+        growth=(last - first) / first if first else 0.0,
+        current_usage=last,
+        revenue=rows["Revenue"].sum(),
+        use_cases=rows["Use_Cases"].iloc[-1],
+    )
+
+
+def build_account_prompts(usage_df):
+    """One prompt per company present in ``usage_df``, keyed by company name"""
+    return {
+        company: build_account_prompt(company, rows)
+        for company, rows in usage_df.groupby("Company", sort=False, observed=True)
+    }
+
+
+PORTFOLIO_QUESTION = """
+Provide strategic analysis on:
+1. **Resource Allocation**: Where to invest time and budget
+2. **Risk Management**: Which accounts need immediate attention
+3. **Growth Strategy**: Which opportunities to prioritize
+4. **Strategic Action**: Single most important next step
+5. **Timeline**: When to act (Immediate/30 days/90 days)
+
+Format as a strategic account analysis for ETSM decision-making.
+"""
+
+
+def _compact_table(metrics):
+    """One rounded row per account with the columns the analysis needs"""
+    table = pd.DataFrame(
+        {
+            "account": metrics.index.astype(str),
+            "calls": metrics["last_calls"].round().astype("int64").to_numpy(),
+            "growth_pct": (metrics["growth"] * 100).round(1).to_numpy(),
+        }
+    )
+    if "total_revenue" in metrics:
+        table["revenue"] = metrics["total_revenue"].round().astype("int64").to_numpy()
+    if "use_cases" in metrics:
+        table["use_cases"] = metrics["use_cases"].to_numpy()
+    # Columns joined from etsm.health.account_health
+    if "score" in metrics:
+        table["health_score"] = metrics["score"].round().astype("int64").to_numpy()
+    if "anomalies" in metrics:
+        table["anomalies"] = metrics["anomalies"].to_numpy()
+    return table
+
+
+def _priority_order(metrics):
+    """Row positions interleaving the riskiest, fastest-growing and largest
+    accounts so each criterion gets an equal share of the budget"""
+    growth = metrics["growth"].to_numpy()
+    risk = metrics["score"].to_numpy() if "score" in metrics else growth
+    size = metrics[
+        "total_revenue" if "total_revenue" in metrics else "last_calls"
+    ].to_numpy()
+    rankings = [
+        np.argsort(risk, kind="stable"),
+        np.argsort(-growth, kind="stable"),
+        np.argsort(-size, kind="stable"),
+    ]
+    interleaved = np.column_stack(rankings).ravel()
+    _, first = np.unique(interleaved, return_index=True)
+    return interleaved[np.sort(first)]
+
+
+def _summary(table):
+    """Aggregate line for a group of accounts"""
+    growth = table["growth_pct"]
+    text = (
+        f"{len(table):,} accounts; {table['calls'].sum():,} API calls in the "
+        f"latest month; median growth {growth.median():.1f}%; "
+        f"{(growth < DECLINING_GROWTH * 100).sum():,} declining, "
+        f"{(growth > HEALTHY_GROWTH * 100).sum():,} growing"
+    )
+    if "revenue" in table:
+        text += f"; revenue ${table['revenue'].sum():,}"
+    return text
+
+
+def build_portfolio_context(metrics, max_tokens=DEFAULT_CONTEXT_TOKENS):
+    """Stable account-data prefix shared by every portfolio analysis.
+
+    Built from ``compute_account_metrics`` output, optionally joined with
+    ``etsm.health.account_health``, as compact CSV rows. When
+    all accounts do not fit in ``max_tokens`` (estimated), the riskiest,
+    fastest-growing and largest accounts are listed and the rest are
+    summarized in one aggregate line. The context only changes when the data
+    does, so it is sent as a cacheable prefix ahead of the analyst's
+    question (see ``AnthropicClient.create_message``).
+    """
+    table = _compact_table(metrics)
+    header = (
+        "As an ETSM, analyze these accounts and provide strategic insights:\n\n"
+        f"Portfolio: {_summary(table)}.\n"
+    )
+    columns = ",".join(table.columns)
+
+    # Reserve room for the column header and the summary of the remainder
+    available = max_tokens - estimate_tokens(header) - 2 * estimate_tokens(columns)
+    available -= estimate_tokens(f"Remaining: {_summary(table)}.")
+    # Every row costs at least 3 tokens, which bounds how many to render
+    order = _priority_order(metrics)[: max(available, 0) // 3 + 1]
+    candidates = table.iloc[order]
+    rows = candidates.to_csv(index=False, header=False, lineterminator="\n")
+    rows = rows.splitlines()
+    costs = np.cumsum([len(row) // 4 + 1 for row in rows])
+    count = int(np.searchsorted(costs, available, "right"))
+    kept = candidates.iloc[:count]
+    # Riskiest accounts first
+    risk = "health_score" if "health_score" in kept else "growth_pct"
+    listed = np.argsort(kept[risk].to_numpy(), kind="stable")
+
+    note = "growth is first to last month"
+    if "health_score" in table:
+        note += "; health_score is 0-100, anomalies counts outlier months"
+    if count == len(table):
+        listing = f"Accounts (all {len(table):,}; {note}):"
+    else:
+        listing = (
+            f"Top {count:,} of {len(table):,} accounts by risk, growth and "
+            f"revenue ({note}):"
+        )
+    lines = [header, listing, columns] + [rows[i] for i in listed]
+    if count < len(table):
+        rest = np.ones(len(table), dtype=bool)
+        rest[order[:count]] = False
+        lines.append(f"Remaining {_summary(table[rest])}.")
+    return "\n".join(lines) + "\n"
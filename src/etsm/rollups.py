@@ -0,0 +1,239 @@
+"""Incrementally maintained usage rollups (company x month / quarter, totals)."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+MEASURES = ["API_Calls", "Revenue", "Use_Cases", "Rows"]
+
+
+def _as_categorical(values):
+    return (
+        values
+        if isinstance(values.dtype, pd.CategoricalDtype)
+        else values.astype("category")
+    )
+
+
+def _quarters(months):
+    """Categorical of 'YYYYQn' labels for categorical 'YYYY-MM' months"""
+    categories = months.cat.categories
+    labels = pd.PeriodIndex(categories.astype(str), freq="M").asfreq("Q").astype(str)
+    quarter_categories, inverse = np.unique(np.asarray(labels), return_inverse=True)
+    codes = np.where(months.cat.codes >= 0, inverse[months.cat.codes], -1)
+    return pd.Categorical.from_codes(codes, categories=quarter_categories)
+
+
+def _plain_index(index):
+    """Replace categorical index levels with plain string levels"""
+    if isinstance(index, pd.MultiIndex):
+        return index.set_levels([level.astype(str) for level in index.levels])
+    return index.astype(str)
+
+
+def _merge(existing, batch):
+    """Fold ``batch`` buckets into ``existing``, touching only matching keys"""
+    if existing is None:
+        return batch
+    positions = existing.index.get_indexer(batch.index)
+    overlap = positions >= 0
+    if overlap.any():
+        rows = positions[overlap]
+        for column in MEASURES:
+            current = existing[column].to_numpy()[rows]
+            incoming = batch[column].to_numpy()[overlap]
+            merged = (
+                np.maximum(current, incoming)
+                if column == "Use_Cases"
+                else current + incoming
+            )
+            existing.iloc[rows, existing.columns.get_loc(column)] = merged
+    if not overlap.all():
+        existing = pd.concat([existing, batch[~overlap]])
+    return existing
+
+
+class RollupStore:
+    """Company x month and company x quarter buckets plus global totals.
+
+    ``append`` aggregates only the new rows and folds them into the existing
+    buckets, so adding a month of usage never rescans history. Totals are kept
+    as running sums and read in constant time.
+    """
+
+    def __init__(self):
+        self._buckets = {"Month": None, "Quarter": None, "Company": None}
+        self._totals = {"API_Calls": 0, "Revenue": 0.0, "Rows": 0}
+        self._companies = 0
+        self._frames = {}
+        # Reentrant: the company frame is derived from the month frame
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_frame(cls, usage_df):
+        store = cls()
+        store.append(usage_df)
+        return store
+
+    def append(self, usage_df):
+        """Fold new usage rows into the affected buckets"""
+        months = _as_categorical(usage_df["Month"])
+        frame = pd.DataFrame(
+            {
+                "Company": _as_categorical(usage_df["Company"]),
+                "Month": months,
+                "Quarter": _quarters(months),
+                "API_Calls": usage_df["API_Calls"].to_numpy(),
+                "Revenue": (
+                    usage_df["Revenue"].to_numpy()
+                    if "Revenue" in usage_df
+                    else np.zeros(len(usage_df))
+                ),
+                "Use_Cases": (
+                    usage_df["Use_Cases"].to_numpy()
+                    if "Use_Cases" in usage_df
+                    else np.zeros(len(usage_df), dtype=np.int64)
+                ),
+            }
+        )
+
+        with self._lock:
+            for level, keys in (
+                ("Month", ["Company", "Month"]),
+                ("Quarter", ["Company", "Quarter"]),
+                ("Company", ["Company"]),
+            ):
+                batch = frame.groupby(keys, observed=True, sort=False).agg(
+                    API_Calls=("API_Calls", "sum"),
+                    Revenue=("Revenue", "sum"),
+                    Use_Cases=("Use_Cases", "max"),
+                    Rows=("API_Calls", "size"),
+                )
+                batch.index = _plain_index(batch.index)
+                self._buckets[level] = _merge(self._buckets[level], batch)
+
+            self._totals["API_Calls"] += int(frame["API_Calls"].sum())
+            self._totals["Revenue"] += float(frame["Revenue"].sum())
+            self._totals["Rows"] += len(frame)
+            self._companies = len(self._buckets["Company"])
+            self._frames.clear()
+
+    @property
+    def totals(self):
+        """Global KPIs; constant time regardless of history length"""
+        return {
+            "api_calls": self._totals["API_Calls"],
+            "revenue": self._totals["Revenue"],
+            "rows": self._totals["Rows"],
+            "companies": self._companies,
+        }
+
+    def copy(self):
+        """Independent store with the same buckets; appending to it leaves
+        this one (and any snapshot holding it) unchanged"""
+        store = RollupStore()
+        with self._lock:
+            store._buckets = {
+                level: None if buckets is None else buckets.copy()
+                for level, buckets in self._buckets.items()
+            }
+            store._totals = dict(self._totals)
+            store._companies = self._companies
+        return store
+
+    def memory_usage(self):
+        """Bytes held by the buckets and the sorted frames derived from them"""
+        with self._lock:
+            frames = [b for b in self._buckets.values() if b is not None]
+            frames += self._frames.values()
+            return sum(int(f.memory_usage(deep=True).sum()) for f in frames)
+
+    def _frame(self, level):
+        with self._lock:
+            if level not in self._frames:
+                buckets = self._buckets[level]
+                if buckets is None:
+                    index = ["Company"] if level == "Company" else ["Company", level]
+                    buckets = pd.DataFrame(columns=index + MEASURES).set_index(index)
+                frame = buckets.sort_index()
+                if level == "Company":
+                    months = self._frame("Month").groupby(level="Company")
+                    frame["Months"] = months.size().reindex(frame.index).to_numpy()
+                self._frames[level] = frame
+            return self._frames[level]
+
+    def monthly(self):
+        """Company x month buckets"""
+        return self._frame("Month")
+
+    def quarterly(self):
+        """Company x quarter buckets"""
+        return self._frame("Quarter")
+
+    def by_company(self):
+        """Per-company totals across all loaded history, with month counts"""
+        return self._frame("Company")
+
+
+def _months_after(months, last):
+    """Boolean mask of rows whose 'YYYY-MM' month sorts after ``last``"""
+    if isinstance(months.dtype, pd.CategoricalDtype):
+        later = np.asarray(months.cat.categories.astype(str) > last)
+        return np.where(months.cat.codes >= 0, later[months.cat.codes], False)
+    return (months.astype(str) > last).to_numpy()
+
+
+def _same_values(old, new):
+    if (
+        isinstance(old.dtype, pd.CategoricalDtype)
+        and isinstance(new.dtype, pd.CategoricalDtype)
+        and new.cat.categories[: len(old.cat.categories)].equals(old.cat.categories)
+    ):
+        return np.array_equal(old.cat.codes.to_numpy(), new.cat.codes.to_numpy())
+    return np.array_equal(old.to_numpy(), new.to_numpy())
+
+
+def _same_rows(old, new):
+    return (
+        len(old) == len(new)
+        and list(old.columns) == list(new.columns)
+        and all(_same_values(old[column], new[column]) for column in old.columns)
+    )
+
+
+class RollupTracker:
+    """Keeps rollups current across data versions.
+
+    When a new version only adds months after the ones already rolled up and
+    leaves the earlier rows unchanged, ``refresh`` appends just the new months
+    to a copy of the previous store; anything else is rebuilt from scratch.
+    Each call returns a separate store, so published stores never change.
+    """
+
+    def __init__(self):
+        self._usage = None
+        self._store = None
+        self._last_month = None
+        self._lock = threading.Lock()
+
+    def refresh(self, usage_df):
+        """Rollups for ``usage_df``; returns ``(store, appended_rows)`` where
+        ``appended_rows`` is None after a full rebuild"""
+        with self._lock:
+            store, appended = None, None
+            if self._store is not None:
+                new_rows = _months_after(usage_df["Month"], self._last_month)
+                history = usage_df[~new_rows] if new_rows.any() else usage_df
+                if _same_rows(self._usage, history):
+                    appended = int(new_rows.sum())
+                    store = self._store
+                    if appended:
+                        store = store.copy()
+                        store.append(usage_df[new_rows])
+            if store is None:
+                store = RollupStore.from_frame(usage_df)
+            self._usage, self._store = usage_df, store
+            months = store.monthly().index.levels[-1]
+            self._last_month = str(months.max()) if len(months) else ""
+            return store, appended
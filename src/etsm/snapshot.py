@@ -0,0 +1,192 @@
+"""Background data refresh publishing immutable, fully precomputed snapshots.
+
+A ``SnapshotRefresher`` thread polls the usage source on a schedule. When
+the source version changes it loads the data, computes every aggregate the
+pages read and then swaps the published ``Snapshot`` in one assignment.
+Sessions read the current snapshot without waiting; only the very first
+build blocks.
+"""
+
+import dataclasses
+import os
+import threading
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+from etsm.forecast import HORIZONS, UsageForecaster
+from etsm.health import account_health, usage_matrix
+from etsm.metrics import compute_account_metrics, kpi_deltas
+from etsm.rollups import RollupTracker
+from etsm.sources import USAGE_COLUMNS, sort_usage
+from etsm.telemetry import TELEMETRY
+
+DEFAULT_REFRESH_SECONDS = 300
+FORECAST_MEASURES = ("API_Calls", "Revenue")
+
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    """One consistent view of the data; shared by every session, so its
+    frames must be treated as read-only"""
+
+    version: str
+    created_at: datetime
+    usage: object
+    account_metrics: object
+    rollups: object
+    health: object
+    forecast: MappingProxyType
+    kpi_deltas: MappingProxyType
+
+
+def make_forecasters(method="holt"):
+    return {measure: UsageForecaster(method) for measure in FORECAST_MEASURES}
+
+
+def build_snapshot(
+    source, forecasters=None, now=None, forecast_method="holt", rollups=None
+):
+    """Load ``source`` and precompute the aggregates the pages use.
+
+    ``forecasters`` (``{measure: UsageForecaster}``) and the ``rollups``
+    ``RollupTracker`` are carried between builds, so consecutive snapshots
+    only process the months that are new; without them new
+    ``forecast_method`` forecasters and rollups are built from scratch.
+    """
+    version = source.version()
+    usage_df = sort_usage(source.load(columns=USAGE_COLUMNS))
+    rollups, _ = (rollups or RollupTracker()).refresh(usage_df)
+    forecasters = forecasters or make_forecasters(forecast_method)
+    forecast = {}
+    for measure, forecaster in forecasters.items():
+        accounts, months, matrix = usage_matrix(usage_df, measure)
+        forecaster.refresh(accounts, months, matrix)
+        forecast[measure] = forecaster.forecast(range(1, max(HORIZONS) + 1))
+    forecast["accounts"], forecast["months"] = accounts, list(months)
+    return Snapshot(
+        version=version,
+        created_at=now or datetime.now(timezone.utc),
+        usage=usage_df,
+        account_metrics=compute_account_metrics(usage_df),
+        rollups=rollups,
+        health=account_health(usage_df),
+        forecast=MappingProxyType(forecast),
+        kpi_deltas=MappingProxyType(kpi_deltas(rollups.monthly())),
+    )
+
+
+class SnapshotRefresher:
+    """Rebuilds snapshots in a daemon thread every ``interval`` seconds.
+
+    ``source_factory`` creates the data source; ``reload()`` replaces it
+    (e.g. new mock data) and rebuilds at once. A failed build keeps the
+    previous snapshot published and is reported through ``error``. With
+    ``interval <= 0`` no thread is started and snapshots are only built on
+    demand.
+    """
+
+    def __init__(
+        self,
+        source_factory,
+        interval=DEFAULT_REFRESH_SECONDS,
+        build=None,
+        forecast_method="holt",
+    ):
+        self.source_factory = source_factory
+        self.interval = interval
+        self.build = build or build_snapshot
+        self.error = None
+        self.refreshing = False
+        self._source = source_factory()
+        self._forecasters = make_forecasters(forecast_method)
+        self._rollups = RollupTracker()
+        self._snapshot = None
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._build_lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, source_factory):
+        """Refresher polling every ETSM_REFRESH_SECONDS (0 disables the thread)
+        and forecasting with ETSM_FORECAST_METHOD"""
+        interval = float(os.getenv("ETSM_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS))
+        return cls(
+            source_factory,
+            interval=interval,
+            forecast_method=os.getenv("ETSM_FORECAST_METHOD", "holt"),
+        )
+
+    def start(self):
+        if self.interval > 0 and self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="etsm-snapshot-refresher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def refresh(self, force=False):
+        """Publish a new snapshot if the source changed; returns True when
+        one was published"""
+        with self._build_lock:
+            current = self._snapshot
+            try:
+                if (
+                    not force
+                    and current is not None
+                    and current.version == self._source.version()
+                ):
+                    return False
+                self.refreshing = True
+                with TELEMETRY.timer("etsm_refresh_seconds"):
+                    snapshot = self.build(
+                        self._source, self._forecasters, rollups=self._rollups
+                    )
+            except Exception as e:
+                self.error = e
+                TELEMETRY.increment("etsm_refresh_errors_total")
+                self._ready.set()
+                return False
+            finally:
+                self.refreshing = False
+            self._snapshot = snapshot  # atomic swap
+            self.error = None
+            self._ready.set()
+            TELEMETRY.increment("etsm_refresh_total")
+            return True
+
+    def reload(self, wait=False):
+        """Swap in a fresh source and rebuild (in the background unless
+        ``wait`` or no thread is running)"""
+        with self._build_lock:
+            self._source = self.source_factory()
+        if wait or self._thread is None:
+            self.refresh(force=True)
+        else:
+            self._wake.set()
+
+    def snapshot(self, timeout=None):
+        """The current snapshot; only the first call may wait for a build"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        if self._thread is None:
+            self.refresh()
+        else:
+            self._ready.wait(timeout)
+        if self._snapshot is None:
+            raise RuntimeError("No data snapshot is available") from self.error
+        return self._snapshot
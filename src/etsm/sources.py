@@ -0,0 +1,253 @@
+"""Pluggable data sources for usage and strategy data.
+
+Every source implements ``load(columns=None, companies=None, months=None)``
+and ``version()``. File-backed sources only read the requested columns and
+push the company/month predicates down to the reader, so large billing
+exports never have to be materialized in full.
+"""
+
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from etsm.data import (
+    generate_api_usage_data,
+    generate_strategy_data,
+    generate_synthetic_strategies,
+    generate_synthetic_usage,
+)
+
+USAGE_COLUMNS = ["Company", "Month", "API_Calls", "Revenue", "Use_Cases"]
+
+
+def sort_usage(usage_df):
+    """Rows in month order within each company, companies kept in order of
+    first appearance; already ordered frames are returned as they are.
+
+    File exports do not guarantee row order, and first/last-month metrics
+    depend on it.
+    """
+    company, _ = pd.factorize(usage_df["Company"])
+    month, months = pd.factorize(usage_df["Month"], sort=True)
+    key = company.astype(np.int64) * max(len(months), 1) + month
+    if (np.diff(key) >= 0).all():
+        return usage_df
+    order = np.lexsort((month, company))
+    return usage_df.take(order).reset_index(drop=True)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet/Arrow data requires pyarrow: pip install pyarrow"
+        ) from e
+
+
+def _read_columns(columns, companies, months):
+    """Columns to read: the projection plus any column used by a predicate"""
+    if columns is None:
+        return None
+    needed = list(columns)
+    for name, values in (("Company", companies), ("Month", months)):
+        if values is not None and name not in needed:
+            needed.append(name)
+    return needed
+
+
+def _filter_frame(df, columns, companies, months):
+    """Apply predicates and projection to an in-memory frame"""
+    mask = pd.Series(True, index=df.index)
+    if companies is not None:
+        mask &= df["Company"].isin(list(companies))
+    if months is not None:
+        mask &= df["Month"].isin(list(months))
+    if companies is not None or months is not None:
+        df = df[mask]
+    if columns is not None:
+        df = df[list(columns)]
+    return df.reset_index(drop=True)
+
+
+def _file_version(path):
+    """Changes whenever the file (or any file under a directory) changes"""
+    if os.path.isdir(path):
+        stats = [
+            os.stat(os.path.join(root, name))
+            for root, _, names in os.walk(path)
+            for name in names
+        ]
+        latest = max((s.st_mtime_ns for s in stats), default=0)
+        return f"{path}:{latest}:{sum(s.st_size for s in stats)}"
+    stat = os.stat(path)
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class DataSource:
+    """Base class for usage/strategy data backends"""
+
+    def load(self, columns=None, companies=None, months=None):
+        raise NotImplementedError
+
+    def version(self):
+        """Opaque string that changes whenever the data may have changed"""
+        raise NotImplementedError
+
+
+class FrameSource(DataSource):
+    """Wraps a factory producing a DataFrame, e.g. the mock generators"""
+
+    def __init__(self, factory, name, seed=None):
+        self.factory = factory
+        self.name = name
+        self.seed = seed
+        # Unseeded generators produce new data every call
+        self._nonce = uuid.uuid4().hex if seed is None else seed
+
+    def load(self, columns=None, companies=None, months=None):
+        return _filter_frame(self.factory(), columns, companies, months)
+
+    def version(self):
+        return f"{self.name}:{self._nonce}"
+
+
+def mock_usage_source(seed=None, **synthetic_options):
+    """The demo usage generator, or the synthetic one when options are given"""
+    if synthetic_options:
+        return FrameSource(
+            lambda: generate_synthetic_usage(seed=seed, **synthetic_options),
+            name=f"synthetic{sorted(synthetic_options.items())}",
+            seed=seed,
+        )
+    return FrameSource(
+        lambda: generate_api_usage_data(seed=seed), name="mock-usage", seed=seed
+    )
+
+
+def mock_strategy_source(n_strategies=None, seed=None):
+    """The five demo strategies, or a synthetic pipeline of ``n_strategies``"""
+    if n_strategies:
+        return FrameSource(
+            lambda: generate_synthetic_strategies(n_strategies, seed=seed),
+            name=f"synthetic-strategies:{n_strategies}",
+            seed=seed,
+        )
+    return FrameSource(generate_strategy_data, name="mock-strategy", seed=0)
+
+
+class ParquetSource(DataSource):
+    """Parquet file or hive-partitioned directory, read memory-mapped"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, columns=None, companies=None, months=None):
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        filters = []
+        if companies is not None:
+            filters.append(("Company", "in", list(companies)))
+        if months is not None:
+            filters.append(("Month", "in", list(months)))
+        table = pq.read_table(
+            self.path,
+            columns=_read_columns(columns, companies, months),
+            filters=filters or None,
+            memory_map=True,
+        )
+        df = table.to_pandas()
+        return df[list(columns)] if columns is not None else df
+
+    def version(self):
+        return _file_version(self.path)
+
+
+class ArrowSource(DataSource):
+    """Arrow IPC (Feather v2) file, memory-mapped so unread columns stay on disk"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, columns=None, companies=None, months=None):
+        _require_pyarrow()
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        with pa.memory_map(self.path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+            needed = _read_columns(columns, companies, months)
+            if needed is not None:
+                table = table.select(needed)
+            if companies is not None:
+                table = table.filter(
+                    pc.is_in(table["Company"], pa.array(list(companies)))
+                )
+            if months is not None:
+                table = table.filter(pc.is_in(table["Month"], pa.array(list(months))))
+            df = table.to_pandas()
+        return df[list(columns)] if columns is not None else df
+
+    def version(self):
+        return _file_version(self.path)
+
+
+class CsvSource(DataSource):
+    """CSV read in chunks, keeping only matching rows of the needed columns"""
+
+    def __init__(self, path, chunksize=500_000):
+        self.path = path
+        self.chunksize = chunksize
+
+    def load(self, columns=None, companies=None, months=None):
+        chunks = pd.read_csv(
+            self.path,
+            usecols=_read_columns(columns, companies, months),
+            dtype={"Company": str, "Month": str},
+            chunksize=self.chunksize,
+        )
+        frames = [_filter_frame(chunk, columns, companies, months) for chunk in chunks]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def version(self):
+        return _file_version(self.path)
+
+
+def open_source(location):
+    """Pick a backend from a path's extension; empty or 'mock' means mock data"""
+    if not location or location == "mock":
+        return None
+    lowered = location.lower()
+    if lowered.endswith((".arrow", ".feather", ".ipc")):
+        return ArrowSource(location)
+    if lowered.endswith((".csv", ".csv.gz")):
+        return CsvSource(location)
+    if lowered.endswith(".parquet") or os.path.isdir(location):
+        return ParquetSource(location)
+    raise ValueError(f"Unsupported data source: {location}")
+
+
+def usage_source_from_env():
+    """Usage source from ETSM_USAGE_SOURCE, defaulting to the mock generator"""
+    seed = os.getenv("ETSM_MOCK_SEED")
+    seed = int(seed) if seed else None
+    return open_source(os.getenv("ETSM_USAGE_SOURCE")) or mock_usage_source(seed)
+
+
+def strategy_source_from_env():
+    """Strategy source from ETSM_STRATEGY_SOURCE, defaulting to the mock list
+
+    ETSM_MOCK_STRATEGIES swaps the demo list for a synthetic pipeline of that
+    many strategies.
+    """
+    seed = os.getenv("ETSM_MOCK_SEED")
+    seed = int(seed) if seed else None
+    n_strategies = int(os.getenv("ETSM_MOCK_STRATEGIES", 0))
+    return open_source(os.getenv("ETSM_STRATEGY_SOURCE")) or mock_strategy_source(
+        n_strategies, seed
+    )
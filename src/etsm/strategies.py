@@ -0,0 +1,226 @@
+"""Persistent SQLite store for strategy board initiatives."""
+
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+DEFAULT_STRATEGY_DB = os.path.join(".etsm_cache", "strategies.sqlite")
+
+COLUMNS = [
+    "Account",
+    "Strategy",
+    "Status",
+    "Priority",
+    "Expected_Revenue",
+    "Timeline",
+    "Key_Stakeholder",
+    "Description",
+]
+FILTER_COLUMNS = ["Account", "Status", "Priority", "Timeline"]
+SORT_COLUMNS = ["Expected_Revenue", "Account", "Status", "Priority", "Timeline", "id"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strategies (
+    id INTEGER PRIMARY KEY,
+    Account TEXT NOT NULL,
+    Strategy TEXT NOT NULL,
+    Status TEXT NOT NULL,
+    Priority TEXT NOT NULL,
+    Expected_Revenue INTEGER NOT NULL DEFAULT 0,
+    Timeline TEXT NOT NULL DEFAULT '',
+    Key_Stakeholder TEXT NOT NULL DEFAULT '',
+    Description TEXT NOT NULL DEFAULT '',
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS strategies_account ON strategies (Account);
+CREATE INDEX IF NOT EXISTS strategies_status ON strategies (Status);
+CREATE INDEX IF NOT EXISTS strategies_priority ON strategies (Priority);
+CREATE INDEX IF NOT EXISTS strategies_timeline ON strategies (Timeline);
+CREATE INDEX IF NOT EXISTS strategies_revenue ON strategies (Expected_Revenue);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES ('revision', 0);
+"""
+
+
+def _where(filters=None, search=None):
+    """SQL condition and parameters for ``{column: allowed values}`` filters
+    and a case-insensitive account substring search"""
+    clauses, params = [], []
+    for column, values in (filters or {}).items():
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Cannot filter strategies on {column!r}")
+        if values:
+            values = list(values)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+    if search:
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        clauses.append("Account LIKE ? ESCAPE '\\'")
+        params.append(f"%{escaped}%")
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _record(values):
+    unknown = set(values) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown strategy fields: {sorted(unknown)}")
+    if "Expected_Revenue" in values:
+        values = {**values, "Expected_Revenue": int(values["Expected_Revenue"])}
+    return values
+
+
+class StrategyStore:
+    """Strategy initiatives in SQLite with indexes on the filter columns.
+
+    Pages read one page of rows and aggregate totals with SQL, so the table
+    never has to be loaded into pandas. Every write bumps a revision that
+    ``version()`` reports, which keys the cached charts.
+    """
+
+    def __init__(self, path=DEFAULT_STRATEGY_DB):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls, seed_source=None):
+        """Store at ETSM_STRATEGY_DB, seeded from ``seed_source`` when empty"""
+        store = cls(os.getenv("ETSM_STRATEGY_DB", DEFAULT_STRATEGY_DB))
+        if seed_source is not None and not store.count():
+            store.insert_frame(seed_source.load())
+        return store
+
+    def _bump(self):
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'revision'")
+
+    def version(self):
+        with self._lock:
+            revision = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'revision'"
+            ).fetchone()[0]
+        return f"{self.path}:{revision}"
+
+    def insert_frame(self, df):
+        """Bulk insert rows with the strategy board columns"""
+        now = time.time()
+        frame = df.reindex(columns=COLUMNS)
+        frame = frame.astype(object).where(frame.notna(), None)
+        frame["Expected_Revenue"] = frame["Expected_Revenue"].fillna(0).astype(int)
+        rows = [(*row, now) for row in frame.itertuples(index=False, name=None)]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO strategies ({', '.join(COLUMNS)}, updated_at) "
+                f"VALUES ({', '.join('?' * (len(COLUMNS) + 1))})",
+                rows,
+            )
+            self._bump()
+        return len(rows)
+
+    def create(self, **values):
+        """Insert one strategy and return its id"""
+        values = _record(values)
+        missing = {"Account", "Strategy", "Status", "Priority"} - set(values)
+        if missing:
+            raise ValueError(f"Missing strategy fields: {sorted(missing)}")
+        columns = list(values) + ["updated_at"]
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"INSERT INTO strategies ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                [*values.values(), time.time()],
+            )
+            self._bump()
+        return cursor.lastrowid
+
+    def update(self, strategy_id, **changes):
+        """Change fields of one strategy; returns False when it does not exist"""
+        changes = _record(changes)
+        if not changes:
+            return self.get(strategy_id) is not None
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE strategies SET {assignments}, updated_at = ? WHERE id = ?",
+                [*changes.values(), time.time(), strategy_id],
+            )
+            if cursor.rowcount:
+                self._bump()
+        return cursor.rowcount > 0
+
+    def get(self, strategy_id):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT id, {', '.join(COLUMNS)} FROM strategies WHERE id = ?",
+                (strategy_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def count(self, filters=None, search=None):
+        where, params = _where(filters, search)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM strategies{where}", params
+            ).fetchone()[0]
+
+    def distinct(self, column):
+        """Sorted values of a filter column, read from its index"""
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Unknown strategy filter column: {column!r}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {column} FROM strategies ORDER BY {column}"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        filters=None,
+        search=None,
+        sort_by="Expected_Revenue",
+        ascending=False,
+        page=1,
+        page_size=50,
+    ):
+        """One page of matching strategies as a DataFrame (with ``id``)"""
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort strategies by {sort_by!r}")
+        where, params = _where(filters, search)
+        order = "ASC" if ascending else "DESC"
+        sql = (
+            f"SELECT id, {', '.join(COLUMNS)} FROM strategies{where} "
+            f"ORDER BY {sort_by} {order}, id LIMIT ? OFFSET ?"
+        )
+        offset = (max(1, page) - 1) * page_size
+        with self._lock:
+            rows = self._conn.execute(sql, [*params, page_size, offset]).fetchall()
+        return pd.DataFrame([dict(row) for row in rows], columns=["id"] + COLUMNS)
+
+    def totals(self, filters=None, search=None):
+        """Count and expected revenue overall and per Status and Priority"""
+        where, params = _where(filters, search)
+        totals = {"count": 0, "revenue": 0}
+        with self._lock:
+            for column in ("Status", "Priority"):
+                rows = self._conn.execute(
+                    f"SELECT {column}, COUNT(*), COALESCE(SUM(Expected_Revenue), 0) "
+                    f"FROM strategies{where} GROUP BY {column}",
+                    params,
+                ).fetchall()
+                totals[column] = {
+                    value: {"count": count, "revenue": revenue}
+                    for value, count, revenue in rows
+                }
+        for group in totals["Status"].values():
+            totals["count"] += group["count"]
+            totals["revenue"] += group["revenue"]
+        return totals
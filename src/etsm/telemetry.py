@@ -0,0 +1,183 @@
+"""In-process timers, histograms and counters with Prometheus text export.
+
+One registry (``TELEMETRY``) is shared by every session in the process.
+Histograms keep cumulative buckets for export plus a bounded window of
+recent samples for the percentiles shown in the dashboard.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+class Histogram:
+    def __init__(self, buckets, window=1024):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        return np.cumsum(self.counts).tolist()
+
+
+class Telemetry:
+    """Thread-safe registry of histograms and counters keyed by name + labels"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(self.buckets)
+            self._histograms[key].observe(value)
+
+    def increment(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the wall time of the ``with`` block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def summary(self):
+        """One row per histogram with count, mean and recent percentiles"""
+        with self._lock:
+            items = [
+                (name, key, h.count, h.sum, list(h.recent))
+                for (name, key), h in self._histograms.items()
+            ]
+        rows = []
+        for name, key, count, total, recent in sorted(items):
+            p50, p95, p99 = np.percentile(recent, [50, 95, 99])
+            rows.append(
+                {
+                    "metric": name,
+                    "labels": ", ".join(f"{k}={v}" for k, v in key),
+                    "count": count,
+                    "mean_ms": total / count * 1000,
+                    "p50_ms": p50 * 1000,
+                    "p95_ms": p95 * 1000,
+                    "p99_ms": p99 * 1000,
+                }
+            )
+        return rows
+
+    def counters(self):
+        with self._lock:
+            items = sorted(self._counters.items())
+        return [
+            {
+                "metric": name,
+                "labels": ", ".join(f"{k}={v}" for k, v in key),
+                "value": value,
+            }
+            for (name, key), value in items
+        ]
+
+    def to_prometheus(self):
+        """Everything in the Prometheus text exposition format"""
+        with self._lock:
+            histograms = sorted(
+                (name, key, h.buckets, h.cumulative(), h.count, h.sum)
+                for (name, key), h in self._histograms.items()
+            )
+            counters = sorted(self._counters.items())
+        lines = []
+        typed = set()
+        for name, key, buckets, cumulative, count, total in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for bound, value in zip(buckets, cumulative):
+                labels = _format_labels(key, [("le", f"{bound:g}")])
+                lines.append(f"{name}_bucket{labels} {value}")
+            lines.append(
+                f"{name}_bucket{_format_labels(key, [('le', '+Inf')])} {count}"
+            )
+            lines.append(f"{name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{name}_count{_format_labels(key)} {count}")
+        for (name, key), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Atomically replace ``path`` with the current export"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+TELEMETRY = Telemetry()
+
+
+def record_result(result, telemetry=TELEMETRY):
+    """AnthropicClient hook: latency, status, retry and token metrics"""
+    cached = "true" if result.cached else "false"
+    telemetry.increment(
+        "anthropic_requests_total", status=result.status or "error", cached=cached
+    )
+    if result.cached:
+        return
+    telemetry.observe("anthropic_request_seconds", result.latency, model=result.model)
+    if result.time_to_first_token is not None:
+        telemetry.observe(
+            "anthropic_time_to_first_token_seconds",
+            result.time_to_first_token,
+            model=result.model,
+        )
+    if result.attempts > 1:
+        telemetry.increment("anthropic_retries_total", result.attempts - 1)
+    telemetry.increment("anthropic_tokens_total", result.input_tokens, kind="input")
+    telemetry.increment("anthropic_tokens_total", result.output_tokens, kind="output")
@@ -0,0 +1,414 @@
+"""Streamlit helpers shared by the dashboard pages.
+
+Shared resources are created once per process with ``st.cache_resource``;
+derived data goes through the process-wide dataset cache.
+"""
+
+import streamlit as st
+
+from etsm.datacache import DatasetCache
+from etsm.snapshot import SnapshotRefresher
+from etsm.sources import strategy_source_from_env, usage_source_from_env
+from etsm.telemetry import TELEMETRY, record_result
+
+
+def timed(stage, compute):
+    """Wrap ``compute`` so each (uncached) run is recorded under ``stage``"""
+
+    def run():
+        with TELEMETRY.timer("etsm_stage_seconds", stage=stage):
+            return compute()
+
+    return run
+
+
+# Anthropic API client
+@st.cache_resource
+def get_anthropic_client(api_key):
+    """Shared pooled client, reused across reruns and sessions"""
+    from etsm.cache import ResponseCache
+    from etsm.client import AnthropicClient
+
+    return AnthropicClient.from_env(
+        api_key=api_key, cache=ResponseCache.from_env(), hooks=[record_result]
+    )
+
+
+@st.cache_resource
+def get_ledger():
+    from etsm.ledger import UsageLedger
+
+    return UsageLedger.from_env()
+
+
+# Data sources and cached datasets, shared by every session
+@st.cache_resource
+def get_strategy_source():
+    return strategy_source_from_env()
+
+
+@st.cache_resource
+def get_strategy_store():
+    """Persistent strategy store, seeded from the strategy source when empty"""
+    from etsm.strategies import StrategyStore
+
+    return StrategyStore.from_env(seed_source=get_strategy_source())
+
+
+@st.cache_resource
+def get_refresher():
+    """Background refresher shared by every session; unseeded mock data stays
+    fixed until a reload"""
+    return SnapshotRefresher.from_env(usage_source_from_env).start()
+
+
+@st.cache_resource
+def get_dataset_cache():
+    return DatasetCache.from_env()
+
+
+def current_snapshot():
+    """The published data snapshot; never waits once the first one exists.
+
+    Read it once per render: a background refresh may publish another one
+    mid-rerun, and data from two snapshots must not be mixed.
+    """
+    return get_refresher().snapshot()
+
+
+def cached_aggregate(name, version, df, compute):
+    """Derived value of ``df`` computed once per data ``version``; ``df``
+    must come from the snapshot with that version"""
+    return get_dataset_cache().get_or_compute(
+        name,
+        version,
+        timed(f"aggregate.{name}", lambda: compute(df)),
+        params=tuple(df.columns),
+    )
+
+
+def load_usage_data(snapshot, columns):
+    """Usage frame projected to ``columns`` plus the account metrics and
+    rollups, all precomputed in ``snapshot``"""
+    return snapshot.usage[list(columns)], snapshot.account_metrics, snapshot.rollups
+
+
+def cached_figure(name, version, build, *params):
+    """Figure built once per data version and chart parameters.
+
+    The cache holds the figure's dict form, which ``st.plotly_chart``
+    accepts and whose size the cache can measure.
+    """
+    return get_dataset_cache().get_or_compute(
+        f"figure:{name}",
+        version,
+        timed(f"figure.{name}", lambda: build().to_dict()),
+        params=params,
+    )
+
+
+def render_response_card(slot, text):
+    """Render analysis text into the response card held by ``slot``"""
+    slot.markdown(
+        f"""
+    <div class="response-card">
+        {text}
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+def render_grid(df, height=400):
+    """Show one page of rows, in AgGrid when it is installed.
+
+    Sorting and filtering happen server-side across every page, so the
+    grid's own (page-local) sort and filter menus are turned off.
+    """
+    try:
+        from st_aggrid import AgGrid, GridOptionsBuilder
+    except ImportError:
+        st.dataframe(df, use_container_width=True, hide_index=True, height=height)
+        return
+    builder = GridOptionsBuilder.from_dataframe(df)
+    builder.configure_default_column(sortable=False, filter=False, resizable=True)
+    AgGrid(df, gridOptions=builder.build(), height=height)
+
+
+def render_data_status(refresher):
+    """Sidebar note of when the published data snapshot was built"""
+    snapshot = refresher.snapshot()
+    note = f"📅 Data as of {snapshot.created_at:%Y-%m-%d %H:%M:%S} UTC"
+    if refresher.refreshing:
+        note += " · refreshing…"
+    st.sidebar.caption(note)
+    if refresher.error is not None:
+        st.sidebar.warning(f"Last data refresh failed: {refresher.error}")
+
+
+def render_performance_panel():
+    """Admin view of stage timings and Anthropic call metrics"""
+    with st.sidebar.expander("⏱️ Performance"):
+        timings = TELEMETRY.summary()
+        if timings:
+            st.dataframe(
+                [
+                    {
+                        k: round(v, 1) if isinstance(v, float) else v
+                        for k, v in row.items()
+                    }
+                    for row in timings
+                ],
+                hide_index=True,
+            )
+        counters = TELEMETRY.counters()
+        if counters:
+            st.dataframe(counters, hide_index=True)
+        st.download_button(
+            "Prometheus metrics",
+            TELEMETRY.to_prometheus(),
+            file_name="etsm_metrics.prom",
+            mime="text/plain",
+        )
+        if st.button("Reset metrics"):
+            TELEMETRY.reset()
+
+
+def render_styles():
+    """Custom CSS for better styling and readability"""
+    st.markdown(
+        """
+    <style>
+        /* Simple, robust text visibility */
+        .stApp {
+            background-color: #ffffff !important;
+        }
+    
+        /* Force all text to be black on white background */
+        .stMarkdown, .stText, .stSelectbox, .stTextArea, .stButton, 
+        .stMetric, .stDataFrame, .stExpander, .stAlert, .stSidebar {
+            color: #000000 !important;
+        }
+    
+        /* Force textarea to be readable */
+        .stTextArea textarea {
+            color: #000000 !important;
+            background-color: #ffffff !important;
+        }
+    
+        /* Force selectbox to be readable */
+        .stSelectbox select {
+            color: #000000 !important;
+            background-color: #ffffff !important;
+        }
+    
+        /* Force button text to be readable */
+        .stButton button {
+            color: #000000 !important;
+        }
+    
+        /* Force sidebar to be light with dark text */
+        .stSidebar {
+            background-color: #ffffff !important;
+            border-right: 1px solid #e9ecef !important;
+        }
+    
+        .stSidebar * {
+            color: #000000 !important;
+        }
+    
+        /* Force metric text to be readable */
+        .metric-container, .metric-container * {
+            color: #000000 !important;
+        }
+    
+        /* Force dataframe text to be readable */
+        .dataframe, .dataframe * {
+            color: #000000 !important;
+        }
+    
+        /* Force expander text to be readable */
+        .streamlit-expanderHeader {
+            color: #000000 !important;
+        }
+    
+        /* Force alert text to be readable */
+        .stAlert {
+            color: #000000 !important;
+        }
+    
+        /* Force all metric values to be readable */
+        .stMetric, .stMetric * {
+            color: #000000 !important;
+        }
+    
+        /* Force success/error/warning messages to be readable */
+        .stSuccess, .stError, .stWarning {
+            color: #000000 !important;
+        }
+    
+        .stSuccess *, .stError *, .stWarning * {
+            color: #000000 !important;
+        }
+    
+        /* Anthropic branding - matching official website */
+        .anthropic-header {
+            background: #ffffff;
+            color: #000000;
+            padding: 30px 20px;
+            border-bottom: 1px solid #e5e7eb;
+            margin-bottom: 30px;
+            text-align: center;
+        }
+    
+        .anthropic-logo {
+            font-size: 2rem;
+            margin-bottom: 15px;
+            color: #000000;
+        }
+    
+        .anthropic-tagline {
+            font-size: 1.2rem;
+            color: #6b7280;
+            font-weight: 400;
+            margin-bottom: 20px;
+        }
+    
+        .powered-by {
+            background-color: #f9fafb;
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 15px;
+            text-align: center;
+            margin: 20px 0;
+            font-size: 0.9rem;
+            color: #6b7280;
+        }
+    
+        .claude-badge {
+            display: inline-block;
+            background: #000000;
+            color: white;
+            padding: 6px 12px;
+            border-radius: 6px;
+            font-size: 0.75rem;
+            font-weight: 500;
+            margin: 3px;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+    
+        .anthropic-title {
+            font-size: 2.5rem;
+            font-weight: 700;
+            color: #000000;
+            margin-bottom: 10px;
+        }
+    
+        .anthropic-subtitle {
+            font-size: 1rem;
+            color: #6b7280;
+            font-weight: 400;
+        }
+    
+        .strategy-card {
+            background-color: #ffffff;
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 20px;
+            margin: 10px 0;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+    
+        .strategy-card h3 {
+            color: #000000;
+            margin-bottom: 10px;
+            font-size: 1.2rem;
+        }
+    
+        .strategy-card p {
+            color: #000000;
+            margin: 5px 0;
+        }
+    
+        .prompt-card, .response-card {
+            background-color: #f9fafb;
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 10px 0;
+        }
+    
+    </style>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+def render_header():
+    """Anthropic branding header with Try Claude button"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        st.markdown("")  # Empty column for spacing
+
+    with col2:
+        st.markdown(
+            """
+        <div class="anthropic-header">
+            <div class="anthropic-logo">🤖</div>
+            <div class="anthropic-title">ETSM Dashboard</div>
+            <div class="anthropic-subtitle">Enterprise Technical Success Manager Platform</div>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    with col3:
+        st.markdown(
+            """
+        <div style="text-align: right; margin-top: 20px;">
+            <a href="https://claude.ai/new" target="_blank">
+                <button style="
+                    background-color: #000000;
+                    color: white;
+                    border: none;
+                    padding: 10px 20px;
+                    border-radius: 6px;
+                    font-size: 0.9rem;
+                    font-weight: 500;
+                    cursor: pointer;
+                    text-decoration: none;
+                    display: inline-block;
+                ">Chat w/Claude</button>
+            </a>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    st.markdown(
+        '<h1 class="main-header">📊 ETSM Dashboard</h1>', unsafe_allow_html=True
+    )
+    st.markdown(
+        '<p style="text-align: center; font-size: 1.2rem; color: #000000;">Enterprise Technical Success Manager Platform</p>',
+        unsafe_allow_html=True,
+    )
+
+
+def render_footer():
+    st.markdown("---")
+    st.markdown(
+        """
+    <div class="powered-by">
+        <div style="margin-bottom: 10px;">
+            <span class="claude-badge">Claude</span>
+            <strong style="margin: 0 10px;">Powered by Anthropic</strong>
+            <span class="claude-badge">Sonnet 4</span>
+        </div>
+        <p style="margin: 0; color: #6b7280;">Enterprise Technical Success Manager Dashboard</p>
+        <p style="margin: 5px 0 0 0; font-size: 0.8rem; color: #6b7280;">API Usage Analytics • Strategy Boards • AI-Powered Insights • Executive Decisions</p>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
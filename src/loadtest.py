@@ -0,0 +1,71 @@
+"""Load test the dashboard with concurrent sessions against a mock Anthropic API.
+
+    python src/loadtest.py --sessions 20 --rounds 3 --latency 0.8 --error-rate 0.05
+
+Each session switches between the sidebar pages in random order and submits
+Account Analysis; the report lists p50/p95/p99 rerun latency, throughput and
+resident memory per session on stdout (Streamlit logs go to stderr).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from etsm.loadtest import format_report, run_load_test
+from etsm.pages import PAGES
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.py")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3, help="Page tours per session")
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Mock API latency in seconds"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of mock API requests failing with 529 Overloaded",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="Mean pause in seconds between a session's interactions",
+    )
+    parser.add_argument(
+        "--ramp-up", type=float, default=0.0, help="Seconds to start all sessions"
+    )
+    parser.add_argument("--no-analyze", action="store_true", help="Only switch pages")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = run_load_test(
+        DASHBOARD,
+        list(PAGES),
+        sessions=args.sessions,
+        rounds=args.rounds,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        think_time=args.think_time,
+        ramp_up=args.ramp_up,
+        analyze=not args.no_analyze,
+        seed=args.seed,
+    )
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
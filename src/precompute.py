@@ -0,0 +1,127 @@
+"""Precompute Account Analysis insights so the dashboard can skip live calls.
+
+This is a one-shot job: run it from cron or a scheduler (e.g. Heroku
+Scheduler / ``heroku run``), not as a long-running Procfile process:
+
+    python src/precompute.py            # call Anthropic
+    python src/precompute.py --stub     # offline, canned responses
+
+Data comes from the same source as the dashboard (ETSM_USAGE_SOURCE). With
+the built-in mock data, ETSM_MOCK_SEED must be set to the dashboard's value;
+otherwise each process draws different accounts and every precomputed
+analysis would show as stale.
+"""
+
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from etsm.batch import RateLimiter, run_batch
+from etsm.client import DEFAULT_MODEL, AnthropicClient, StubClient
+from etsm.insights import InsightStore, insight_record
+from etsm.ledger import UsageLedger
+from etsm.prompts import (
+    DEFAULT_CONTEXT_TOKENS,
+    PORTFOLIO_QUESTION,
+    build_account_prompts,
+    build_portfolio_context,
+)
+from etsm.snapshot import build_snapshot
+from etsm.sources import usage_source_from_env
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--store", help="Insights directory (ETSM_INSIGHTS_DIR)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument(
+        "--stub", action="store_true", help="Use canned responses, no API calls"
+    )
+    parser.add_argument(
+        "--skip-accounts",
+        action="store_true",
+        help="Only precompute the portfolio analysis",
+    )
+    parser.add_argument(
+        "--context-tokens",
+        type=int,
+        default=DEFAULT_CONTEXT_TOKENS,
+        help="Token budget for the shared portfolio context (ETSM_CONTEXT_TOKENS)",
+    )
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--requests-per-minute", type=int, default=50)
+    parser.add_argument("--tokens-per-minute", type=int, default=40000)
+    parser.add_argument(
+        "--keep", type=int, default=10, help="Number of versions to retain"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    load_dotenv()
+    args = parse_args(argv)
+    store = InsightStore(args.store) if args.store else InsightStore.from_env()
+
+    if not os.getenv("ETSM_USAGE_SOURCE") and not os.getenv("ETSM_MOCK_SEED"):
+        print(
+            "ETSM_MOCK_SEED is not set; set it to the dashboard's value (or set "
+            "ETSM_USAGE_SOURCE) so the insights match the data it shows."
+        )
+        return 1
+
+    if args.stub:
+        client = StubClient()
+    else:
+        # Spend is recorded in the same ledger as the dashboard's live calls
+        ledger = UsageLedger.from_env()
+        client = AnthropicClient.from_env(
+            hooks=[lambda result: ledger.record(result, session="precompute")]
+        )
+        if not client.api_key:
+            print("ANTHROPIC_API_KEY is not set; use --stub to run offline.")
+            return 1
+
+    # Built exactly as the dashboard builds its snapshot
+    snapshot = build_snapshot(usage_source_from_env())
+    usage_df = snapshot.usage
+
+    context = build_portfolio_context(
+        snapshot.account_metrics.join(snapshot.health),
+        max_tokens=args.context_tokens,
+    )
+    result = client.create_message(
+        PORTFOLIO_QUESTION, model=args.model, use_cache=False, context=context
+    )
+    print(f"Portfolio analysis: status {result.status} in {result.latency:.2f}s")
+    if not result.ok:
+        print(result.error)
+        return 1
+    portfolio = insight_record(PORTFOLIO_QUESTION, result, context=context)
+
+    accounts = {}
+    if not args.skip_accounts:
+        account_prompts = build_account_prompts(usage_df)
+        for company, account_result in run_batch(
+            client,
+            account_prompts,
+            model=args.model,
+            max_workers=args.max_workers,
+            limiter=RateLimiter(args.requests_per_minute, args.tokens_per_minute),
+            use_cache=False,
+        ):
+            print(f"{company}: status {account_result.status}")
+            if account_result.ok:
+                accounts[company] = insight_record(
+                    account_prompts[company], account_result
+                )
+
+    version = store.save(portfolio=portfolio, accounts=accounts)
+    store.prune(args.keep)
+    print(f"Wrote insights version {version} to {os.path.abspath(store.directory)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import threading
+import time
+import sys
+import os
+
+import pandas as pd
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.batch import RateLimiter, TokenBucket, run_batch
+from etsm.cache import ResponseCache
+from etsm.client import AnthropicClient, ClaudeResult
+from etsm.prompts import build_account_prompts
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instead of blocking"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class SlowClient:
+    """Records peak concurrency of create_message calls"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def create_message(self, prompt, model, max_tokens, use_cache):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return ClaudeResult(
+            text=prompt.upper(),
+            status=200,
+            usage={"input_tokens": 10, "output_tokens": 10},
+        )
+
+
+def test_token_bucket_waits_for_refill():
+    """Test that the bucket blocks once its per-minute budget is spent"""
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire(60)
+    bucket.acquire(30)
+
+    # 30 tokens at 1 token/second
+    assert sum(clock.slept) == 30
+
+
+def test_token_bucket_refund():
+    clock = FakeClock()
+    bucket = TokenBucket(100, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire(100)
+    bucket.refund(40)
+    bucket.acquire(40)
+
+    assert clock.slept == []
+
+
+def test_oversized_request_is_clamped_to_capacity():
+    """Test that a request larger than the bucket does not wait forever"""
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire(1000)
+
+    assert clock.slept == []
+
+
+def test_run_batch_returns_every_key_with_bounded_concurrency():
+    client = SlowClient()
+    prompts = {f"Account {i}": f"prompt {i}" for i in range(12)}
+
+    results = dict(
+        run_batch(
+            client,
+            prompts,
+            max_workers=3,
+            limiter=RateLimiter(requests_per_minute=6000, tokens_per_minute=10**7),
+        )
+    )
+
+    assert set(results) == set(prompts)
+    assert results["Account 4"].text == "PROMPT 4"
+    assert client.peak <= 3
+
+
+class CachedClient(AnthropicClient):
+    """Client that answers from the network stub once per prompt"""
+
+    def __init__(self, cache):
+        super().__init__(api_key="test-key", cache=cache)
+        self.sent = 0
+
+    def _send(self, payload):
+        self.sent += 1
+        return ClaudeResult(text="answer", status=200, usage={"output_tokens": 5})
+
+
+def test_cached_results_do_not_take_rate_limit_slots(tmp_path):
+    """Test that a fully cached sweep is not throttled by the request limit"""
+    client = CachedClient(ResponseCache(str(tmp_path / "responses.sqlite")))
+    prompts = {f"Account {i}": f"prompt {i}" for i in range(5)}
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=5, tokens_per_minute=10**7)
+    limiter.requests = TokenBucket(5, clock=clock, sleep=clock.sleep)
+
+    dict(run_batch(client, prompts, limiter=limiter))
+    results = dict(run_batch(client, prompts, limiter=limiter))
+
+    assert client.sent == 5
+    assert all(result.cached for result in results.values())
+    assert clock.slept == []
+
+
+def test_build_account_prompts_one_per_company():
+    usage_df = pd.DataFrame(
+        {
+            "Company": ["Acme Corp"] * 2 + ["Zenith PLC"] * 2,
+            "Month": ["2024-01", "2024-02"] * 2,
+            "API_Calls": [100, 150, 200, 100],
+            "Revenue": [0.1, 0.15, 0.2, 0.1],
+            "Use_Cases": [1, 2, 3, 3],
+        }
+    )
+
+    prompts = build_account_prompts(usage_df)
+
+    assert list(prompts) == ["Acme Corp", "Zenith PLC"]
+    assert "Growth (first to last month): 50.0%" in prompts["Acme Corp"]
+    assert "Growth (first to last month): -50.0%" in prompts["Zenith PLC"]
+    assert "2024-02: 150" in prompts["Acme Corp"]
+
+
+def test_build_account_prompts_skips_unobserved_categories():
+    """Test that a filtered categorical frame yields prompts only for its rows"""
+    usage_df = pd.DataFrame(
+        {
+            "Company": pd.Categorical(["Acme Corp"] * 2 + ["Zenith PLC"] * 2),
+            "Month": ["2024-01", "2024-02"] * 2,
+            "API_Calls": [100, 150, 200, 100],
+            "Revenue": [0.1, 0.15, 0.2, 0.1],
+            "Use_Cases": [1, 2, 3, 3],
+        }
+    )
+
+    prompts = build_account_prompts(usage_df[usage_df["Company"] == "Zenith PLC"])
+
+    assert list(prompts) == ["Zenith PLC"]
+    assert "Growth (first to last month): -50.0%" in prompts["Zenith PLC"]
+
+
+def test_uncached_requests_count_one_cache_miss(tmp_path):
+    """Test that each uncached prompt is looked up, and counted, only once"""
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"))
+    client = CachedClient(cache)
+    prompts = {"Acme Corp": "prompt a", "Zenith PLC": "prompt z"}
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=10**7)
+
+    dict(run_batch(client, prompts, limiter=limiter))
+    dict(run_batch(client, prompts, limiter=limiter))
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"]) == (2, 2)
+    assert client.sent == 2
@@ -0,0 +1,50 @@
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.benchmark import compare, load_results, measure, run_cases, save_results
+
+
+def test_measure_loops_fast_calls():
+    """Test that fast calls are looped and every round is recorded"""
+    calls = []
+
+    stats = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+    assert stats["rounds"] == 3
+    assert stats["number"] > 1
+    assert stats["min"] <= stats["median"]
+    assert len(calls) > stats["number"] * 3
+
+
+def test_run_cases_filters_and_passes_setup():
+    seen = []
+    cases = {
+        "data.small": (lambda: (2,), seen.append),
+        "page.home": (tuple, lambda: None),
+    }
+
+    results = run_cases(cases, repeat=1, min_time=0, selected="data.")
+
+    assert list(results) == ["data.small"]
+    assert set(seen) == {2}
+
+
+def test_compare_flags_regressions(tmp_path):
+    """Test that only slowdowns beyond the threshold are regressions"""
+    path = str(tmp_path / "baseline.json")
+    save_results(path, {"a": {"median": 1.0}, "b": {"median": 1.0}})
+
+    rows = compare(
+        load_results(path),
+        {"a": {"median": 1.1}, "b": {"median": 1.5}, "new": {"median": 9.0}},
+        threshold=20,
+    )
+
+    assert [(row["name"], row["regressed"]) for row in rows] == [
+        ("a", False),
+        ("b", True),
+    ]
+    assert round(rows[1]["change"]) == 50
@@ -0,0 +1,129 @@
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm import cache as cache_module
+from etsm.cache import ResponseCache, cache_key
+from etsm.client import AnthropicClient, ClaudeResult
+
+
+def ok_result(text="Cached insight"):
+    return ClaudeResult(
+        text=text, status=200, usage={"input_tokens": 10, "output_tokens": 5}
+    )
+
+
+class CountingClient(AnthropicClient):
+    """Client whose network call is replaced by a counter"""
+
+    def __init__(self, cache):
+        super().__init__(api_key="test-key", cache=cache)
+        self.sent = 0
+
+    def _send(self, payload):
+        self.sent += 1
+        return ok_result(f"answer {self.sent}")
+
+
+def test_cache_key_depends_on_model_tokens_and_prompt():
+    """Test that each input changes the key and equal inputs match"""
+    base = cache_key("claude-sonnet-4-20250514", 1000, "prompt")
+
+    assert base == cache_key("claude-sonnet-4-20250514", 1000, "prompt")
+    assert base != cache_key("claude-sonnet-4-20250514", 500, "prompt")
+    assert base != cache_key("claude-3-5-haiku-20241022", 1000, "prompt")
+    assert base != cache_key("claude-sonnet-4-20250514", 1000, "prompt!")
+
+
+def test_round_trip_and_stats(tmp_path):
+    """Test that stored results come back marked as cached"""
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"))
+
+    assert cache.get("k") is None
+    cache.put("k", ok_result())
+    hit = cache.get("k")
+
+    assert hit.text == "Cached insight"
+    assert hit.output_tokens == 5
+    assert hit.cached
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_failed_results_are_not_stored(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"))
+
+    cache.put("k", ClaudeResult(status=529, error="API Error: 529 - overloaded"))
+
+    assert cache.get("k") is None
+
+
+def test_entries_survive_reopen(tmp_path):
+    """Test that a new cache on the same file sees earlier entries"""
+    path = str(tmp_path / "responses.sqlite")
+    ResponseCache(path).put("k", ok_result())
+
+    assert ResponseCache(path).get("k").text == "Cached insight"
+
+
+def test_ttl_expiry(tmp_path, monkeypatch):
+    """Test that entries older than the TTL are treated as misses"""
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+    cache.put("k", ok_result())
+    now[0] += 61
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    """Test that the least recently read entry is evicted first"""
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), max_entries=2)
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+    for key in ["a", "b"]:
+        now[0] += 1
+        cache.put(key, ok_result(key))
+    now[0] += 1
+    cache.get("a")
+    now[0] += 1
+    cache.put("c", ok_result("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").text == "a"
+    assert cache.get("c").text == "c"
+
+
+def test_client_uses_cache_and_bypass(tmp_path):
+    """Test that repeats are served from cache unless bypassed"""
+    client = CountingClient(ResponseCache(str(tmp_path / "responses.sqlite")))
+
+    first = client.create_message("Analyze accounts")
+    second = client.create_message("Analyze accounts")
+    bypassed = client.create_message("Analyze accounts", use_cache=False)
+    latest = client.create_message("Analyze accounts")
+
+    assert client.sent == 2
+    assert not first.cached
+    assert second.cached and second.text == first.text
+    assert not bypassed.cached
+    assert latest.text == bypassed.text
+
+
+def test_context_is_part_of_the_key(tmp_path):
+    """Test that the same question over different data is not a cache hit"""
+    client = CountingClient(ResponseCache(str(tmp_path / "responses.sqlite")))
+
+    client.create_message("Analyze accounts", context="January data")
+    client.create_message("Analyze accounts", context="February data")
+    client.create_message("Analyze accounts", context="January data")
+
+    assert client.sent == 2
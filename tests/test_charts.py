@@ -0,0 +1,111 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.charts import (
+    OTHER_LABEL,
+    SERIES_COLORS,
+    lttb_indices,
+    minmax_indices,
+    top_n_with_other,
+    trend_figure,
+)
+from etsm.data import generate_api_usage_data, generate_synthetic_usage
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    """Test that LTTB keeps the first, last and extreme points"""
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[500] = 10
+
+    kept = lttb_indices(x, y, 50)
+
+    assert len(kept) == 50
+    assert kept[0] == 0 and kept[-1] == 999
+    assert 500 in kept
+    assert (np.diff(kept) > 0).all()
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = np.sin(np.linspace(0, 20, 5000))
+
+    kept = minmax_indices(y, 100)
+
+    assert len(kept) <= 100
+    assert y.argmax() in kept and y.argmin() in kept
+
+
+def test_small_series_are_untouched():
+    assert list(lttb_indices([0, 1, 2], [1, 2, 3], 10)) == [0, 1, 2]
+    assert list(minmax_indices(np.array([3, 1]), 10)) == [0, 1]
+
+
+def test_trend_figure_is_bounded():
+    """Test that many daily series become top-N plus Other in WebGL"""
+    usage_df = generate_synthetic_usage(60, granularity="daily", seed=2)
+
+    fig = trend_figure(
+        usage_df,
+        "Date",
+        "API_Calls",
+        "Company",
+        "Trends",
+        top_n=5,
+        max_points=100,
+        webgl_threshold=500,
+    )
+
+    assert [trace.name for trace in fig.data][-1] == OTHER_LABEL
+    assert len(fig.data) == 6
+    assert all(len(trace.y) <= 100 for trace in fig.data)
+    assert fig.data[0].type == "scattergl"
+
+
+def test_trend_figure_keeps_demo_data_intact():
+    """Test that five monthly accounts are drawn in full with SVG lines"""
+    usage_df = generate_api_usage_data(seed=4)
+
+    fig = trend_figure(usage_df, "Month", "API_Calls", "Company", "Trends")
+
+    assert len(fig.data) == 5
+    assert sum(len(trace.y) for trace in fig.data) == len(usage_df)
+    assert fig.data[0].type == "scatter"
+
+
+def test_demo_accounts_keep_their_colors_whatever_their_rank():
+    """Test that colors follow the series name rather than its usage rank"""
+    usage_df = generate_synthetic_usage(12, seed=4)
+
+    fig = trend_figure(usage_df, "Month", "API_Calls", "Company", "Trends", top_n=8)
+
+    colors = {trace.name: trace.line.color for trace in fig.data}
+    for name, color in SERIES_COLORS.items():
+        if name in colors:
+            assert colors[name] == color
+    others = [c for n, c in colors.items() if n not in SERIES_COLORS]
+    assert len(set(others)) == len(others)
+    assert not set(others) & set(SERIES_COLORS.values())
+
+
+def test_categorical_columns_add_no_zero_points():
+    """Test that only observed series/month pairs are plotted"""
+    df = pd.DataFrame(
+        {
+            "Company": pd.Categorical(["A", "A", "B", "B", "C", "C"]),
+            "Month": pd.Categorical(
+                ["2024-01", "2024-02", "2024-03", "2024-04", "2024-05", "2024-06"]
+            ),
+            "API_Calls": [1, 2, 3, 4, 5, 6],
+        }
+    )
+
+    grouped, order = top_n_with_other(df, "Month", "API_Calls", "Company", 3)
+
+    assert len(grouped) == 6
+    assert (grouped["API_Calls"] > 0).all()
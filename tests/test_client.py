@@ -0,0 +1,299 @@
+import json
+import pytest
+import requests
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm import client as client_module
+from etsm.client import AnthropicClient, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None, text=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.headers = headers or {}
+        self.text = text if text is not None else str(self._body)
+
+    def json(self):
+        return self._body
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Replays queued responses/exceptions and records each request"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+OK_BODY = {
+    "content": [{"type": "text", "text": "Focus on Zenith PLC."}],
+    "usage": {"input_tokens": 120, "output_tokens": 45},
+    "stop_reason": "end_turn",
+    "model": "claude-sonnet-4-20250514",
+}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff sleeps instead of waiting"""
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture(autouse=True)
+def default_base_url(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+
+
+def make_client(outcomes, **kwargs):
+    session = FakeSession(outcomes)
+    return AnthropicClient(api_key="test-key", session=session, **kwargs), session
+
+
+def test_successful_call_returns_structured_result():
+    """Test that text, usage and status are parsed from a 200 response"""
+    client, session = make_client([FakeResponse(200, OK_BODY)])
+
+    result = client.create_message("Analyze accounts")
+
+    assert result.ok
+    assert result.text == "Focus on Zenith PLC."
+    assert result.status == 200
+    assert result.input_tokens == 120
+    assert result.output_tokens == 45
+    assert result.stop_reason == "end_turn"
+    assert result.attempts == 1
+
+    url, kwargs = session.calls[0]
+    assert url == "https://api.anthropic.com/v1/messages"
+    assert kwargs["timeout"] == (5.0, 60.0)
+    assert kwargs["headers"]["x-api-key"] == "test-key"
+
+
+def test_retries_on_overload_then_succeeds(no_sleep):
+    """Test that 429/529 responses are retried with backoff"""
+    client, session = make_client(
+        [
+            FakeResponse(529, text="overloaded"),
+            FakeResponse(429, headers={"retry-after": "2"}),
+            FakeResponse(200, OK_BODY),
+        ]
+    )
+
+    result = client.create_message("Analyze accounts")
+
+    assert result.ok
+    assert result.attempts == 3
+    assert len(no_sleep) == 2
+    # The retry-after header sets the floor for the second delay
+    assert no_sleep[1] >= 2
+
+
+def test_gives_up_after_max_retries():
+    """Test that the final retryable error is reported, not raised"""
+    client, session = make_client(
+        [FakeResponse(503, text="unavailable")] * 3, max_retries=2
+    )
+
+    result = client.create_message("Analyze accounts")
+
+    assert not result.ok
+    assert result.status == 503
+    assert result.attempts == 3
+    assert "503" in result.error
+
+
+def test_client_errors_are_not_retried():
+    """Test that a 400 fails immediately"""
+    client, session = make_client([FakeResponse(400, text="bad request")])
+
+    result = client.create_message("Analyze accounts")
+
+    assert result.status == 400
+    assert result.attempts == 1
+    assert len(session.calls) == 1
+
+
+def test_timeouts_are_retried():
+    """Test that connection timeouts count as retryable attempts"""
+    client, session = make_client(
+        [requests.Timeout("read timed out"), FakeResponse(200, OK_BODY)]
+    )
+
+    result = client.create_message("Analyze accounts")
+
+    assert result.ok
+    assert result.attempts == 2
+
+
+def test_missing_api_key(monkeypatch):
+    """Test that no request is made without an API key"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    session = FakeSession([])
+    client = AnthropicClient(session=session)
+
+    result = client.create_message("Analyze accounts")
+
+    assert not result.ok
+    assert "API key not found" in result.error
+    assert session.calls == []
+
+
+def test_backoff_delay_is_bounded():
+    """Test that jittered delays stay under the exponential ceiling"""
+    client = AnthropicClient(api_key="k", backoff_base=1.0, backoff_max=4.0)
+
+    for attempt in range(1, 8):
+        assert 0 <= client.backoff_delay(attempt) <= 4.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+def sse_lines(*events):
+    lines = []
+    for event, data in events:
+        lines += [f"event: {event}", f"data: {json.dumps(data)}", ""]
+    return [line.encode("utf-8") for line in lines]
+
+
+class FakeStreamResponse(FakeResponse):
+    def __init__(self, lines):
+        super().__init__(200, text="")
+        self.lines = lines
+
+    def iter_lines(self):
+        return iter(self.lines)
+
+
+STREAM_EVENTS = [
+    (
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {
+                "model": "claude-sonnet-4-20250514",
+                "usage": {"input_tokens": 80, "output_tokens": 1},
+            },
+        },
+    ),
+    ("ping", {"type": "ping"}),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+    ),
+    (
+        "content_block_delta",
+        {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "!"}},
+    ),
+    (
+        "message_delta",
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": 12},
+        },
+    ),
+    ("message_stop", {"type": "message_stop"}),
+]
+
+
+def test_stream_yields_text_and_final_usage():
+    """Test that deltas stream in order and the final event fills usage"""
+    client, session = make_client([FakeStreamResponse(sse_lines(*STREAM_EVENTS))])
+
+    stream = client.stream_message("Analyze accounts")
+    chunks = list(stream)
+
+    assert chunks == ["Hi", "!"]
+    result = stream.result
+    assert result.ok
+    assert result.text == "Hi!"
+    assert result.stop_reason == "end_turn"
+    assert result.input_tokens == 80
+    assert result.output_tokens == 12
+    assert result.time_to_first_token is not None
+    url, kwargs = session.calls[0]
+    assert kwargs["json"]["stream"] is True
+    assert kwargs["stream"] is True
+
+
+def test_stream_error_event_is_reported():
+    """Test that an in-stream error event marks the result as failed"""
+    events = STREAM_EVENTS[:3] + [
+        ("error", {"type": "error", "error": {"type": "overloaded_error"}})
+    ]
+    client, session = make_client([FakeStreamResponse(sse_lines(*events))])
+
+    stream = client.stream_message("Analyze accounts")
+    list(stream)
+
+    assert not stream.result.ok
+    assert stream.result.text == "Hi"
+    assert "overloaded_error" in stream.result.error
+
+
+def test_context_is_sent_as_cacheable_prefix():
+    """Test that shared context is marked with cache_control ahead of the question"""
+    body = dict(
+        OK_BODY,
+        usage={
+            "input_tokens": 20,
+            "output_tokens": 45,
+            "cache_read_input_tokens": 1500,
+            "cache_creation_input_tokens": 0,
+        },
+    )
+    client, session = make_client([FakeResponse(200, body)])
+
+    result = client.create_message("Which account is at risk?", context="DATA")
+
+    content = session.calls[0][1]["json"]["messages"][0]["content"]
+    assert content[0] == {
+        "type": "text",
+        "text": "DATA",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert content[1] == {"type": "text", "text": "Which account is at risk?"}
+    assert result.cache_read_tokens == 1500
+    assert result.cache_write_tokens == 0
+
+
+def test_hooks_see_every_finished_result():
+    """Test that hooks receive blocking, streamed and retried results"""
+    finished = []
+    client, _ = make_client(
+        [
+            FakeResponse(529, text="overloaded"),
+            FakeResponse(200, OK_BODY),
+            FakeStreamResponse(sse_lines(*STREAM_EVENTS)),
+        ],
+        hooks=[finished.append],
+    )
+
+    client.create_message("Analyze accounts")
+    list(client.stream_message("Analyze accounts"))
+
+    assert [(r.status, r.attempts, r.text) for r in finished] == [
+        (200, 2, "Focus on Zenith PLC."),
+        (200, 1, "Hi!"),
+    ]
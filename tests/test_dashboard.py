@@ -1,118 +1,86 @@
+import subprocess
 import pytest
 import pandas as pd
 import sys
 import os
 
 # Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.append(SRC)
 
+from etsm.data import generate_api_usage_data, generate_strategy_data
+from etsm.loadtest import isolated_environ
+from etsm.pages import PAGES
 
-def test_executive_data_generation():
-    """Test that executive data is generated correctly"""
-    from dashboard import generate_executive_data
 
-    df = generate_executive_data()
-
-    # Check basic structure
-    assert isinstance(df, pd.DataFrame)
-    assert len(df) > 0
-
-    # Check required columns
-    required_columns = [
-        "Name",
-        "Title",
-        "Company",
-        "Relationship_Score",
-        "Last_Meeting",
-        "Next_Meeting",
-        "Strategic_Initiatives",
-        "Influence_Level",
-        "Decision_Maker",
-    ]
-
-    for col in required_columns:
-        assert col in df.columns
-
-    # Check data types
-    assert df["Relationship_Score"].dtype in ["int64", "float64"]
-    assert df["Strategic_Initiatives"].dtype in ["int64", "float64"]
-    assert df["Decision_Maker"].dtype == "bool"
+def imported_modules(statement):
+    """Modules loaded by running ``statement`` in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.split())
 
 
-def test_account_planning_data_generation():
-    """Test that account planning data is generated correctly"""
-    from dashboard import generate_account_planning_data
-
-    df = generate_account_planning_data()
+def test_usage_data_generation():
+    """Test that usage data is generated correctly"""
+    df = generate_api_usage_data(seed=0)
 
     # Check basic structure
     assert isinstance(df, pd.DataFrame)
     assert len(df) > 0
 
     # Check required columns
-    required_columns = [
-        "Account",
-        "Health_Score",
-        "API_Usage",
-        "Growth_Rate",
-        "Expansion_Opportunities",
-        "Risk_Level",
-        "Next_Quarter_Goal",
-        "Strategic_Initiatives",
-        "Key_Stakeholders",
-        "Last_QBR",
-        "Next_QBR",
-    ]
-
-    for col in required_columns:
+    for col in ["Company", "Month", "API_Calls", "Revenue", "Use_Cases"]:
         assert col in df.columns
 
-    # Check data types
-    assert df["Health_Score"].dtype in ["int64", "float64"]
-    assert df["API_Usage"].dtype in ["int64", "float64"]
-    assert df["Growth_Rate"].dtype in ["int64", "float64"]
-
+    # Check that API calls are non-negative
+    assert (df["API_Calls"] >= 0).all()
 
-def test_usage_trends_generation():
-    """Test that usage trends data is generated correctly"""
-    from dashboard import generate_usage_trends
 
-    df = generate_usage_trends()
+def test_strategy_data_generation():
+    """Test that strategy board data is generated correctly"""
+    df = generate_strategy_data()
 
-    # Check basic structure
-    assert isinstance(df, pd.DataFrame)
     assert len(df) > 0
+    assert df["Expected_Revenue"].dtype in ["int64", "float64"]
+    assert set(df["Status"]) <= {"Planning", "In Progress", "Completed", "On Hold"}
 
-    # Check required columns
-    required_columns = ["Date", "Company", "API_Calls"]
 
-    for col in required_columns:
-        assert col in df.columns
-
-    # Check that API calls are non-negative
-    assert (df["API_Calls"] >= 0).all()
+def test_library_imports_without_streamlit():
+    """Test that data, metrics and API code import without Streamlit"""
+    modules = imported_modules(
+        "import etsm.data, etsm.metrics, etsm.prompts, etsm.client, etsm.rollups"
+    )
 
+    assert "streamlit" not in modules
 
-def test_relationship_score_range():
-    """Test that relationship scores are within valid range"""
-    from dashboard import generate_executive_data
 
-    df = generate_executive_data()
+def test_app_import_is_lazy():
+    """Test that importing the app renders nothing and loads no page modules"""
+    modules = imported_modules("import etsm.app")
 
-    # Relationship scores should be between 0 and 100
-    assert (df["Relationship_Score"] >= 0).all()
-    assert (df["Relationship_Score"] <= 100).all()
+    assert not {f"etsm.pages.{name}" for name in PAGES.values()} & modules
+    assert "plotly.express" not in modules
+    assert "requests" not in modules
 
 
-def test_account_health_range():
-    """Test that account health scores are within valid range"""
-    from dashboard import generate_account_planning_data
+@pytest.mark.parametrize("page", list(PAGES))
+def test_page_renders(page, tmp_path, monkeypatch):
+    """Test that every page renders without exceptions"""
+    from streamlit.testing.v1 import AppTest
 
-    df = generate_account_planning_data()
+    # Ledger, caches and stores live under tmp_path, never the working tree
+    for name, value in isolated_environ(str(tmp_path)).items():
+        monkeypatch.setenv(name, value)
+    at = AppTest.from_file(os.path.join(SRC, "dashboard.py"), default_timeout=60)
+    at.run()
+    at.sidebar.selectbox[0].select(page).run()
 
-    # Health scores should be between 0 and 100
-    assert (df["Health_Score"] >= 0).all()
-    assert (df["Health_Score"] <= 100).all()
+    assert not at.exception
 
 
 if __name__ == "__main__":
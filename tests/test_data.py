@@ -0,0 +1,106 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import (
+    DEFAULT_COMPANIES,
+    generate_api_usage_data,
+    generate_strategy_data,
+    generate_synthetic_strategies,
+    generate_synthetic_usage,
+)
+
+
+def test_api_usage_data_shape():
+    """Test that the demo frame keeps its 5 companies x 12 months layout"""
+    df = generate_api_usage_data(seed=7)
+
+    assert list(df.columns) == ["Company", "Month", "API_Calls", "Revenue", "Use_Cases"]
+    assert len(df) == 60
+    assert list(df["Company"].unique()) == DEFAULT_COMPANIES
+    assert df["Month"].iloc[0] == "2024-01"
+    assert df["Month"].iloc[11] == "2024-12"
+    assert (df["API_Calls"] >= 0).all()
+    assert df["Use_Cases"].between(1, 5).all()
+
+
+def test_demo_growth_profiles():
+    """Test that Acme Corp grows and Zenith PLC declines month over month"""
+    df = generate_api_usage_data(seed=7)
+
+    acme = df.loc[df["Company"] == "Acme Corp", "API_Calls"].to_numpy()
+    zenith = df.loc[df["Company"] == "Zenith PLC", "API_Calls"].to_numpy()
+    assert (np.diff(acme) > 0).all()
+    assert (np.diff(zenith) < 0).all()
+
+
+def test_synthetic_usage_is_deterministic_per_seed():
+    first = generate_synthetic_usage(n_companies=200, seed=42)
+    second = generate_synthetic_usage(n_companies=200, seed=42)
+    other = generate_synthetic_usage(n_companies=200, seed=43)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first["API_Calls"].equals(other["API_Calls"])
+
+
+def test_synthetic_usage_daily_granularity():
+    df = generate_synthetic_usage(
+        n_companies=3, granularity="daily", start="2024-01-01", end="2024-03-31"
+    )
+
+    assert len(df) == 3 * 91
+    assert df["Date"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert df["Month"].iloc[31] == "2024-02"
+    assert df["Company"].nunique() == 3
+
+
+def test_synthetic_usage_profile_sequence():
+    """Test that named profiles are assigned to companies in order"""
+    df = generate_synthetic_usage(
+        n_companies=4, growth_profiles=["declining", "growing"], seed=1
+    )
+
+    first_last = df.groupby("Company", observed=True, sort=False)["API_Calls"].agg(
+        ["first", "last"]
+    )
+    growth = (first_last["last"] > first_last["first"]).tolist()
+    assert growth == [False, True, False, True]
+
+
+def test_declining_usage_never_produces_negative_revenue():
+    """Test that calls and revenue are both clipped at zero"""
+    df = generate_synthetic_usage(
+        n_companies=200, start="2022-01-01", end="2024-12-31", seed=0
+    )
+
+    assert (df["API_Calls"] >= 0).all()
+    assert (df["Revenue"] >= 0).all()
+    assert (df["API_Calls"] == 0).any()
+
+
+def test_synthetic_usage_rejects_unknown_granularity():
+    with pytest.raises(ValueError):
+        generate_synthetic_usage(granularity="hourly")
+
+
+def test_strategy_data_columns():
+    df = generate_strategy_data()
+
+    for col in ["Account", "Strategy", "Status", "Priority", "Expected_Revenue"]:
+        assert col in df.columns
+
+
+def test_synthetic_strategies_match_the_board_columns():
+    """Test that the synthetic pipeline has the demo columns and is seeded"""
+    df = generate_synthetic_strategies(2000, seed=3)
+
+    assert list(df.columns) == list(generate_strategy_data().columns)
+    assert len(df) == 2000
+    assert df["Account"].nunique() <= 500
+    pd.testing.assert_frame_equal(df, generate_synthetic_strategies(2000, seed=3))
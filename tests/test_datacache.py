@@ -0,0 +1,117 @@
+import threading
+import time
+import sys
+import os
+
+import pandas as pd
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.datacache import DatasetCache, estimate_size
+
+
+def frame(rows):
+    return pd.DataFrame({"API_Calls": range(rows)})
+
+
+def test_computes_once_per_version():
+    cache = DatasetCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return frame(10)
+
+    first = cache.get_or_compute("usage", "v1", compute)
+    second = cache.get_or_compute("usage", "v1", compute)
+    cache.get_or_compute("usage", "v2", compute)
+
+    assert first is second
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_params_are_part_of_the_key():
+    cache = DatasetCache()
+
+    a = cache.get_or_compute("usage", "v1", lambda: "a", params=("Company",))
+    b = cache.get_or_compute("usage", "v1", lambda: "b", params=("Revenue",))
+
+    assert (a, b) == ("a", "b")
+
+
+def test_memory_cap_evicts_least_recently_used():
+    """Test that entries are dropped oldest-first once over the byte cap"""
+    entry_size = estimate_size(frame(1000))
+    cache = DatasetCache(max_bytes=int(entry_size * 2.5))
+
+    cache.get_or_compute("a", "v1", lambda: frame(1000))
+    cache.get_or_compute("b", "v1", lambda: frame(1000))
+    cache.get_or_compute("a", "v1", lambda: frame(1000))  # a is now most recent
+    cache.get_or_compute("c", "v1", lambda: frame(1000))
+
+    recomputed = []
+    cache.get_or_compute("a", "v1", lambda: recomputed.append("a"))
+    cache.get_or_compute("b", "v1", lambda: recomputed.append("b"))
+    assert recomputed == ["b"]
+    assert cache.stats()["size_bytes"] <= cache.max_bytes
+
+
+def test_invalidate_by_name():
+    cache = DatasetCache()
+    cache.get_or_compute("usage", "v1", lambda: 1)
+    cache.get_or_compute("strategies", "v1", lambda: 2)
+
+    cache.invalidate("usage")
+
+    assert cache.stats()["entries"] == 1
+    assert cache.get_or_compute("usage", "v1", lambda: 3) == 3
+
+
+def test_concurrent_requests_share_one_computation():
+    cache = DatasetCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return frame(5)
+
+    threads = [
+        threading.Thread(target=cache.get_or_compute, args=("usage", "v1", compute))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+
+
+def test_figure_dicts_are_sized_by_their_data():
+    """Test that a cached figure dict counts its arrays, not just the dict"""
+    import numpy as np
+    import plotly.graph_objects as go
+
+    figure = go.Figure(go.Scatter(x=np.arange(5000), y=np.arange(5000.0))).to_dict()
+
+    assert estimate_size(figure) > 2 * 5000 * 8
+
+
+def test_rollup_store_is_sized_by_its_buckets():
+    from etsm.rollups import RollupStore
+
+    usage_df = pd.DataFrame(
+        {
+            "Company": [f"Account {i % 200}" for i in range(2400)],
+            "Month": [f"2024-{i // 200 + 1:02d}" for i in range(2400)],
+            "API_Calls": range(2400),
+        }
+    )
+    store = RollupStore.from_frame(usage_df)
+    store.by_company()
+
+    assert estimate_size(store) >= store.by_company().memory_usage(deep=True).sum()
+    assert estimate_size(store) > 100_000
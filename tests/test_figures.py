@@ -0,0 +1,53 @@
+import sys
+import os
+
+import pandas as pd
+import plotly.io as pio
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_api_usage_data
+from etsm.figures import (
+    PRIORITY_COLORS,
+    STATUS_COLORS,
+    distribution_bar,
+    distribution_pie,
+    ranked_bar,
+    usage_trend,
+)
+
+
+def test_template_is_registered():
+    """Test that the dashboard style lives in one registered template"""
+    layout = pio.templates["etsm"].layout
+
+    assert layout.plot_bgcolor == "white"
+    assert layout.font.color == "black"
+    assert layout.xaxis.gridcolor == "#e0e0e0"
+
+
+def test_builders_use_the_template():
+    usage_df = generate_api_usage_data(seed=1)
+    counts = pd.Series([3, 1], index=["Planning", "Completed"])
+
+    figures = [
+        usage_trend(usage_df),
+        ranked_bar(usage_df.groupby("Company")["API_Calls"].sum(), "Usage", "Blues"),
+        distribution_pie(counts, "Status", STATUS_COLORS),
+        distribution_bar(counts, "Priority", PRIORITY_COLORS),
+    ]
+
+    for fig in figures:
+        assert fig.layout.template.layout.plot_bgcolor == "white"
+
+
+def test_distribution_colors_follow_the_labels():
+    counts = pd.Series([2, 5], index=["Critical", "Low"])
+
+    fig = distribution_bar(counts, "Priority", PRIORITY_COLORS)
+
+    assert {trace.name: trace.marker.color for trace in fig.data} == {
+        "Critical": "#9467bd",
+        "Low": "#2ca02c",
+    }
@@ -0,0 +1,121 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_synthetic_usage
+from etsm.forecast import UsageForecaster, future_months, portfolio_forecast
+from etsm.health import usage_matrix
+
+MONTHS = [f"2024-{m:02d}" for m in range(1, 13)]
+
+
+@pytest.fixture
+def usage():
+    return usage_matrix(generate_synthetic_usage(50, seed=6))
+
+
+@pytest.mark.parametrize("method", ["holt", "linear"])
+def test_straight_lines_are_extrapolated(method):
+    """Test that noiseless linear series continue their trend with no spread"""
+    accounts = pd.Index(["Up", "Down"])
+    steps = np.arange(12, dtype=float)
+    matrix = np.vstack([100 + 10 * steps, 500 - 20 * steps])
+    forecaster = UsageForecaster(method)
+    forecaster.refresh(accounts, MONTHS, matrix)
+
+    forecast = forecaster.forecast(horizons=(1, 3))
+
+    assert forecast["point"] == pytest.approx(
+        np.array([[220, 240], [260, 220]]), rel=1e-6
+    )
+    assert forecast["upper"] - forecast["lower"] == pytest.approx(0, abs=1e-6)
+
+
+@pytest.mark.parametrize("method", ["holt", "linear"])
+def test_new_month_refits_incrementally(usage, method):
+    """Test that appending a month matches a full refit and only steps once"""
+    accounts, months, matrix = usage
+    incremental = UsageForecaster(method)
+    incremental.refresh(accounts, months[:-1], matrix[:, :-1])
+    full = UsageForecaster(method)
+    full.refresh(accounts, months, matrix)
+
+    processed = incremental.refresh(accounts, months, matrix)
+
+    assert processed == 1
+    assert incremental.refresh(accounts, months, matrix) == 0
+    for key in ("point", "lower", "upper"):
+        np.testing.assert_allclose(
+            incremental.forecast()[key], full.forecast()[key], rtol=1e-9
+        )
+
+
+def test_changed_history_triggers_a_full_refit(usage):
+    """Test that edits to earlier months are not applied incrementally"""
+    accounts, months, matrix = usage
+    forecaster = UsageForecaster()
+    forecaster.refresh(accounts, months, matrix)
+    revised = matrix.copy()
+    revised[:, 0] *= 2
+
+    assert forecaster.refresh(accounts, months, revised) == len(months)
+
+
+def test_intervals_widen_with_the_horizon(usage):
+    """Test that intervals contain the point and grow further out"""
+    forecaster = UsageForecaster()
+    forecaster.refresh(*usage)
+
+    forecast = forecaster.forecast(horizons=(1, 3, 6))
+
+    assert (forecast["lower"] <= forecast["point"]).all()
+    assert (forecast["point"] <= forecast["upper"]).all()
+    assert (np.diff(forecast["std"], axis=1) >= 0).all()
+
+
+def test_missing_months_and_late_starts():
+    """Test that NaN months are skipped and accounts may start late"""
+    matrix = np.array(
+        [[np.nan, np.nan, 10, 20, 30, 40], [10, np.nan, 30, 40, 50, 60]], float
+    )
+    forecaster = UsageForecaster("linear")
+    forecaster.refresh(pd.Index(["Late", "Gap"]), MONTHS[:6], matrix)
+
+    forecast = forecaster.forecast(horizons=(1,))
+
+    assert forecast["point"][:, 0] == pytest.approx([50, 70])
+
+
+def test_portfolio_forecast_sums_accounts(usage):
+    """Test that portfolio points add up and the interval is not wider than
+    the sum of account intervals"""
+    forecaster = UsageForecaster()
+    forecaster.refresh(*usage)
+    forecast = forecaster.forecast()
+
+    total = portfolio_forecast(forecast)
+
+    assert total["point"] == pytest.approx(forecast["point"].sum(axis=0))
+    assert (total["std"] <= forecast["std"].sum(axis=0) + 1e-9).all()
+
+
+def test_unknown_method_is_rejected():
+    """Test that only the supported models can be chosen"""
+    with pytest.raises(ValueError):
+        UsageForecaster("arima")
+
+
+def test_future_months_roll_over_the_year():
+    """Test that horizon labels continue into the next year"""
+    assert future_months("2024-11", (1, 2, 3, 14)) == [
+        "2024-12",
+        "2025-01",
+        "2025-02",
+        "2026-01",
+    ]
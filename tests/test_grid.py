@@ -0,0 +1,55 @@
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pandas as pd
+
+from etsm.grid import page_count, paginate, query_frame
+
+
+def accounts():
+    return pd.DataFrame(
+        {
+            "Account": ["TechCorp", "DataFlow", "CloudTech", "StartupXYZ", "AI Co"],
+            "Growth Rate": [0.2, -0.1, 0.0, 0.5, -0.3],
+            "Health": ["Healthy", "Declining", "Stable", "Healthy", "Declining"],
+        }
+    )
+
+
+def test_query_filters_searches_and_sorts():
+    """Test that filters and search combine and the worst growth comes first"""
+    view = query_frame(
+        accounts(),
+        filters={"Health": ["Declining", "Stable"]},
+        search="tech",
+        search_column="Account",
+        sort_by="Growth Rate",
+    )
+
+    assert list(view["Account"]) == ["CloudTech"]
+    worst_first = query_frame(accounts(), sort_by="Growth Rate")
+    assert list(worst_first["Account"][:2]) == ["AI Co", "DataFlow"]
+
+
+def test_empty_filters_keep_every_row():
+    assert len(query_frame(accounts(), filters={"Health": []})) == 5
+
+
+def test_paginate_clamps_page_numbers():
+    """Test that pages past either end return the nearest valid page"""
+    rows, pages = paginate(accounts(), 3, 2)
+
+    assert pages == 3
+    assert list(rows["Account"]) == ["AI Co"]
+    assert list(paginate(accounts(), 9, 2)[0]["Account"]) == ["AI Co"]
+    assert len(paginate(accounts(), 0, 2)[0]) == 2
+    assert paginate(accounts().iloc[:0], 1, 2)[1] == 1
+
+
+def test_page_count_matches_paginate():
+    for rows in (0, 1, 2, 3, 5):
+        frame = accounts().iloc[:rows]
+        assert page_count(rows, 2) == paginate(frame, 1, 2)[1]
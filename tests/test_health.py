@@ -0,0 +1,111 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_api_usage_data, generate_synthetic_usage
+from etsm.health import (
+    ANOMALY_LABEL,
+    account_health,
+    robust_zscores,
+    rolling_growth,
+    score_matrix,
+    usage_matrix,
+)
+
+
+def frame(series):
+    """Usage rows for ``{company: monthly calls}``"""
+    rows = [
+        {"Company": company, "Month": f"2024-{m + 1:02d}", "API_Calls": calls}
+        for company, values in series.items()
+        for m, calls in enumerate(values)
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_usage_matrix_pivots_categorical_and_plain_frames():
+    """Test that the matrix holds one row per company and one column per month"""
+    usage_df = generate_synthetic_usage(7, seed=1)
+
+    accounts, months, matrix = usage_matrix(usage_df)
+    plain = usage_matrix(usage_df.astype({"Company": str, "Month": str}))
+
+    assert matrix.shape == (7, 12)
+    assert list(months) == sorted(usage_df["Month"].astype(str).unique())
+    expected = usage_df.pivot(index="Company", columns="Month", values="API_Calls")
+    np.testing.assert_array_equal(matrix, expected.loc[accounts].to_numpy())
+    np.testing.assert_array_equal(plain[2], expected.loc[plain[0]].to_numpy())
+
+
+def test_rolling_growth_compares_consecutive_windows():
+    """Test that growth is the last window mean over the previous window mean"""
+    matrix = np.array([[10, 10, 10, 20, 20, 20], [5, np.nan, 5, 4, 4, 4]], float)
+
+    growth = rolling_growth(matrix, window=3)
+
+    assert growth.shape == (2, 1)
+    assert growth[:, -1] == pytest.approx([1.0, -0.2])
+
+
+def test_robust_zscores_flag_a_spike():
+    """Test that one spike stands out while ordinary noise does not"""
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 0.05, size=(2, 24))
+    values[0, 10] = 1.0
+
+    scores = robust_zscores(values)
+
+    assert abs(scores[0, 10]) > 10
+    assert (np.abs(np.delete(scores[0], 10)) < 3.5).all()
+
+
+def test_seasonal_pattern_is_not_anomalous():
+    """Test that a repeating yearly spike is explained by the seasonal profile"""
+    base = np.tile(np.r_[np.full(11, 100.0), 200.0], 3)
+    noise = np.random.default_rng(2).uniform(0.98, 1.02, size=36)
+    seasonal = base * noise
+    one_off = seasonal.copy()
+    one_off[30] *= 3
+
+    stats = score_matrix(np.vstack([seasonal, one_off]))
+
+    assert stats["anomalies"][0] == 0
+    assert stats["anomalies"][1] > 0
+
+
+def test_health_labels_and_scores():
+    """Test labels from rolling growth, latest anomalies and score ordering"""
+    usage_df = frame(
+        {
+            "Growing": [100, 110, 120, 130, 150, 170, 190, 210, 240],
+            "Flat": [100, 101, 99, 100, 100, 101, 99, 100, 100],
+            "Declining": [200, 190, 180, 170, 160, 150, 140, 130, 120],
+            "Spiking": [100, 101, 99, 100, 100, 101, 99, 100, 900],
+        }
+    )
+
+    health = account_health(usage_df)
+
+    assert health.loc["Growing", "health"] == "✅ Healthy Growth"
+    assert health.loc["Flat", "health"] == "🔄 Stable Usage"
+    assert health.loc["Declining", "health"] == "⚠️ Declining Usage"
+    assert health.loc["Spiking", "health"] == ANOMALY_LABEL
+    assert health.loc["Growing", "score"] > health.loc["Flat", "score"]
+    assert health.loc["Flat", "score"] > health.loc["Declining", "score"]
+    assert health["score"].between(0, 100).all()
+
+
+def test_account_health_matches_account_metrics_index():
+    """Test that health rows line up with the per-account metrics"""
+    usage_df = generate_api_usage_data(seed=4)
+
+    health = account_health(usage_df)
+
+    assert sorted(health.index) == sorted(usage_df["Company"].unique())
+    assert not health[["volatility", "score"]].isna().any().any()
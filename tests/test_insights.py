@@ -0,0 +1,84 @@
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import precompute
+from etsm.client import ClaudeResult
+from etsm.insights import InsightStore, insight_record, prompt_hash
+from etsm.prompts import PORTFOLIO_QUESTION, build_portfolio_context
+from etsm.snapshot import build_snapshot
+from etsm.sources import usage_source_from_env
+
+
+def test_latest_returns_newest_version(tmp_path):
+    """Test that readers see the most recently saved snapshot"""
+    store = InsightStore(str(tmp_path))
+    start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    store.save(portfolio={"text": "old"}, now=start)
+    store.save(portfolio={"text": "new"}, now=start + timedelta(hours=1))
+
+    assert len(store.versions()) == 2
+    assert store.latest()["portfolio"]["text"] == "new"
+
+
+def test_empty_store_has_no_latest(tmp_path):
+    assert InsightStore(str(tmp_path / "missing")).latest() is None
+
+
+def test_prune_keeps_newest(tmp_path):
+    store = InsightStore(str(tmp_path))
+    start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    for hour in range(4):
+        store.save(portfolio={"text": hour}, now=start + timedelta(hours=hour))
+
+    store.prune(2)
+
+    assert len(store.versions()) == 2
+    assert store.latest()["portfolio"]["text"] == 3
+
+
+def test_insight_record_fingerprints_prompt():
+    result = ClaudeResult(text="insight", status=200, raw="{...}")
+
+    record = insight_record("  Analyze accounts\n", result)
+
+    assert record["text"] == "insight"
+    assert record["prompt_hash"] == prompt_hash("Analyze accounts")
+    assert "raw" not in record
+
+
+def test_precompute_cli_with_stub(tmp_path, monkeypatch):
+    """Test that the offline job writes portfolio and per-account insights"""
+    monkeypatch.delenv("ETSM_USAGE_SOURCE", raising=False)
+    monkeypatch.setenv("ETSM_MOCK_SEED", "7")
+    exit_code = precompute.main(["--stub", "--store", str(tmp_path)])
+
+    snapshot = InsightStore(str(tmp_path)).latest()
+    assert exit_code == 0
+    assert snapshot["portfolio"]["text"].startswith("Stub analysis")
+    assert "Acme Corp" in snapshot["accounts"]
+
+
+def test_precompute_matches_the_dashboard_context(tmp_path, monkeypatch):
+    """Test that a seeded mock run is not stale against the dashboard's data"""
+    monkeypatch.delenv("ETSM_USAGE_SOURCE", raising=False)
+    monkeypatch.setenv("ETSM_MOCK_SEED", "7")
+
+    precompute.main(["--stub", "--skip-accounts", "--store", str(tmp_path)])
+
+    snapshot = build_snapshot(usage_source_from_env())
+    context = build_portfolio_context(snapshot.account_metrics.join(snapshot.health))
+    stored = InsightStore(str(tmp_path)).latest()["portfolio"]
+    assert stored["prompt_hash"] == prompt_hash(PORTFOLIO_QUESTION, context)
+
+
+def test_precompute_requires_a_seed_for_mock_data(tmp_path, monkeypatch):
+    monkeypatch.delenv("ETSM_USAGE_SOURCE", raising=False)
+    monkeypatch.delenv("ETSM_MOCK_SEED", raising=False)
+
+    assert precompute.main(["--stub", "--store", str(tmp_path)]) == 1
+    assert InsightStore(str(tmp_path)).latest() is None
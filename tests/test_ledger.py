@@ -0,0 +1,112 @@
+import sys
+import os
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.batch import RateLimiter, run_batch
+from etsm.client import AnthropicClient, ClaudeResult
+from etsm.ledger import TokenBudget, UsageLedger, cost_usd
+
+DAY = 1_760_000_000  # 2025-10-09 UTC
+
+
+def result(input_tokens=1000, output_tokens=500, **kwargs):
+    usage = {"input_tokens": input_tokens, "output_tokens": output_tokens}
+    return ClaudeResult(
+        text="ok",
+        status=200,
+        usage=usage,
+        latency=2.0,
+        attempts=1,
+        model="claude-sonnet-4-20250514",
+        **kwargs,
+    )
+
+
+def test_cost_includes_prompt_cache_pricing():
+    """Test that cache writes cost 1.25x and reads 0.1x the input price"""
+    assert cost_usd("claude-sonnet-4-20250514", 1_000_000, 0) == pytest.approx(3.0)
+    assert cost_usd("claude-sonnet-4-20250514", 0, 1_000_000) == pytest.approx(15.0)
+    assert cost_usd(
+        "claude-sonnet-4-20250514", 0, 0, 1_000_000, 1_000_000
+    ) == pytest.approx(0.3 + 3.75)
+    assert cost_usd("unknown-model", 1000, 1000) == 0
+
+
+def test_record_and_views(tmp_path):
+    """Test per-session, per-day totals and that cache hits are not billed"""
+    ledger = UsageLedger(str(tmp_path / "ledger.sqlite"))
+
+    ledger.record(result(), session="a", now=DAY)
+    ledger.record(result(), session="b", now=DAY)
+    ledger.record(result(), session="a", now=DAY + 86400)
+    assert ledger.record(result(cached=True), session="a", now=DAY) == 0
+
+    assert ledger.totals(session="a", now=DAY)["calls"] == 1
+    assert ledger.totals(now=DAY)["cost"] == pytest.approx(2 * 0.0105)
+    assert ledger.tokens_used(now=DAY) == 3000
+    assert [row["day"] for row in ledger.daily()] == ["2025-10-10", "2025-10-09"]
+    assert ledger.daily()[0]["output_tokens_per_s"] == 250
+    assert {row["session"] for row in ledger.by_session(now=DAY)} == {"a", "b"}
+
+
+def test_budget_blocks_or_downgrades(tmp_path):
+    ledger = UsageLedger(str(tmp_path / "ledger.sqlite"))
+    ledger.record(result(), session="a", now=DAY)
+    model = "claude-sonnet-4-20250514"
+
+    assert TokenBudget(daily_tokens=2000).check(ledger, "a", model, now=DAY) == (
+        model,
+        None,
+    )
+    blocked, reason = TokenBudget(session_tokens=1500).check(
+        ledger, "a", model, now=DAY
+    )
+    assert blocked is None and "session token budget" in reason
+    assert TokenBudget(session_tokens=1500).check(ledger, "b", model, now=DAY)[0]
+    downgraded, _ = TokenBudget(daily_tokens=1500, action="downgrade").check(
+        ledger, "b", model, now=DAY
+    )
+    assert downgraded == "claude-3-5-haiku-20241022"
+
+
+def test_budget_from_env(monkeypatch):
+    monkeypatch.setenv("ETSM_DAILY_TOKEN_BUDGET", "5000")
+    monkeypatch.setenv("ETSM_BUDGET_ACTION", "downgrade")
+
+    budget = TokenBudget.from_env()
+
+    assert budget.daily_tokens == 5000
+    assert budget.session_tokens is None
+    assert budget.action == "downgrade"
+    with pytest.raises(ValueError):
+        TokenBudget(action="warn")
+
+
+class SlowSendClient(AnthropicClient):
+    """Client whose network call takes a little while and always succeeds"""
+
+    def _send(self, payload):
+        time.sleep(0.05)
+        return result()
+
+
+def test_session_hook_records_calls_finished_after_an_early_stop(tmp_path):
+    """Test that in-flight batch calls are charged even when the sweep stops"""
+    ledger = UsageLedger(str(tmp_path / "ledger.sqlite"))
+    shared = SlowSendClient(api_key="test-key")
+    client = shared.with_hooks(lambda r: ledger.record(r, "abc"))
+    prompts = {f"Account {i}": f"prompt {i}" for i in range(8)}
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=10**7)
+
+    for _ in run_batch(client, prompts, max_workers=4, limiter=limiter):
+        break
+    time.sleep(0.3)
+
+    assert shared.hooks == []
+    # Every call that was already in flight is billed; queued ones never run
+    assert 4 <= ledger.totals(session="abc")["calls"] < len(prompts)
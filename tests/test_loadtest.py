@@ -0,0 +1,86 @@
+import sys
+import os
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.client import AnthropicClient
+from etsm import loadtest
+from etsm.loadtest import MockAnthropicServer, latency_summary, shared_runtime
+
+PROMPT = "Analyze these accounts"
+
+
+def test_latency_summary_reports_percentiles_in_milliseconds():
+    """Test that rerun timings are summarized as millisecond percentiles"""
+    summary = latency_summary([i / 1000 for i in range(1, 101)])
+
+    assert summary["count"] == 100
+    assert summary["p50_ms"] == 50.5
+    assert 95 <= summary["p95_ms"] <= 96
+    assert 99 <= summary["p99_ms"] <= 100
+    assert summary["max_ms"] == 100
+    assert latency_summary([]) == {"count": 0}
+
+
+def test_mock_server_answers_with_configured_latency():
+    """Test that the mock endpoint serves messages and streams after a delay"""
+    with MockAnthropicServer(latency=0.2, jitter=0) as server:
+        client = AnthropicClient(api_key="test", base_url=server.url)
+        started = time.perf_counter()
+        result = client.create_message(PROMPT, max_tokens=64)
+        elapsed = time.perf_counter() - started
+        stream = client.stream_message(PROMPT, max_tokens=64)
+        streamed = "".join(stream)
+
+    assert elapsed >= 0.2
+    assert result.ok and "analysis" in result.text
+    assert streamed == result.text
+    assert stream.result.stop_reason == "end_turn"
+    assert server.requests == 2
+
+
+def test_mock_server_injects_retryable_errors():
+    """Test that injected 529 errors are retried by the client"""
+    with MockAnthropicServer(latency=0, error_rate=0.5, seed=2) as server:
+        client = AnthropicClient(
+            api_key="test", base_url=server.url, max_retries=10, backoff_base=0
+        )
+        results = [client.create_message(PROMPT, max_tokens=64) for _ in range(5)]
+
+    assert all(result.ok for result in results)
+    assert server.errors > 0
+    assert server.requests == 5 + server.errors
+
+
+def test_shared_runtime_explains_missing_streamlit_internals(monkeypatch):
+    """Test that a changed Streamlit runtime fails with a clear message"""
+    from streamlit.runtime import Runtime
+
+    monkeypatch.delattr(Runtime, "_instance")
+
+    with pytest.raises(RuntimeError, match="not supported with Streamlit"):
+        with shared_runtime():
+            pass
+
+
+def test_peak_rss_units_follow_the_platform(monkeypatch):
+    """Test that macOS ru_maxrss (bytes) is not scaled like Linux kilobytes"""
+    import resource
+
+    def no_proc(*args):
+        raise OSError("no /proc")
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    monkeypatch.setattr(loadtest, "open", no_proc, raising=False)
+
+    monkeypatch.setattr(loadtest.sys, "platform", "darwin")
+    darwin = loadtest.rss_bytes()
+    monkeypatch.setattr(loadtest.sys, "platform", "linux")
+    linux = loadtest.rss_bytes()
+
+    assert darwin >= usage.ru_maxrss
+    assert linux == pytest.approx(darwin * 1024, rel=0.01)
@@ -0,0 +1,148 @@
+import sys
+import os
+
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_api_usage_data, generate_synthetic_usage
+from etsm.metrics import classify_health, compute_account_metrics, kpi_deltas
+from etsm.prompts import build_portfolio_context, estimate_tokens
+from etsm.rollups import RollupStore
+
+
+def test_metrics_match_per_company_computation():
+    """Test that the single pass agrees with the old per-group lambdas"""
+    usage_df = generate_api_usage_data(seed=5)
+
+    metrics = compute_account_metrics(usage_df)
+
+    expected_growth = usage_df.groupby("Company")["API_Calls"].apply(
+        lambda x: (x.iloc[-1] - x.iloc[0]) / x.iloc[0]
+    )
+    pd.testing.assert_series_equal(
+        metrics["growth"], expected_growth, check_names=False
+    )
+    grouped = usage_df.groupby("Company")
+    assert (metrics["last_calls"] == grouped["API_Calls"].last()).all()
+    assert (metrics["total_calls"] == grouped["API_Calls"].sum()).all()
+    assert metrics["total_revenue"].sum() == pytest.approx(usage_df["Revenue"].sum())
+    assert (metrics["use_cases"] == grouped["Use_Cases"].max()).all()
+
+
+def test_metrics_with_projected_columns():
+    """Test that metrics for unloaded columns are skipped"""
+    usage_df = generate_api_usage_data(seed=5)[["Company", "Month", "API_Calls"]]
+
+    metrics = compute_account_metrics(usage_df)
+
+    assert "total_revenue" not in metrics.columns
+    assert "growth" in metrics.columns
+
+
+def test_metrics_on_categorical_companies():
+    usage_df = generate_synthetic_usage(n_companies=50, seed=2)
+    subset = usage_df[usage_df["Company"].isin(["Acme Corp", "Zenith PLC"])]
+
+    metrics = compute_account_metrics(subset)
+
+    assert sorted(metrics.index) == ["Acme Corp", "Zenith PLC"]
+
+
+def test_portfolio_context_lists_every_company():
+    metrics = compute_account_metrics(generate_api_usage_data(seed=5))
+
+    context = build_portfolio_context(metrics)
+
+    for company in metrics.index:
+        assert company in context
+
+
+def test_portfolio_context_fits_the_token_budget():
+    """Test that large portfolios list the extremes and summarize the rest"""
+    metrics = compute_account_metrics(generate_synthetic_usage(2000, seed=3))
+
+    context = build_portfolio_context(metrics, max_tokens=600)
+
+    assert estimate_tokens(context) <= 600
+    assert "Remaining " in context
+    assert metrics["growth"].idxmin() in context
+    assert metrics["growth"].idxmax() in context
+    assert metrics["total_revenue"].idxmax() in context
+    assert f"{len(metrics):,} accounts" in context
+
+
+def test_portfolio_context_rows_are_compact():
+    """Test that small portfolios are listed in full as short CSV rows"""
+    metrics = compute_account_metrics(generate_api_usage_data(seed=5))
+
+    context = build_portfolio_context(metrics)
+    row = next(line for line in context.splitlines() if line.startswith("Zenith"))
+
+    assert row.count(",") == 4
+    assert "Remaining" not in context
+
+
+def test_health_matches_the_original_thresholds():
+    """Test that labels follow the >10% / <-5% growth thresholds"""
+    metrics = pd.DataFrame(
+        {"last_calls": [1, 2, 3, 4], "growth": [0.2, 0.1, -0.05, -0.2]},
+        index=["A", "B", "C", "D"],
+    )
+
+    health = classify_health(metrics)["health"]
+
+    assert list(health) == [
+        "✅ Healthy Growth",
+        "🔄 Stable Usage",
+        "🔄 Stable Usage",
+        "⚠️ Declining Usage",
+    ]
+
+
+def test_kpi_deltas_compare_recent_periods():
+    """Test that KPI deltas come from the latest months of the rollups"""
+    usage_df = generate_api_usage_data(seed=2)
+    totals = usage_df.groupby("Month")["API_Calls"].sum().sort_index()
+
+    deltas = kpi_deltas(RollupStore.from_frame(usage_df).monthly())
+
+    assert deltas["calls_1m"] == pytest.approx(totals.iloc[-1] / totals.iloc[-2] - 1)
+    assert deltas["calls_3m"] == pytest.approx(
+        totals.iloc[-3:].sum() / totals.iloc[-6:-3].sum() - 1
+    )
+    active = usage_df.groupby("Month")["API_Calls"].apply(lambda c: (c > 0).sum())
+    assert deltas["active_1m"] == active.iloc[-1] - active.iloc[-2]
+
+
+def test_growth_delta_is_the_change_in_average_growth():
+    """Test that growth_1m compares mean account growth with and without the
+    latest month"""
+    usage_df = generate_api_usage_data(seed=2)
+    latest = usage_df["Month"].max()
+    before = usage_df[usage_df["Month"] < latest]
+
+    deltas = kpi_deltas(RollupStore.from_frame(usage_df).monthly())
+
+    expected = (
+        compute_account_metrics(usage_df)["growth"].mean()
+        - compute_account_metrics(before)["growth"].mean()
+    )
+    assert deltas["growth_1m"] == pytest.approx(expected)
+
+
+def test_growth_delta_is_none_when_growth_is_undefined():
+    """Test that an account starting at zero calls yields no growth delta"""
+    usage_df = pd.DataFrame(
+        {
+            "Company": ["Acme Corp"] * 3,
+            "Month": ["2024-01", "2024-02", "2024-03"],
+            "API_Calls": [0, 10, 20],
+        }
+    )
+
+    deltas = kpi_deltas(RollupStore.from_frame(usage_df).monthly())
+
+    assert deltas["growth_1m"] is None
@@ -0,0 +1,119 @@
+import sys
+import os
+
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_api_usage_data, generate_synthetic_usage
+from etsm.rollups import RollupStore, RollupTracker
+
+
+@pytest.fixture
+def usage_df():
+    return generate_api_usage_data(seed=9)
+
+
+def test_totals_match_full_scan(usage_df):
+    store = RollupStore.from_frame(usage_df)
+
+    assert store.totals["api_calls"] == usage_df["API_Calls"].sum()
+    assert store.totals["revenue"] == pytest.approx(usage_df["Revenue"].sum())
+    assert store.totals["companies"] == 5
+    assert store.totals["rows"] == 60
+
+
+def test_monthly_and_quarterly_buckets(usage_df):
+    store = RollupStore.from_frame(usage_df)
+
+    monthly = store.monthly()
+    quarterly = store.quarterly()
+
+    assert len(monthly) == 60
+    assert len(quarterly) == 20
+    acme = usage_df[usage_df["Company"] == "Acme Corp"]
+    assert (
+        quarterly.loc[("Acme Corp", "2024Q2"), "API_Calls"]
+        == acme["API_Calls"].iloc[3:6].sum()
+    )
+
+
+def test_incremental_append_matches_full_build(usage_df):
+    """Test that appending month by month equals building from everything"""
+    full = RollupStore.from_frame(usage_df)
+    incremental = RollupStore()
+    for _, month_rows in usage_df.groupby("Month"):
+        incremental.append(month_rows)
+
+    pd.testing.assert_frame_equal(incremental.monthly(), full.monthly())
+    pd.testing.assert_frame_equal(incremental.quarterly(), full.quarterly())
+    pd.testing.assert_frame_equal(incremental.by_company(), full.by_company())
+    assert incremental.totals == pytest.approx(full.totals)
+
+
+def test_append_updates_existing_bucket(usage_df):
+    """Test that late rows for a known month are added to its bucket"""
+    store = RollupStore.from_frame(usage_df)
+    before = store.monthly().loc[("Acme Corp", "2024-03"), "API_Calls"]
+
+    store.append(
+        pd.DataFrame(
+            {
+                "Company": ["Acme Corp"],
+                "Month": ["2024-03"],
+                "API_Calls": [1000],
+                "Revenue": [1.0],
+                "Use_Cases": [9],
+            }
+        )
+    )
+
+    bucket = store.monthly().loc[("Acme Corp", "2024-03")]
+    assert bucket["API_Calls"] == before + 1000
+    assert bucket["Use_Cases"] == 9
+    assert bucket["Rows"] == 2
+    assert store.by_company().loc["Acme Corp", "Months"] == 12
+
+
+def test_daily_rows_roll_up_by_month():
+    usage_df = generate_synthetic_usage(
+        n_companies=2, granularity="daily", start="2024-01-01", end="2024-02-29"
+    )
+
+    store = RollupStore.from_frame(usage_df)
+
+    assert len(store.monthly()) == 4
+    assert store.monthly()["Rows"].tolist() == [31, 29, 31, 29]
+
+
+def test_tracker_appends_only_new_months(usage_df):
+    """Test that a new version adding a month only rolls up that month"""
+    history = usage_df[usage_df["Month"] < "2024-12"]
+    tracker = RollupTracker()
+    first, _ = tracker.refresh(history)
+    before = first.monthly().copy()
+
+    second, appended = tracker.refresh(usage_df)
+
+    assert appended == 5
+    assert second is not first
+    pd.testing.assert_frame_equal(first.monthly(), before)
+    full = RollupStore.from_frame(usage_df)
+    pd.testing.assert_frame_equal(second.monthly(), full.monthly())
+    pd.testing.assert_frame_equal(second.by_company(), full.by_company())
+    assert tracker.refresh(usage_df) == (second, 0)
+
+
+def test_tracker_rebuilds_when_history_changes(usage_df):
+    """Test that edits to already rolled-up months force a full rebuild"""
+    tracker = RollupTracker()
+    tracker.refresh(usage_df)
+    revised = usage_df.copy()
+    revised.loc[0, "API_Calls"] += 1
+
+    store, appended = tracker.refresh(revised)
+
+    assert appended is None
+    assert store.totals["api_calls"] == revised["API_Calls"].sum()
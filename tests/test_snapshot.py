@@ -0,0 +1,137 @@
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.metrics import compute_account_metrics
+from etsm.snapshot import SnapshotRefresher, build_snapshot
+from etsm.sources import mock_usage_source
+
+
+class VersionedSource:
+    """Seeded mock usage whose version is bumped by the test"""
+
+    def __init__(self):
+        self.revision = 0
+        self.inner = mock_usage_source(seed=3)
+
+    def load(self, columns=None):
+        return self.inner.load(columns=columns)
+
+    def version(self):
+        return f"test:{self.revision}"
+
+
+def test_snapshot_holds_every_precomputed_aggregate():
+    """Test that a snapshot bundles usage, metrics, rollups, health and forecasts"""
+    source = mock_usage_source(seed=1)
+
+    snapshot = build_snapshot(source)
+
+    usage_df = source.load()
+    assert snapshot.version == source.version()
+    assert snapshot.account_metrics.equals(compute_account_metrics(usage_df))
+    assert snapshot.rollups.totals["api_calls"] == usage_df["API_Calls"].sum()
+    assert sorted(snapshot.health.index) == sorted(usage_df["Company"].unique())
+    assert snapshot.forecast["API_Calls"]["point"].shape == (5, 6)
+    assert set(snapshot.kpi_deltas) >= {"calls_3m", "active_1m"}
+    with pytest.raises(Exception):
+        snapshot.version = "changed"
+    with pytest.raises(TypeError):
+        snapshot.forecast["API_Calls"] = None
+
+
+def test_on_demand_refresh_rebuilds_only_on_new_versions():
+    """Test that unchanged sources are not rebuilt and reloads swap the data"""
+    source = VersionedSource()
+    refresher = SnapshotRefresher(lambda: source, interval=0).start()
+
+    first = refresher.snapshot()
+
+    assert refresher.snapshot() is first
+    assert not refresher.refresh()
+    source.revision += 1
+    assert refresher.refresh()
+    assert refresher.snapshot().version == "test:1"
+    refresher.reload()
+    assert refresher.snapshot() is not first
+
+
+def test_failed_refresh_keeps_the_published_snapshot():
+    """Test that a broken build is reported without unpublishing data"""
+    source = VersionedSource()
+    builds = []
+
+    def build(source, forecasters, rollups):
+        builds.append(source.version())
+        if len(builds) > 1:
+            raise OSError("source unavailable")
+        return build_snapshot(source, forecasters, rollups=rollups)
+
+    refresher = SnapshotRefresher(lambda: source, interval=0, build=build)
+    first = refresher.snapshot()
+    source.revision += 1
+
+    assert not refresher.refresh()
+    assert refresher.snapshot() is first
+    assert isinstance(refresher.error, OSError)
+
+
+def test_first_build_failure_is_raised():
+    """Test that pages get an error when no snapshot was ever built"""
+
+    def build(source, forecasters, rollups):
+        raise OSError("source unavailable")
+
+    refresher = SnapshotRefresher(VersionedSource, interval=0, build=build)
+
+    with pytest.raises(RuntimeError):
+        refresher.snapshot()
+
+
+def test_background_refresh_does_not_block_readers():
+    """Test that readers keep the old snapshot while a slow build runs"""
+    source = VersionedSource()
+    release = threading.Event()
+
+    def build(source, forecasters, rollups):
+        if source.revision:
+            release.wait(5)
+        return build_snapshot(source, forecasters, rollups=rollups)
+
+    refresher = SnapshotRefresher(lambda: source, interval=0.01, build=build)
+    refresher.start()
+    try:
+        first = refresher.snapshot(timeout=5)
+        source.revision += 1
+        deadline = time.time() + 5
+        while not refresher.refreshing and time.time() < deadline:
+            time.sleep(0.005)
+
+        started = time.perf_counter()
+        assert refresher.snapshot() is first
+        assert time.perf_counter() - started < 0.1
+
+        release.set()
+        while refresher.snapshot() is first and time.time() < deadline:
+            time.sleep(0.005)
+        assert refresher.snapshot().version == "test:1"
+    finally:
+        release.set()
+        refresher.stop(timeout=5)
+
+
+def test_forecast_method_is_read_from_the_environment(monkeypatch):
+    """Test that ETSM_FORECAST_METHOD selects the snapshot forecasters"""
+    monkeypatch.setenv("ETSM_FORECAST_METHOD", "linear")
+    monkeypatch.setenv("ETSM_REFRESH_SECONDS", "0")
+
+    refresher = SnapshotRefresher.from_env(VersionedSource)
+
+    assert {f.method for f in refresher._forecasters.values()} == {"linear"}
+    assert refresher.snapshot().forecast["API_Calls"]["point"].shape == (5, 6)
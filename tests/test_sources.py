@@ -0,0 +1,129 @@
+import sys
+import os
+
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_api_usage_data
+from etsm.sources import (
+    ArrowSource,
+    CsvSource,
+    ParquetSource,
+    mock_strategy_source,
+    mock_usage_source,
+    open_source,
+    sort_usage,
+    strategy_source_from_env,
+)
+from etsm.metrics import compute_account_metrics
+
+
+@pytest.fixture
+def usage_df():
+    return generate_api_usage_data(seed=3)
+
+
+@pytest.fixture(params=["parquet", "arrow", "csv"])
+def file_source(request, tmp_path, usage_df):
+    """The same usage data written in each supported file format"""
+    if request.param == "csv":
+        path = tmp_path / "usage.csv"
+        usage_df.to_csv(path, index=False)
+        return CsvSource(str(path), chunksize=7)
+    pytest.importorskip("pyarrow")
+    if request.param == "parquet":
+        path = tmp_path / "usage.parquet"
+        usage_df.to_parquet(path, index=False)
+        return ParquetSource(str(path))
+    path = tmp_path / "usage.arrow"
+    usage_df.to_feather(path)
+    return ArrowSource(str(path))
+
+
+def test_full_load_round_trips(file_source, usage_df):
+    df = file_source.load()
+
+    pd.testing.assert_frame_equal(
+        df.astype({"Company": str, "Month": str}), usage_df, check_dtype=False
+    )
+
+
+def test_projection_and_predicates(file_source, usage_df):
+    """Test that only the requested columns and matching rows come back"""
+    df = file_source.load(
+        columns=["API_Calls"],
+        companies=["Acme Corp", "Zenith PLC"],
+        months=["2024-01", "2024-02"],
+    )
+
+    expected = usage_df[
+        usage_df["Company"].isin(["Acme Corp", "Zenith PLC"])
+        & usage_df["Month"].isin(["2024-01", "2024-02"])
+    ]
+    assert list(df.columns) == ["API_Calls"]
+    assert sorted(df["API_Calls"]) == sorted(expected["API_Calls"])
+
+
+def test_unordered_exports_are_sorted_before_first_last_metrics(tmp_path, usage_df):
+    """Test that shuffled rows give the same growth once sorted"""
+    path = tmp_path / "usage.csv"
+    usage_df.sample(frac=1, random_state=0).to_csv(path, index=False)
+
+    shuffled = CsvSource(str(path)).load()
+    ordered = sort_usage(shuffled)
+
+    assert sort_usage(usage_df) is usage_df
+    assert list(ordered["Company"].unique()) == list(shuffled["Company"].unique())
+    pd.testing.assert_series_equal(
+        compute_account_metrics(ordered)["growth"].sort_index(),
+        compute_account_metrics(usage_df)["growth"].sort_index(),
+    )
+
+
+def test_file_version_changes_when_file_changes(tmp_path, usage_df):
+    path = tmp_path / "usage.csv"
+    usage_df.to_csv(path, index=False)
+    source = CsvSource(str(path))
+    before = source.version()
+
+    usage_df.head(5).to_csv(path, index=False)
+
+    assert source.version() != before
+
+
+def test_seeded_mock_source_is_stable():
+    source = mock_usage_source(seed=11)
+
+    pd.testing.assert_frame_equal(source.load(), source.load())
+    assert source.version() == mock_usage_source(seed=11).version()
+
+
+def test_mock_source_with_synthetic_options():
+    source = mock_usage_source(seed=1, n_companies=50)
+
+    df = source.load(companies=["Acme Corp"])
+
+    assert len(df) == 12
+    assert (df["Company"] == "Acme Corp").all()
+
+
+def test_open_source_by_extension(tmp_path):
+    assert open_source(None) is None
+    assert open_source("mock") is None
+    assert isinstance(open_source("usage.parquet"), ParquetSource)
+    assert isinstance(open_source("usage.feather"), ArrowSource)
+    assert isinstance(open_source("usage.csv.gz"), CsvSource)
+    assert isinstance(open_source(str(tmp_path)), ParquetSource)
+    with pytest.raises(ValueError):
+        open_source("usage.xlsx")
+
+
+def test_mock_strategy_source_size_from_env(monkeypatch):
+    monkeypatch.delenv("ETSM_STRATEGY_SOURCE", raising=False)
+    monkeypatch.setenv("ETSM_MOCK_STRATEGIES", "300")
+
+    assert len(strategy_source_from_env().load()) == 300
+    assert len(mock_strategy_source().load()) == 5
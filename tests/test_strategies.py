@@ -0,0 +1,111 @@
+import sys
+import os
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.data import generate_strategy_data, generate_synthetic_strategies
+from etsm.sources import mock_strategy_source
+from etsm.strategies import StrategyStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StrategyStore(str(tmp_path / "strategies.sqlite"))
+    store.insert_frame(generate_strategy_data())
+    return store
+
+
+def test_seeds_once_from_the_source(tmp_path, monkeypatch):
+    """Test that an empty store is seeded and later opens keep its rows"""
+    monkeypatch.setenv("ETSM_STRATEGY_DB", str(tmp_path / "strategies.sqlite"))
+    store = StrategyStore.from_env(seed_source=mock_strategy_source())
+    store.create(Account="New Co", Strategy="Pilot", Status="Planning", Priority="Low")
+
+    reopened = StrategyStore.from_env(seed_source=mock_strategy_source())
+
+    assert reopened.count() == 6
+    assert reopened.count(search="new co") == 1
+
+
+def test_create_and_update_survive_reopening(store):
+    """Test that edits are persisted and bump the version"""
+    version = store.version()
+    strategy_id = store.create(
+        Account="Acme Corp",
+        Strategy="Agents Rollout",
+        Status="Planning",
+        Priority="High",
+        Expected_Revenue=70000,
+    )
+
+    assert store.update(strategy_id, Status="In Progress", Expected_Revenue=90000)
+    assert not store.update(9999, Status="Completed")
+    assert store.version() != version
+
+    record = StrategyStore(store.path).get(strategy_id)
+    assert record["Status"] == "In Progress"
+    assert record["Expected_Revenue"] == 90000
+    assert record["Timeline"] == ""
+
+
+def test_invalid_fields_are_rejected(store):
+    """Test that unknown fields, filters and sort columns raise ValueError"""
+    with pytest.raises(ValueError):
+        store.create(Account="A", Strategy="B", Status="Planning")
+    with pytest.raises(ValueError):
+        store.update(1, Budget=5)
+    with pytest.raises(ValueError):
+        store.query(filters={"Description": ["x"]})
+    with pytest.raises(ValueError):
+        store.query(sort_by="Expected_Revenue; DROP TABLE strategies")
+
+
+def test_query_filters_sorts_and_pages(tmp_path):
+    """Test that SQL paging matches filtering and sorting the frame"""
+    df = generate_synthetic_strategies(2000, seed=4)
+    store = StrategyStore(str(tmp_path / "strategies.sqlite"))
+    store.insert_frame(df)
+    filters = {"Status": ["In Progress", "Planning"], "Priority": ["High"]}
+    expected = df[
+        df["Status"].isin(filters["Status"]) & df["Priority"].isin(filters["Priority"])
+    ]
+    expected = expected[
+        expected["Account"].astype(str).str.contains("company 01", case=False)
+    ]
+
+    pages = [
+        store.query(filters, "company 01", page=page, page_size=7)
+        for page in range(1, len(expected) // 7 + 2)
+    ]
+
+    rows = [row for page in pages for row in page["Expected_Revenue"]]
+    assert rows == sorted(expected["Expected_Revenue"], reverse=True)
+    assert store.count(filters, "company 01") == len(expected)
+    assert all(len(page) <= 7 for page in pages)
+
+
+def test_search_treats_wildcards_literally(store):
+    """Test that % and _ in the search text are not LIKE wildcards"""
+    assert store.count(search="%") == 0
+    assert store.count(search="_") == 0
+    assert store.count(search="corp") == 1
+
+
+def test_totals_match_the_frame(tmp_path):
+    """Test that aggregate totals equal pandas group sums"""
+    df = generate_synthetic_strategies(3000, seed=8)
+    store = StrategyStore(str(tmp_path / "strategies.sqlite"))
+    store.insert_frame(df)
+
+    totals = store.totals({"Timeline": ["Q1 2024", "Q2 2025"]})
+
+    subset = df[df["Timeline"].isin(["Q1 2024", "Q2 2025"])]
+    assert totals["count"] == len(subset)
+    assert totals["revenue"] == subset["Expected_Revenue"].sum()
+    by_status = subset.groupby("Status", observed=True)["Expected_Revenue"].sum()
+    for status, revenue in by_status.items():
+        assert totals["Status"][status]["revenue"] == revenue
+    assert store.distinct("Priority") == sorted(df["Priority"].unique())
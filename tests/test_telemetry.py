@@ -0,0 +1,63 @@
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from etsm.client import ClaudeResult
+from etsm.telemetry import Telemetry, record_result
+
+
+def test_timer_and_summary():
+    """Test that timed blocks land in one histogram per label set"""
+    telemetry = Telemetry()
+
+    for _ in range(3):
+        with telemetry.timer("etsm_stage_seconds", stage="load.usage"):
+            pass
+    telemetry.observe("etsm_stage_seconds", 2.0, stage="aggregate.rollups")
+
+    rows = {row["labels"]: row for row in telemetry.summary()}
+    assert rows["stage=load.usage"]["count"] == 3
+    assert rows["stage=aggregate.rollups"]["p50_ms"] == 2000
+
+
+def test_prometheus_export(tmp_path):
+    """Test the histogram bucket, sum and count lines and counters"""
+    telemetry = Telemetry(buckets=(0.1, 1))
+    telemetry.observe("latency_seconds", 0.05, page='Say "hi"')
+    telemetry.observe("latency_seconds", 0.5, page='Say "hi"')
+    telemetry.observe("latency_seconds", 5, page='Say "hi"')
+    telemetry.increment("requests_total", status=200)
+
+    path = tmp_path / "etsm.prom"
+    telemetry.write_prometheus(str(path))
+    lines = path.read_text().splitlines()
+
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{page="Say \\"hi\\"",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{page="Say \\"hi\\"",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{page="Say \\"hi\\"",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{page="Say \\"hi\\""} 3' in lines
+    assert 'requests_total{status="200"} 1' in lines
+
+
+def test_record_result_counts_status_retries_and_tokens():
+    telemetry = Telemetry()
+    result = ClaudeResult(
+        text="ok",
+        status=200,
+        usage={"input_tokens": 10, "output_tokens": 4},
+        latency=1.5,
+        attempts=3,
+    )
+
+    record_result(result, telemetry)
+    record_result(ClaudeResult(status=200, cached=True), telemetry)
+
+    counters = {(c["metric"], c["labels"]): c["value"] for c in telemetry.counters()}
+    assert counters[("anthropic_requests_total", "cached=false, status=200")] == 1
+    assert counters[("anthropic_requests_total", "cached=true, status=200")] == 1
+    assert counters[("anthropic_retries_total", "")] == 2
+    assert counters[("anthropic_tokens_total", "kind=input")] == 10
+    assert [row["count"] for row in telemetry.summary()] == [1]